@@ -0,0 +1,222 @@
+# repo_root/scripts/bench_answer_checker.py
+"""Accuracy + throughput benchmark for the heuristic answer checker.
+
+Builds a labeled corpus from dataset answers with generated perturbations and
+runs `is_answer_correct` over it. Reports verifications/sec, per-call latency
+percentiles and, per perturbation type, confusion counts with precision and
+recall ("correct" is the positive class). Results go to a JSON file so runs can
+be diffed; `--baseline` prints the deltas against an earlier file.
+
+    PYTHONPATH="$PWD/src" python scripts/bench_answer_checker.py --csv assets/JEOPARDY_CSV.csv --out checker.json
+    PYTHONPATH="$PWD/src" python scripts/bench_answer_checker.py --synthetic 20000 --out checker.json
+
+Perturbation types and their expected verdict:
+
+    exact       the answer itself                          correct
+    typo        one character swapped/dropped/replaced     correct
+    plural      "s"/"es" added or removed                  correct
+    lead_in     "what is ..." / "who is ..." prefix        correct
+    diacritics  vowels replaced by accented forms          correct
+    reorder     multi-word answer with words reversed      correct
+    wrong       another clue's answer                      incorrect
+    fragment    a short prefix of the answer               incorrect
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+
+from jeopardy_game.services.answer_checker import _normalize, is_answer_correct
+
+_ACCENTS = {"a": "á", "e": "é", "i": "í", "o": "ö", "u": "ü", "n": "ñ", "c": "ç"}
+_LEAD_INS = ("What is ", "Who is ", "what are ", "who are ", "The answer is ")
+
+
+def _typo(answer: str, rng: random.Random) -> str | None:
+    positions = [i for i, ch in enumerate(answer) if ch.isalpha()]
+    if len(positions) < 5:
+        return None
+    i = rng.choice(positions[1:-1])
+    op = rng.randrange(3)
+    if op == 0:  # swap with next letter
+        return answer[:i] + answer[i + 1] + answer[i] + answer[i + 2 :]
+    if op == 1:  # drop
+        return answer[:i] + answer[i + 1 :]
+    return answer[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + answer[i + 1 :]
+
+
+def _plural(answer: str, rng: random.Random) -> str | None:
+    if not answer[-1:].isalpha():
+        return None
+    if answer.endswith("es"):
+        return answer[:-2]
+    if answer.endswith("s"):
+        return answer[:-1]
+    return answer + ("es" if answer[-1] in "sxz" else "s")
+
+
+def _lead_in(answer: str, rng: random.Random) -> str | None:
+    return rng.choice(_LEAD_INS) + answer
+
+
+def _diacritics(answer: str, rng: random.Random) -> str | None:
+    out = "".join(_ACCENTS.get(ch, ch) if rng.random() < 0.5 else ch for ch in answer)
+    return out if out != answer else None
+
+
+def _reorder(answer: str, rng: random.Random) -> str | None:
+    words = answer.split()
+    if len(words) < 2:
+        return None
+    return " ".join(reversed(words))
+
+
+def _fragment(answer: str, rng: random.Random) -> str | None:
+    norm = _normalize(answer)
+    if len(norm) < 8:
+        return None
+    return norm[: rng.randint(2, 3)]
+
+
+PERTURBATIONS: dict[str, tuple[Callable[[str, random.Random], str | None], bool]] = {
+    "exact": (lambda a, rng: a, True),
+    "typo": (_typo, True),
+    "plural": (_plural, True),
+    "lead_in": (_lead_in, True),
+    "diacritics": (_diacritics, True),
+    "reorder": (_reorder, True),
+    "fragment": (_fragment, False),
+}
+
+
+def build_corpus(answers: list[str], *, seed: int) -> list[tuple[str, str, str, bool]]:
+    """Return (kind, user_answer, correct_answer, expected) tuples."""
+    rng = random.Random(seed)
+    corpus = []
+    for answer in answers:
+        for kind, (perturb, expected) in PERTURBATIONS.items():
+            user = perturb(answer, rng)
+            if user:
+                corpus.append((kind, user, answer, expected))
+        other = rng.choice(answers)
+        if _normalize(other) != _normalize(answer):
+            corpus.append(("wrong", other, answer, False))
+    rng.shuffle(corpus)
+    return corpus
+
+
+def _load_answers(args: argparse.Namespace) -> list[str]:
+    if args.csv:
+        with open(args.csv, encoding="utf-8-sig", newline="") as fh:
+            reader = csv.DictReader(fh)
+            key = next(k for k in reader.fieldnames or [] if k.strip() == "Answer")
+            answers = [row[key].strip() for row in reader if row[key] and row[key].strip()]
+    else:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from generate_synthetic_dataset import generate_rows
+
+        answers = [row[6] for row in generate_rows(args.synthetic, seed=args.seed)]
+    rng = random.Random(args.seed)
+    unique = sorted(set(answers))
+    return rng.sample(unique, min(args.sample, len(unique)))
+
+
+def _ratio(num: int, den: int) -> float | None:
+    return round(num / den, 4) if den else None
+
+
+def _fmt(value: float | None) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="Dataset CSV to take answers from")
+    source.add_argument("--synthetic", type=int, help="Use N synthetic rows instead of a CSV")
+    parser.add_argument("--sample", type=int, default=5000, help="Distinct answers to perturb")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="Write results JSON here")
+    parser.add_argument("--baseline", help="Previous results JSON to diff against")
+    args = parser.parse_args()
+
+    corpus = build_corpus(_load_answers(args), seed=args.seed)
+
+    # Throughput: tight loop without per-call timing overhead
+    start = time.perf_counter()
+    for _, user, correct, _ in corpus:
+        is_answer_correct(user, correct)
+    throughput = len(corpus) / (time.perf_counter() - start)
+
+    # Latency and accuracy
+    latencies_us: list[float] = []
+    counts: dict[str, dict[str, int]] = defaultdict(lambda: {"tp": 0, "fp": 0, "fn": 0, "tn": 0})
+    for kind, user, correct, expected in corpus:
+        t0 = time.perf_counter_ns()
+        predicted, _ = is_answer_correct(user, correct)
+        latencies_us.append((time.perf_counter_ns() - t0) / 1000)
+        key = ("tp" if expected else "fp") if predicted else ("fn" if expected else "tn")
+        counts[kind][key] += 1
+        counts["all"][key] += 1
+
+    cuts = statistics.quantiles(latencies_us, n=100)
+    per_type = {}
+    for kind, c in sorted(counts.items()):
+        per_type[kind] = {
+            **c,
+            "n": sum(c.values()),
+            "precision": _ratio(c["tp"], c["tp"] + c["fp"]),
+            "recall": _ratio(c["tp"], c["tp"] + c["fn"]),
+            "false_positive_rate": _ratio(c["fp"], c["fp"] + c["tn"]),
+        }
+
+    results = {
+        "python": platform.python_version(),
+        "source": args.csv or f"synthetic:{args.synthetic}",
+        "seed": args.seed,
+        "examples": len(corpus),
+        "verifications_per_s": round(throughput, 1),
+        "latency_us": {
+            "p50": round(cuts[49], 2),
+            "p90": round(cuts[89], 2),
+            "p99": round(cuts[98], 2),
+            "max": round(max(latencies_us), 2),
+        },
+        "per_type": per_type,
+    }
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, sort_keys=True)
+
+    print(f"{len(corpus)} examples, {throughput:,.0f} verifications/s, latency us {results['latency_us']}")
+    print(f"{'type':<12} {'n':>7} {'precision':>10} {'recall':>8} {'fpr':>8}")
+    for kind, r in per_type.items():
+        print(
+            f"{kind:<12} {r['n']:>7} {_fmt(r['precision']):>10} {_fmt(r['recall']):>8} "
+            f"{_fmt(r['false_positive_rate']):>8}"
+        )
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            base = json.load(fh)
+        print("\nvs baseline:")
+        print(f"  verifications/s {base['verifications_per_s']:,.0f} -> {throughput:,.0f}")
+        for kind, r in per_type.items():
+            old = base["per_type"].get(kind)
+            if not old:
+                continue
+            for metric in ("precision", "recall", "false_positive_rate"):
+                if old[metric] != r[metric]:
+                    print(f"  {kind}.{metric}: {old[metric]} -> {r[metric]}")
+
+
+if __name__ == "__main__":
+    main()
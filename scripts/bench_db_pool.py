@@ -0,0 +1,175 @@
+# repo_root/scripts/bench_db_pool.py
+"""Compare connection pool configurations under concurrent load.
+
+Each configuration builds its own engine with `build_engine`, starting from
+the `JEP_DB_*` settings plus the overrides given. Then `--threads` workers run
+the API's hot read queries for `--duration` seconds, one short session per
+request as the routes do. The script reports throughput, request latency
+percentiles and the pool's checkout-wait and in-use statistics.
+
+    PYTHONPATH="$PWD/src" python scripts/bench_db_pool.py --threads 32 --duration 10
+    PYTHONPATH="$PWD/src" python scripts/bench_db_pool.py \\
+        --config baseline: \\
+        --config always-ping:pre_ping=always \\
+        --config unprepared:prepare_threshold=none \\
+        --config small:size=4,max_overflow=0 --out pool.json
+
+Override keys are `PoolSettings` fields: size, max_overflow, timeout_s,
+recycle_s, pre_ping, ping_idle_s, prepare_threshold and pgbouncer.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from jeopardy_game.core.config import get_openai_model
+from jeopardy_game.db.pool import PoolSettings, pool_stats
+from jeopardy_game.db.queries import (
+    agent_play_question_stmt,
+    question_by_id_stmt,
+    random_question_stmt,
+)
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.models.question import Question
+
+_DEFAULT_CONFIGS = (
+    "baseline:",
+    "always-ping:pre_ping=always",
+    "unprepared:prepare_threshold=none",
+    "small-pool:size=2,max_overflow=0",
+)
+
+
+def _parse_config(spec: str, base: PoolSettings) -> tuple[str, PoolSettings]:
+    name, _, overrides = spec.partition(":")
+    types = {f.name: f.type for f in dataclasses.fields(PoolSettings)}
+    changes: dict[str, Any] = {}
+    for item in filter(None, overrides.split(",")):
+        key, _, raw = item.partition("=")
+        if key not in types:
+            raise SystemExit(f"Unknown pool setting {key!r} in {spec!r}; use one of {sorted(types)}")
+        if raw.lower() in ("none", "off"):
+            changes[key] = None
+        elif types[key] in ("int", "int | None"):
+            changes[key] = int(raw)
+        elif types[key] == "float":
+            changes[key] = float(raw)
+        elif types[key] == "bool":
+            changes[key] = raw.lower() in ("1", "true", "yes", "on")
+        else:
+            changes[key] = raw
+    return name or "baseline", dataclasses.replace(base, **changes)
+
+
+def _workload(url: str) -> tuple[list[tuple[str, int]], int, int]:
+    """Buckets to sample and the id range, read once up front."""
+    engine = build_engine(url)
+    try:
+        with engine.connect() as conn:
+            buckets = [tuple(r) for r in conn.execute(select(Question.round, Question.value).distinct())]
+            lo, hi = conn.execute(select(func.min(Question.id), func.max(Question.id))).one()
+    finally:
+        engine.dispose()
+    if not buckets:
+        raise SystemExit("No questions loaded; run scripts/load_dataset.py first.")
+    return buckets, lo, hi
+
+
+def _run(url: str, settings: PoolSettings, *, threads: int, duration_s: float, workload) -> dict[str, Any]:
+    buckets, lo, hi = workload
+    model = get_openai_model()
+    engine = build_engine(url, settings)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    stop = threading.Event()
+    latencies: list[list[float]] = [[] for _ in range(threads)]
+    errors = [0] * threads
+
+    def worker(i: int) -> None:
+        rng = random.Random(i)
+        while not stop.is_set():
+            round_name, value = rng.choice(buckets)
+            kind = rng.random()
+            if kind < 0.5:
+                stmt = question_by_id_stmt(rng.randint(lo, hi))
+            elif kind < 0.8:
+                stmt = random_question_stmt(round_name=round_name, value=value)
+            else:
+                stmt = agent_play_question_stmt(round_name=round_name, value=value, model=model)
+            started = time.perf_counter()
+            try:
+                with SessionLocal() as db:
+                    db.execute(stmt).first()
+            except Exception:
+                errors[i] += 1
+                continue
+            latencies[i].append(time.perf_counter() - started)
+
+    pool = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+    started = time.perf_counter()
+    for t in pool:
+        t.start()
+    time.sleep(duration_s)
+    stop.set()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    stats = pool_stats(engine.pool)
+    engine.dispose()
+
+    samples = sorted(x for per_thread in latencies for x in per_thread)
+    if len(samples) < 2:
+        raise SystemExit(f"Too few successful requests ({len(samples)}, {sum(errors)} errors); check DATABASE_URL.")
+    cuts = statistics.quantiles(samples, n=100)
+    return {
+        "settings": dataclasses.asdict(settings),
+        "requests": len(samples),
+        "errors": sum(errors),
+        "rps": round(len(samples) / elapsed, 1),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "pool": stats,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", action="append", help="name:key=value,... (repeatable)")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per configuration")
+    parser.add_argument("--out", default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    url = os.environ["DATABASE_URL"]
+    base = PoolSettings.from_config()
+    configs = [_parse_config(spec, base) for spec in args.config or _DEFAULT_CONFIGS]
+    workload = _workload(url)
+
+    results: dict[str, Any] = {"threads": args.threads, "duration_s": args.duration, "configs": {}}
+    for name, settings in configs:
+        r = _run(url, settings, threads=args.threads, duration_s=args.duration, workload=workload)
+        results["configs"][name] = r
+        pool = r["pool"]
+        print(
+            f"{name:<14} {r['rps']:>9,.0f} req/s  p50 {r['p50_ms']:7.3f} ms  p99 {r['p99_ms']:7.3f} ms  "
+            f"wait avg {pool.get('checkout_wait_ms_avg', 0):7.3f} ms max {pool.get('checkout_wait_ms_max', 0):8.3f} ms  "
+            f"peak in use {pool.get('peak_in_use', '-')}  errors {r['errors']}"
+        )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# repo_root/scripts/bench_query_plans.py
+"""Record query plans and timings for every query the API issues; flag regressions.
+
+Each statement comes from `jeopardy_game.db.queries`, so the benchmark explains
+exactly what the routes run. For every query it stores the plan shape (node
+types, relations, indexes), `EXPLAIN (ANALYZE, BUFFERS)` execution time and
+buffer counts, and client-side latency over repeated runs. With `--baseline`
+it compares against a previous run and exits non-zero when a plan shape
+changed or the median latency regressed beyond `--tolerance`.
+
+    PYTHONPATH="$PWD/src" python scripts/bench_query_plans.py --out plans.json
+    PYTHONPATH="$PWD/src" python scripts/bench_query_plans.py --baseline plans.json --out plans_new.json
+
+On SQLite `EXPLAIN QUERY PLAN` is recorded instead (no ANALYZE/BUFFERS).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, func, select
+from sqlalchemy.sql import Select
+
+from jeopardy_game.core.config import get_openai_model
+from jeopardy_game.db.queries import (
+    agent_play_question_stmt,
+    bucket_id_bounds_stmt,
+    bucket_question_from_id_stmt,
+    question_by_id_stmt,
+    random_question_stmt,
+    search_questions_stmt,
+)
+from jeopardy_game.models.question import Question
+from jeopardy_game.services.question_stats import difficulty_range
+
+
+def _sample_params(engine: Engine) -> dict[str, Any]:
+    """Pick the most populated (round, value) bucket and a mid-range id."""
+    with engine.connect() as conn:
+        round_name, value = conn.execute(
+            select(Question.round, Question.value)
+            .group_by(Question.round, Question.value)
+            .order_by(func.count().desc())
+            .limit(1)
+        ).one()
+        lo, hi = conn.execute(select(func.min(Question.id), func.max(Question.id))).one()
+    return {
+        "round_name": round_name,
+        "value": value,
+        "question_id": (lo + hi) // 2,
+        "dialect": engine.dialect.name,
+    }
+
+
+def _catalog(p: dict[str, Any]) -> dict[str, Callable[[], Select]]:
+    model = get_openai_model()
+    return {
+        "get_random_question": lambda: random_question_stmt(round_name=p["round_name"], value=p["value"]),
+        "get_random_question_by_difficulty": lambda: random_question_stmt(
+            round_name=p["round_name"], value=p["value"], accuracy_range=difficulty_range("hard")
+        ),
+        "random_question_seek_bounds": lambda: bucket_id_bounds_stmt(round_name=p["round_name"], value=p["value"]),
+        "random_question_seek_row": lambda: bucket_question_from_id_stmt(
+            p["question_id"], round_name=p["round_name"], value=p["value"]
+        ),
+        "search_questions": lambda: search_questions_stmt("river", dialect=p["dialect"], limit=20),
+        "verify_answer_lookup": lambda: question_by_id_stmt(p["question_id"]),
+        "agent_play_latest_filtered": lambda: agent_play_question_stmt(
+            round_name=p["round_name"], value=p["value"], model=model
+        ),
+        "agent_play_latest_round_only": lambda: agent_play_question_stmt(
+            round_name=p["round_name"], value=None, model=model
+        ),
+        "agent_play_latest_unfiltered": lambda: agent_play_question_stmt(round_name=None, value=None, model=model),
+    }
+
+
+def _pg_shape(node: dict[str, Any]) -> str:
+    label = node["Node Type"]
+    for key in ("Relation Name", "Index Name"):
+        if key in node:
+            label += f":{node[key]}"
+    children = ",".join(_pg_shape(c) for c in node.get("Plans", []))
+    return f"{label}({children})" if children else label
+
+
+def _explain(engine: Engine, stmt: Select) -> dict[str, Any]:
+    compiled = stmt.compile(dialect=engine.dialect)
+    sql = str(compiled)
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            raw = conn.exec_driver_sql(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, compiled.params
+            ).scalar_one()
+            doc = raw[0] if isinstance(raw, list) else json.loads(raw)[0]
+            plan = doc["Plan"]
+            return {
+                "shape": _pg_shape(plan),
+                "execution_ms": doc.get("Execution Time"),
+                "planning_ms": doc.get("Planning Time"),
+                "shared_hit": plan.get("Shared Hit Blocks"),
+                "shared_read": plan.get("Shared Read Blocks"),
+                "plan": plan,
+            }
+        rows = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + sql, tuple(compiled.params[k] for k in compiled.positiontup)
+        ).all()
+        return {"shape": " | ".join(r[-1] for r in rows)}
+
+
+def _time(engine: Engine, stmt: Select, iterations: int) -> dict[str, float]:
+    timings = []
+    with engine.connect() as conn:
+        conn.execute(stmt).all()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            conn.execute(stmt).all()
+            timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": statistics.quantiles(timings, n=20)[18],
+    }
+
+
+def _compare(current: dict[str, Any], baseline: dict[str, Any], tolerance: float, min_ms: float) -> list[str]:
+    problems = []
+    for name, result in current["queries"].items():
+        old = baseline.get("queries", {}).get(name)
+        if old is None:
+            continue
+        if result["shape"] != old["shape"]:
+            problems.append(f"{name}: plan changed\n    was: {old['shape']}\n    now: {result['shape']}")
+        old_ms, new_ms = old["median_ms"], result["median_ms"]
+        if new_ms > old_ms * (1 + tolerance) and new_ms - old_ms > min_ms:
+            problems.append(f"{name}: median {old_ms:.3f} ms -> {new_ms:.3f} ms")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="Write results JSON here")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative median slowdown")
+    parser.add_argument("--min-ms", type=float, default=0.2, help="Ignore absolute slowdowns below this")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+    params = _sample_params(engine)
+    with engine.connect() as conn:
+        row_count = conn.execute(select(func.count()).select_from(Question)).scalar_one()
+
+    results: dict[str, Any] = {
+        "dialect": engine.dialect.name,
+        "rows": row_count,
+        "params": params,
+        "queries": {},
+    }
+    for name, build in _catalog(params).items():
+        stmt = build()
+        entry = _explain(engine, stmt) | _time(engine, stmt, args.iterations)
+        results["queries"][name] = entry
+        print(f"{name:<30} median {entry['median_ms']:8.3f} ms  p95 {entry['p95_ms']:8.3f} ms  {entry['shape']}")
+
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, default=str)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        problems = _compare(results, baseline, args.tolerance, args.min_ms)
+        if problems:
+            print("\nREGRESSIONS:")
+            for p in problems:
+                print(f"  {p}")
+            sys.exit(1)
+        print("\nNo plan changes or regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
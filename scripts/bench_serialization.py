@@ -0,0 +1,112 @@
+# repo_root/scripts/bench_serialization.py
+"""Microbenchmark: stdlib json vs the configured fast backend.
+
+Measures the work done per LLM verification (payload build + encode + decode of
+a Responses API reply) and per API response render.
+
+    PYTHONPATH="$PWD/src" python scripts/bench_serialization.py
+"""
+from __future__ import annotations
+
+import json
+import timeit
+
+from jeopardy_game.core import serialization
+from jeopardy_game.services.llm_verifier import build_verifier_payload
+
+N = 20_000
+
+_RESPONSE = {
+    "id": "resp_123",
+    "object": "response",
+    "model": "gpt-4o-mini",
+    "output": [
+        {
+            "type": "message",
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "output_text",
+                    "text": '{"is_correct": true, "explanation": "Acceptable spelling variant."}',
+                }
+            ],
+        }
+    ],
+    "usage": {"input_tokens": 142, "output_tokens": 17, "total_tokens": 159},
+}
+_RESPONSE_BYTES = json.dumps(_RESPONSE).encode("utf-8")
+
+_QUESTION_OUT = {
+    "question_id": 182815,
+    "round": "Jeopardy!",
+    "category": 'RATED "R"',
+    "value": "$200",
+    "question": "The Haymarket Square Riot came out of a strike against a company that made these farm machines",
+}
+
+
+def _legacy_payload() -> dict:
+    """The payload as it was built before templates (schema + prompt per call)."""
+    schema = {
+        "type": "object",
+        "properties": {"is_correct": {"type": "boolean"}, "explanation": {"type": "string"}},
+        "required": ["is_correct", "explanation"],
+        "additionalProperties": False,
+    }
+    system = (
+        "You are a strict-but-fair Jeopardy judge. "
+        "Decide if the user's answer should be accepted as correct given the question and the official answer. "
+        "Be tolerant of minor spelling errors, punctuation differences, and common synonyms. "
+        "If the user's answer is clearly wrong, mark it incorrect."
+    )
+    user = (
+        "QUESTION: For the last 8 years of his life, Galileo was under house arrest\n"
+        "OFFICIAL ANSWER: Copernicus\n"
+        "USER ANSWER: Coperniadawdacs\n"
+        "Return your decision in the required JSON format."
+    )
+    return {
+        "model": "gpt-4o-mini",
+        "input": [{"role": "system", "content": system}, {"role": "user", "content": user}],
+        "text": {
+            "format": {"type": "json_schema", "name": "jeopardy_answer_verdict", "schema": schema, "strict": True}
+        },
+    }
+
+
+def _templated_payload() -> dict:
+    return build_verifier_payload(
+        model="gpt-4o-mini",
+        question="For the last 8 years of his life, Galileo was under house arrest",
+        correct_answer="Copernicus",
+        user_answer="Coperniadawdacs",
+    )
+
+
+def _bench(label: str, fn) -> float:
+    seconds = min(timeit.repeat(fn, number=N, repeat=5))
+    per_call_us = seconds / N * 1e6
+    print(f"{label:<44} {per_call_us:8.2f} us/call")
+    return per_call_us
+
+
+def main() -> None:
+    print(f"fast backend: {serialization.JSON_BACKEND}, iterations: {N}\n")
+
+    base = _bench(
+        "verify round-trip (legacy build + stdlib)",
+        lambda: (json.dumps(_legacy_payload()), json.loads(_RESPONSE_BYTES)),
+    )
+    fast = _bench(
+        "verify round-trip (templates + backend)",
+        lambda: (serialization.dumps(_templated_payload()), serialization.loads(_RESPONSE_BYTES)),
+    )
+    print(f"{'speedup':<44} {base / fast:8.2f}x\n")
+
+    base = _bench("response render (stdlib)", lambda: json.dumps(_QUESTION_OUT).encode("utf-8"))
+    fast = _bench("response render (backend)", lambda: serialization.dumps(_QUESTION_OUT))
+    print(f"{'speedup':<44} {base / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
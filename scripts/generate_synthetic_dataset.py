@@ -0,0 +1,170 @@
+# repo_root/scripts/generate_synthetic_dataset.py
+"""Generate a synthetic Jeopardy CSV at any scale, in the loader's input format.
+
+The output mimics the real dataset's shape: shows of 61 clues (30 Jeopardy!,
+30 Double Jeopardy!, 1 Final Jeopardy!), era-dependent values, occasional
+Daily Double wagers, Zipf-distributed categories and recurring answers. Load
+it through the normal ingest path:
+
+    PYTHONPATH="$PWD/src" python scripts/generate_synthetic_dataset.py --rows 2000000 --out /tmp/synthetic.csv
+    JEP_CSV_PATH=/tmp/synthetic.csv PYTHONPATH="$PWD/src" python scripts/load_dataset.py
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import itertools
+import random
+from collections.abc import Iterator
+
+HEADER = ["Show Number", "Air Date", "Round", "Category", "Value", "Question", "Answer"]
+
+CLUES_PER_ROUND = 30
+
+_ADJECTIVES = (
+    "AMERICAN", "ANCIENT", "FAMOUS", "WORLD", "POTENT", "LITERARY", "BIBLICAL", "SCIENTIFIC",
+    "FRENCH", "MUSICAL", "OLYMPIC", "ROYAL", "STUPID", "POTPOURRI", "SPORTY", "ANIMATED",
+)
+_NOUNS = (
+    "HISTORY", "SCIENCE", "GEOGRAPHY", "LITERATURE", "POETS", "CAPITALS", "RIVERS", "PRESIDENTS",
+    "OPERA", "FOOD", "ANIMALS", "INVENTIONS", "MOVIES", "WORDS", "HOLIDAYS", "EMPIRES",
+)
+_SYLLABLES = (
+    "ka", "lo", "mer", "an", "ti", "co", "per", "ni", "cus", "ra", "vel", "son", "dra", "mi",
+    "gor", "ba", "el", "is", "tan", "or", "lu", "ve", "sha", "qu", "en", "de", "ro", "fa",
+)
+_CLUE_TEMPLATES = (
+    "This {adj} figure is best known for the {noun} of {year}",
+    "In {year}, this {noun} became the first of its kind in {place}",
+    "Its name comes from the {adj} word for \"{word}\"",
+    "This {noun} was founded in {place} around {year}",
+    "Legend says this {adj} {noun} once {verb} the entire {place}",
+    "Seen here, this {noun} {verb} over {number} visitors a year",
+)
+_VERBS = ("ruled", "crossed", "inspired", "renamed", "divided", "discovered", "flooded")
+
+
+def _word(rng: random.Random, lo: int = 2, hi: int = 4) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(lo, hi)))
+
+
+def _answer(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.5:
+        return _word(rng).capitalize()
+    if kind < 0.8:
+        return f"{_word(rng).capitalize()} {_word(rng).capitalize()}"
+    if kind < 0.93:
+        return f"the {_word(rng)}s"
+    return f"{_word(rng).capitalize()} ({_word(rng)})"
+
+
+def _clue(rng: random.Random) -> str:
+    return rng.choice(_CLUE_TEMPLATES).format(
+        adj=rng.choice(_ADJECTIVES).lower(),
+        noun=rng.choice(_NOUNS).lower(),
+        year=rng.randint(1066, 2011),
+        place=_word(rng).capitalize(),
+        word=_word(rng, 1, 2),
+        verb=rng.choice(_VERBS),
+        number=f"{rng.randint(1, 900)},000",
+    )
+
+
+def _zipf_cum_weights(n: int, s: float) -> list[float]:
+    return list(itertools.accumulate(1.0 / (k**s) for k in range(1, n + 1)))
+
+
+def generate_rows(
+    rows: int,
+    *,
+    seed: int = 0,
+    categories: int | None = None,
+    zipf_s: float = 1.1,
+    answer_pool: int | None = None,
+) -> Iterator[list[str]]:
+    """Yield CSV rows (matching `HEADER`) for `rows` synthetic clues."""
+    rng = random.Random(seed)
+
+    n_categories = categories or max(50, rows // 40)
+    combos = len(_ADJECTIVES) * len(_NOUNS)
+    category_names = [
+        f"{_ADJECTIVES[i % len(_ADJECTIVES)]} {_NOUNS[i // len(_ADJECTIVES) % len(_NOUNS)]}"
+        + (f" {i // combos}" if i >= combos else "")
+        for i in range(n_categories)
+    ]
+    rng.shuffle(category_names)
+    category_weights = _zipf_cum_weights(n_categories, zipf_s)
+
+    n_answers = answer_pool or max(100, rows // 3)
+    answers = [_answer(rng) for _ in range(n_answers)]
+    answer_weights = _zipf_cum_weights(n_answers, 0.8)
+
+    show_number = 1
+    air_date = dt.date(1984, 9, 10)
+    emitted = 0
+
+    while emitted < rows:
+        # Values doubled on November 26, 2001
+        base = 200 if air_date >= dt.date(2001, 11, 26) else 100
+        show_categories = rng.choices(category_names, cum_weights=category_weights, k=13)
+
+        for round_name, multiplier, cats in (
+            ("Jeopardy!", 1, show_categories[:6]),
+            ("Double Jeopardy!", 2, show_categories[6:12]),
+        ):
+            for i in range(CLUES_PER_ROUND):
+                if emitted >= rows:
+                    return
+                value = base * multiplier * (i % 5 + 1)
+                if rng.random() < 0.02:  # Daily Double wager
+                    value = rng.randrange(5, 60) * 100
+                answer = rng.choices(answers, cum_weights=answer_weights, k=1)[0]
+                yield [
+                    str(show_number),
+                    air_date.isoformat(),
+                    round_name,
+                    cats[i % len(cats)],
+                    f"${value:,}",
+                    _clue(rng),
+                    answer,
+                ]
+                emitted += 1
+
+        if emitted < rows:
+            yield [
+                str(show_number),
+                air_date.isoformat(),
+                "Final Jeopardy!",
+                show_categories[12],
+                "None",
+                _clue(rng),
+                rng.choices(answers, cum_weights=answer_weights, k=1)[0],
+            ]
+            emitted += 1
+
+        show_number += 1
+        air_date += dt.timedelta(days=3 if air_date.weekday() == 4 else 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, required=True, help="Number of clues to generate")
+    parser.add_argument("--out", required=True, help="Output CSV path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--categories", type=int, default=None, help="Distinct categories (default rows/40)")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Category skew exponent")
+    args = parser.parse_args()
+
+    with open(args.out, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(HEADER)
+        writer.writerows(
+            generate_rows(args.rows, seed=args.seed, categories=args.categories, zipf_s=args.zipf)
+        )
+    print(f"Wrote {args.rows} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
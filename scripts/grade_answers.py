@@ -0,0 +1,107 @@
+# repo_root/scripts/grade_answers.py
+"""Grade a large log of answers offline.
+
+Input is NDJSON (one object per line) or CSV with at least `question_id` and
+`user_answer`; any other fields are passed through. Canonical answers are
+joined per chunk from the question snapshot (when `--snapshot` or
+`JEP_SNAPSHOT_PATH` points at one) or from the database. Chunks are graded with
+the heuristic checker across a process pool; `--llm` re-checks heuristic misses
+with the LLM verifier at no more than `--llm-rps` requests per second. Output
+keeps input order and adds `is_correct`, `source` and `explanation`; CSV output
+takes its columns from the first record. Records without an integer
+`question_id` or a `user_answer` are kept with `source` "invalid".
+
+    PYTHONPATH="$PWD/src" python scripts/grade_answers.py answers.ndjson --out graded.ndjson --workers 8
+    PYTHONPATH="$PWD/src" python scripts/grade_answers.py answers.csv --out - --llm --llm-rps 5 > graded.ndjson
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from jeopardy_game.core.config import get_openai_api_key, get_snapshot_path
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.db.snapshot import QuestionSnapshot
+from jeopardy_game.services.batch_grading import (
+    DatabaseAnswerSource,
+    LLMStage,
+    RecordWriter,
+    SnapshotAnswerSource,
+    detect_format,
+    grade_stream,
+    open_text,
+    read_records,
+)
+from jeopardy_game.services.llm_verifier import LLMAnswerVerifier
+from jeopardy_game.services.usage import usage_ledger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="Answer log (NDJSON or CSV), or - for stdin")
+    parser.add_argument("--out", required=True, help="Output file (NDJSON or CSV), or - for stdout")
+    parser.add_argument("--in-format", choices=("ndjson", "csv"), default=None)
+    parser.add_argument("--out-format", choices=("ndjson", "csv"), default=None)
+    parser.add_argument("--snapshot", default=get_snapshot_path(), help="Question snapshot to join against")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--llm", action="store_true", help="Re-check heuristic misses with the LLM")
+    parser.add_argument("--llm-rps", type=float, default=5.0)
+    parser.add_argument("--llm-workers", type=int, default=8)
+    args = parser.parse_args()
+    if args.llm and not get_openai_api_key():
+        parser.error("--llm needs OPENAI_API_KEY")
+
+    if args.snapshot and os.path.exists(args.snapshot):
+        answers = SnapshotAnswerSource(QuestionSnapshot(args.snapshot))
+    else:
+        engine = build_engine(os.environ["DATABASE_URL"])
+        answers = DatabaseAnswerSource(sessionmaker(bind=engine, autoflush=False, autocommit=False))
+
+    llm = None
+    if args.llm:
+        verifier = LLMAnswerVerifier(api_key=get_openai_api_key())
+        llm = LLMStage(verifier.verify, rate_per_s=args.llm_rps, workers=args.llm_workers, route_label="grading")
+
+    started = time.monotonic()
+    graded = correct = invalid = 0
+    src = open_text(args.input, "r")
+    dst = open_text(args.out, "w")
+    try:
+        writer = RecordWriter(dst, detect_format(args.out, args.out_format))
+        records = read_records(src, detect_format(args.input, args.in_format))
+        for record in grade_stream(
+            records, answers=answers, workers=args.workers, chunk_size=args.chunk_size, llm=llm
+        ):
+            writer.write(record)
+            graded += 1
+            correct += record["is_correct"] is True
+            invalid += record["source"] == "invalid"
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+        if llm is not None:
+            llm.close()
+
+    elapsed = max(time.monotonic() - started, 1e-9)
+    print(f"Graded {graded} answers ({correct} correct) in {elapsed:.1f}s, {graded / elapsed:,.0f}/s", file=sys.stderr)
+    if invalid:
+        print(f"{invalid} malformed records written with source=invalid", file=sys.stderr)
+    if llm is not None:
+        print(f"LLM re-checks failed: {llm.failures} (heuristic verdict kept)", file=sys.stderr)
+    for row in usage_ledger.snapshot()["by_route_model"]:
+        print(
+            f"LLM {row['model']}: {row['requests']} calls, {row['input_tokens']} input tokens "
+            f"({row['cached_input_tokens']} cached), {row['output_tokens']} output tokens, cost ${row['cost_usd']}",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
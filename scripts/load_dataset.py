@@ -4,22 +4,37 @@ from __future__ import annotations
 import os
 import re
 import time
+import uuid
 from typing import Optional
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, insert, select, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 
+from jeopardy_game.core.config import (
+    get_partition_value_bounds,
+    get_questions_partitioning,
+    get_snapshot_path,
+)
 from jeopardy_game.db.base import Base
-from jeopardy_game.models.question import Question
+from jeopardy_game.db.partitioning import create_partitioned_questions_table
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.db.snapshot import write_snapshot
+from jeopardy_game.db.sqlite import deferred_fts_index, install_pragmas, is_sqlite_url, sqlite_engine_options
+from jeopardy_game.models import agent_answer  # noqa: F401  (registers agent_answers for create_all)
+from jeopardy_game.models import verification_attempt  # noqa: F401  (registers attempt log tables for create_all)
+from jeopardy_game.models import verification_job  # noqa: F401  (registers verification_jobs for create_all)
+from jeopardy_game.models.dataset_meta import QUESTIONS_DATASET, DatasetMeta
+from jeopardy_game.models.question import Question, QuestionRecord
 
 
-_VALUE_RE = re.compile(r"^\s*\$?\s*(\d+)\s*$")
+# "$200", "200" or, as in the original dataset, "$1,000"
+_VALUE_RE = re.compile(r"^\s*\$?\s*(\d{1,3}(?:,\d{3})+|\d+)\s*$")
 
 
 def parse_value(value_raw: object) -> Optional[int]:
-    """Parse '$200' / '200' into int(200). Return None if unparseable."""
+    """Parse '$200' / '200' / '$1,200' into an int. Return None if unparseable."""
     if value_raw is None:
         return None
     s = str(value_raw).strip()
@@ -28,7 +43,7 @@ def parse_value(value_raw: object) -> Optional[int]:
     m = _VALUE_RE.match(s)
     if not m:
         return None
-    return int(m.group(1))
+    return int(m.group(1).replace(",", ""))
 
 
 def wait_for_db(engine, timeout_s: int = 90) -> None:
@@ -48,39 +63,22 @@ def wait_for_db(engine, timeout_s: int = 90) -> None:
     raise RuntimeError(f"Database not ready after {timeout_s}s: {last_err}") from last_err
 
 
-def main() -> None:
-    database_url = os.environ["DATABASE_URL"]
-    csv_path = os.environ.get("JEP_CSV_PATH", "/assets/JEOPARDY_CSV.csv")
-    max_value = int(os.environ.get("JEP_MAX_VALUE", "1200"))
-
-    engine = create_engine(database_url, pool_pre_ping=True)
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+REQUIRED_COLS = [
+    "Show Number",
+    "Air Date",
+    "Round",
+    "Category",
+    "Value",
+    "Question",
+    "Answer",
+]
 
-    wait_for_db(engine, timeout_s=90)
-
-    # Create schema (idempotent)
-    Base.metadata.create_all(bind=engine)
-
-    # If already seeded, skip
-    with SessionLocal() as db:
-        if db.query(Question.id).limit(1).first() is not None:
-            print("Questions already exist; skipping load.")
-            return
 
-    # Read CSV robustly (handles BOM via utf-8-sig)
-    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+def _clean_frame(df: pd.DataFrame, max_value: int) -> pd.DataFrame:
+    """Validate columns, parse values/dates and drop rows that cannot be loaded."""
     df.columns = [c.strip() for c in df.columns]
 
-    required_cols = [
-        "Show Number",
-        "Air Date",
-        "Round",
-        "Category",
-        "Value",
-        "Question",
-        "Answer",
-    ]
-    missing = [c for c in required_cols if c not in df.columns]
+    missing = [c for c in REQUIRED_COLS if c not in df.columns]
     if missing:
         raise RuntimeError(f"CSV is missing required columns: {missing}. Found: {list(df.columns)}")
 
@@ -98,34 +96,123 @@ def main() -> None:
     df = df[df["air_date"].notna()]
 
     # Drop missing essentials
-    df = df.dropna(subset=["Show Number", "Round", "Category", "Question", "Answer", "air_date", "value_int"])
+    return df.dropna(subset=["Show Number", "Round", "Category", "Question", "Answer", "air_date", "value_int"])
+
+
+def _question_rows(df: pd.DataFrame) -> list[dict]:
+    return [
+        {
+            "show_number": int(str(r["Show Number"]).strip()),
+            "air_date": r["air_date"].date(),
+            "round": str(r["Round"]).strip(),
+            "category": str(r["Category"]).strip(),
+            "value": int(r["value_int"]),
+            "question": str(r["Question"]).strip(),
+            "answer": str(r["Answer"]).strip(),
+        }
+        for r in df.to_dict(orient="records")
+    ]
 
-    rows = df.to_dict(orient="records")
+
+def export_snapshot(SessionLocal, path: str) -> None:
+    """Write the columnar question snapshot served by API workers."""
+    stmt = select(
+        Question.id,
+        Question.round,
+        Question.category,
+        Question.value,
+        Question.question,
+        Question.answer,
+    )
+    with SessionLocal() as db:
+        version = db.scalar(select(DatasetMeta.version).where(DatasetMeta.name == QUESTIONS_DATASET))
+        rows = db.execute(stmt.execution_options(yield_per=10_000))
+        records = (QuestionRecord(*row) for row in rows)
+        count = write_snapshot(path, records, dataset_version=version)
+    print(f"Snapshot written: {path} ({count} questions)")
+
+
+def mark_dataset_loaded(SessionLocal) -> str:
+    """Record a new dataset version so API workers drop their cached questions."""
+    version = uuid.uuid4().hex
+    with SessionLocal() as db:
+        db.merge(DatasetMeta(name=QUESTIONS_DATASET, version=version))
+        db.commit()
+    return version
+
+
+def main() -> None:
+    database_url = os.environ["DATABASE_URL"]
+    csv_path = os.environ.get("JEP_CSV_PATH", "/assets/JEOPARDY_CSV.csv")
+    max_value = int(os.environ.get("JEP_MAX_VALUE", "1200"))
+    snapshot_path = get_snapshot_path()
+
+    # Embedded SQLite: nothing to wait for; skip fsyncs while loading
+    embedded = is_sqlite_url(database_url)
+    if embedded:
+        engine = create_engine(database_url, **sqlite_engine_options(database_url))
+        install_pragmas(engine, bulk_load=True)
+    else:
+        engine = build_engine(database_url)
+        wait_for_db(engine, timeout_s=90)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    # Optionally create `questions` as a partitioned table; create_all then skips it
+    partitioning = get_questions_partitioning()
+    if embedded and partitioning != "none":
+        raise RuntimeError("JEP_PARTITION_QUESTIONS requires PostgreSQL")
+    if partitioning in ("round", "round_value"):
+        bounds = get_partition_value_bounds() if partitioning == "round_value" else None
+        if create_partitioned_questions_table(engine, value_bounds=bounds):
+            print(f"Created partitioned questions table ({partitioning}).")
+    elif partitioning != "none":
+        raise RuntimeError(f"Unknown JEP_PARTITION_QUESTIONS={partitioning!r}")
+
+    # Create schema (idempotent)
+    Base.metadata.create_all(bind=engine)
+
+    # If already seeded, skip
+    with SessionLocal() as db:
+        if db.query(Question.id).limit(1).first() is not None:
+            print("Questions already exist; skipping load.")
+            if snapshot_path:
+                export_snapshot(SessionLocal, snapshot_path)
+            return
+
+    # Read CSV robustly (handles BOM via utf-8-sig), in chunks so large
+    # (e.g. synthetic) datasets load in constant memory
+    chunk_rows = int(os.environ.get("JEP_CSV_CHUNK_ROWS", "50000"))
+    chunks = pd.read_csv(csv_path, encoding="utf-8-sig", chunksize=chunk_rows)
 
     batch_size = 2000
     inserted = 0
 
-    with SessionLocal() as db:
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
-            objs = [
-                Question(
-                    show_number=int(str(r["Show Number"]).strip()),
-                    air_date=r["air_date"].date(),
-                    round=str(r["Round"]).strip(),
-                    category=str(r["Category"]).strip(),
-                    value=int(r["value_int"]),
-                    question=str(r["Question"]).strip(),
-                    answer=str(r["Answer"]).strip(),
-                )
-                for r in batch
-            ]
-            db.bulk_save_objects(objs)
-            db.commit()
-            inserted += len(objs)
-            print(f"Inserted {inserted}...")
+    if embedded:
+        # One transaction (one WAL commit) for the whole load, Core executemany
+        # instead of ORM objects, and the FTS index built once at the end
+        with deferred_fts_index(engine), engine.begin() as conn:
+            for chunk in chunks:
+                rows = _question_rows(_clean_frame(chunk, max_value))
+                if rows:
+                    conn.execute(insert(Question), rows)
+                inserted += len(rows)
+                print(f"Inserted {inserted}...")
+    else:
+        with SessionLocal() as db:
+            for chunk in chunks:
+                rows = _question_rows(_clean_frame(chunk, max_value))
+                for i in range(0, len(rows), batch_size):
+                    objs = [Question(**r) for r in rows[i : i + batch_size]]
+                    db.bulk_save_objects(objs)
+                    db.commit()
+                    inserted += len(objs)
+                    print(f"Inserted {inserted}...")
 
     print(f"Load complete. Inserted: {inserted}")
+    print(f"Dataset version: {mark_dataset_loaded(SessionLocal)}")
+
+    if snapshot_path:
+        export_snapshot(SessionLocal, snapshot_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+# repo_root/scripts/precompute_agent_answers.py
+"""Precompute raw agent answers for the corpus (or a slice of it).
+
+Runs `LlmAgent.base_answer` over every question that has no stored answer for
+the model yet and writes results to `agent_answers` in batches. Each batch is
+committed on its own, so an interrupted run resumes where it stopped. LLM
+calls are I/O-bound, so the worker pool is a thread pool sharing one
+token-bucket rate limiter.
+
+    export DATABASE_URL=... OPENAI_API_KEY=...
+    PYTHONPATH="$PWD/src" python scripts/precompute_agent_answers.py --workers 8 --rps 5
+    PYTHONPATH="$PWD/src" python scripts/precompute_agent_answers.py --round "Jeopardy!" --value 200 --limit 1000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import and_, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from jeopardy_game.core.config import get_openai_model
+from jeopardy_game.db.base import Base
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.models.agent_answer import PrecomputedAgentAnswer
+from jeopardy_game.models.question import Question
+from jeopardy_game.services.agents.llm_agent import LlmAgent, LlmAgentConfig
+from jeopardy_game.services.openai_client import OpenAIClient
+from jeopardy_game.services.rate_limit import RateLimiter
+from jeopardy_game.services.usage import set_route_label, usage_ledger
+
+
+def _pending_stmt(*, model: str, after_id: int, round_name: str | None, value: int | None, page: int):
+    stmt = (
+        select(Question.id, Question.question, Question.category, Question.round, Question.value)
+        .outerjoin(
+            PrecomputedAgentAnswer,
+            and_(PrecomputedAgentAnswer.question_id == Question.id, PrecomputedAgentAnswer.model == model),
+        )
+        .where(PrecomputedAgentAnswer.question_id.is_(None))
+        .where(Question.id > after_id)
+    )
+    if round_name:
+        stmt = stmt.where(Question.round == round_name)
+    if value is not None:
+        stmt = stmt.where(Question.value == value)
+    return stmt.order_by(Question.id).limit(page)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=get_openai_model())
+    parser.add_argument("--round", dest="round_name", default=None)
+    parser.add_argument("--value", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many new answers")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rps", type=float, default=5.0, help="Max LLM requests per second")
+    parser.add_argument("--batch-size", type=int, default=100, help="Answers per commit")
+    args = parser.parse_args()
+
+    engine = build_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(bind=engine, tables=[PrecomputedAgentAnswer.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    client = OpenAIClient.from_env(model=args.model)
+    # The base answer is skill-independent; skill only affects mistake injection.
+    agent = LlmAgent(name="precompute", client=client, config=LlmAgentConfig(skill="hard"))
+    limiter = RateLimiter(args.rps, burst=args.workers)
+
+    def answer(row) -> tuple[int, str | None]:
+        qid, question, category, round_name, value = row
+        limiter.acquire()
+        try:
+            text = agent.base_answer(question=question, category=category, round_name=round_name, value=f"${value}")
+        except Exception as exc:  # keep going; the row stays pending for the next run
+            print(f"question {qid}: failed ({exc})")
+            return qid, None
+        return qid, text
+
+    done = failed = 0
+    after_id = 0
+    started = time.monotonic()
+
+    # Label usage in the worker threads, where the LLM calls run
+    with ThreadPoolExecutor(max_workers=args.workers, initializer=set_route_label, initargs=("precompute",)) as pool:
+        while args.limit is None or done < args.limit:
+            page = args.batch_size if args.limit is None else min(args.batch_size, args.limit - done)
+            with SessionLocal() as db:
+                rows = db.execute(
+                    _pending_stmt(
+                        model=args.model,
+                        after_id=after_id,
+                        round_name=args.round_name,
+                        value=args.value,
+                        page=page,
+                    )
+                ).all()
+            if not rows:
+                break
+            after_id = rows[-1][0]
+
+            results = [(qid, text) for qid, text in pool.map(answer, rows) if text is not None]
+            failed += len(rows) - len(results)
+            if results:
+                with SessionLocal() as db:
+                    db.execute(
+                        insert(PrecomputedAgentAnswer),
+                        [{"question_id": qid, "model": args.model, "answer": text} for qid, text in results],
+                    )
+                    db.commit()
+            done += len(results)
+            rate = done / max(time.monotonic() - started, 1e-9)
+            print(f"Stored {done} answers ({failed} failed, {rate:.1f}/s)...")
+
+    print(f"Done. Stored: {done}, failed: {failed}")
+    for row in usage_ledger.snapshot()["by_route_model"]:
+        print(
+            f"{row['route']} {row['model']}: {row['input_tokens']} input tokens ({row['cached_input_tokens']} cached), "
+            f"{row['output_tokens']} output tokens, cost ${row['cost_usd']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
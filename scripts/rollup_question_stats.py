@@ -0,0 +1,54 @@
+# repo_root/scripts/rollup_question_stats.py
+"""Roll `verification_attempts` up into per-question accuracy (`question_stats`).
+
+Incremental and resumable: only attempts newer than the last run are read.
+`GET /question/?difficulty=easy|medium|hard` filters on the result. Run it
+from cron, or keep it running with `--interval`.
+
+    PYTHONPATH="$PWD/src" python scripts/rollup_question_stats.py
+    PYTHONPATH="$PWD/src" python scripts/rollup_question_stats.py --interval 300
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from jeopardy_game.db.base import Base
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.models.verification_attempt import (
+    QuestionStats,
+    QuestionStatsRollup,
+    VerificationAttempt,
+)
+from jeopardy_game.services.question_stats import rollup_attempts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Attempts per transaction")
+    parser.add_argument("--settle", type=float, default=60.0, help="Skip attempts younger than this (seconds)")
+    parser.add_argument("--interval", type=float, default=None, help="Repeat every N seconds")
+    args = parser.parse_args()
+
+    engine = build_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[VerificationAttempt.__table__, QuestionStats.__table__, QuestionStatsRollup.__table__],
+    )
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    while True:
+        started = time.monotonic()
+        with SessionLocal() as db:
+            processed = rollup_attempts(db, batch_size=args.batch_size, settle_s=args.settle)
+        print(f"Rolled up {processed} attempts in {time.monotonic() - started:.1f}s")
+        if args.interval is None:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
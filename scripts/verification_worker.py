@@ -0,0 +1,83 @@
+# repo_root/scripts/verification_worker.py
+"""Process queued verification jobs (`POST /verify-answer/jobs`).
+
+Each thread claims batches of jobs from `verification_jobs` and runs the same
+verification as `/verify-answer/` (the `JEP_VERIFY_PIPELINE` tiers). Verification is
+LLM-bound, so threads give the concurrency; run more processes or containers
+to scale further. Jobs abandoned by a crashed worker are reclaimed after
+`JEP_JOB_LEASE_S`.
+
+    export DATABASE_URL=... OPENAI_API_KEY=...
+    PYTHONPATH="$PWD/src" python scripts/verification_worker.py --threads 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import socket
+import threading
+from dataclasses import replace
+
+from sqlalchemy.orm import sessionmaker
+
+from jeopardy_game.core.config import (
+    get_job_lease_s,
+    get_job_max_attempts,
+    get_job_poll_interval_s,
+)
+from jeopardy_game.db.base import Base
+from jeopardy_game.db.pool import PoolSettings
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.models.verification_attempt import VerificationAttempt
+from jeopardy_game.models.verification_job import VerificationJob
+from jeopardy_game.services.attempt_log import attempt_log
+from jeopardy_game.services.verification_jobs import run_worker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=4, help="Jobs claimed per round trip")
+    parser.add_argument("--poll-interval", type=float, default=get_job_poll_interval_s())
+    args = parser.parse_args()
+
+    engine = build_engine(os.environ["DATABASE_URL"], replace(PoolSettings.from_config(), size=args.threads))
+    Base.metadata.create_all(bind=engine, tables=[VerificationJob.__table__, VerificationAttempt.__table__])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    threads = [
+        threading.Thread(
+            target=run_worker,
+            name=f"verify-worker-{i}",
+            args=(SessionLocal,),
+            kwargs={
+                "worker_id": f"{prefix}:{i}",
+                "batch_size": args.batch_size,
+                "poll_interval_s": args.poll_interval,
+                "lease_s": get_job_lease_s(),
+                "max_attempts": get_job_max_attempts(),
+                "stop": stop,
+                "attempt_log": attempt_log,
+            },
+        )
+        for i in range(args.threads)
+    ]
+    attempt_log.start()
+    for t in threads:
+        t.start()
+    print(f"Verification worker {prefix} running with {args.threads} threads.")
+    while any(t.is_alive() for t in threads):
+        for t in threads:
+            t.join(timeout=1.0)
+    attempt_log.stop()
+    print("Verification worker stopped.")
+
+
+if __name__ == "__main__":
+    main()
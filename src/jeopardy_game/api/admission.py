@@ -0,0 +1,195 @@
+"""Admission control and load shedding per route class.
+
+Slow, LLM-bound routes get their own bounded concurrency pool and wait queue,
+so a spike on `/agent-play/` cannot starve cheap routes like `/question/` of
+threadpool workers. That only holds if the threadpool can serve every class at
+its limit at once: the pools share AnyIO's default thread limiter, which the app
+sizes at startup with `threadpool_size`. When a class's queue is full (or a queued request waits
+longer than the queue timeout) the request is rejected immediately with
+``503 Service Unavailable`` and a ``Retry-After`` header.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from jeopardy_game.core import tracing
+from jeopardy_game.core.config import (
+    get_admission_limits,
+    get_admission_queue_timeout_s,
+    get_admission_retry_after_s,
+)
+from jeopardy_game.core.serialization import FastJSONResponse
+
+ROUTE_CLASSES: tuple[str, ...] = ("agent", "job_poll", "jobs", "verify", "question")
+# Classes whose (sync) endpoints hold a worker thread while admitted; job polls wait on the loop
+THREADPOOL_CLASSES: tuple[str, ...] = ("agent", "jobs", "verify", "question")
+
+
+def route_class(path: str) -> str | None:
+    """Map a request path to its admission class (None = not admission-controlled)."""
+    if path.startswith("/agent-play"):
+        return "agent"
+    if path.startswith("/verify-answer/jobs/"):
+        return "job_poll"  # long polls idle on the event loop; they must not hold enqueue slots
+    if path.startswith("/verify-answer/jobs"):
+        return "jobs"  # cheap enqueue requests; must not queue behind synchronous verifies
+    if path.startswith("/verify-answer"):
+        return "verify"
+    if path.startswith("/question"):
+        return "question"
+    return None
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted to its pool."""
+
+
+class AdmissionPool:
+    """Bounded concurrency with a bounded FIFO wait queue.
+
+    All methods run on the event loop thread, so plain counters suffice.
+    """
+
+    def __init__(self, name: str, *, max_concurrency: int, max_queue: int, queue_timeout_s: float) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.admitted = 0
+        self.shed = 0
+        self.timed_out = 0
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the queue if necessary.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait times out.
+        """
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            raise AdmissionRejected(self.name)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout_s)
+        except TimeoutError:
+            if waiter.done():  # slot was handed over just as the timer fired
+                return
+            waiter.cancel()
+            self._discard(waiter)
+            self.timed_out += 1
+            self.shed += 1
+            raise AdmissionRejected(self.name) from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            raise
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        """Free a slot, handing it directly to the oldest live waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.admitted += 1
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+def build_admission_pools() -> dict[str, AdmissionPool]:
+    """Create one pool per route class from configuration."""
+    timeout_s = get_admission_queue_timeout_s()
+    pools = {}
+    for name in ROUTE_CLASSES:
+        concurrency, queue = get_admission_limits(name)
+        pools[name] = AdmissionPool(
+            name, max_concurrency=concurrency, max_queue=queue, queue_timeout_s=timeout_s
+        )
+    return pools
+
+
+def threadpool_size(pools: dict[str, AdmissionPool], reserve: int) -> int:
+    """Worker threads needed for every threadpool-bound class at its limit, plus `reserve`.
+
+    The reserve serves unclassified routes (search, metrics) and the short sync
+    dependencies of async endpoints such as job polls.
+    """
+    return sum(pools[name].max_concurrency for name in THREADPOOL_CLASSES if name in pools) + reserve
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that admits each request through its route class pool."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        pools: dict[str, AdmissionPool],
+        classify: Callable[[str], str | None] = route_class,
+        retry_after_s: int | None = None,
+    ) -> None:
+        self.app = app
+        self.pools = pools
+        self._classify = classify
+        self._retry_after = str(retry_after_s if retry_after_s is not None else get_admission_retry_after_s())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name = self._classify(scope["path"])
+        pool = self.pools.get(name) if name else None
+        if pool is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            with tracing.span("admission.wait", route_class=name):
+                await pool.acquire()
+        except AdmissionRejected:
+            response = FastJSONResponse(
+                {"detail": f"Server is busy ({name} requests); retry later."},
+                status_code=503,
+                headers={"Retry-After": self._retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            pool.release()
@@ -6,13 +6,40 @@ from collections.abc import Generator
 
 from sqlalchemy.orm import Session
 
-from jeopardy_game.db.session import SessionLocal
+from jeopardy_game.db.session import SessionLocal, replica_router
+from jeopardy_game.db.snapshot import QuestionSnapshot, get_question_snapshot
+from jeopardy_game.services.attempt_log import AttemptLog, attempt_log
+from jeopardy_game.services.question_cache import QuestionCache, question_cache
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Yield a SQLAlchemy session."""
+    """Yield a SQLAlchemy session on the primary (read/write)."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """Yield a read-only session routed to a healthy replica (or the primary)."""
+    db = replica_router.read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_snapshot() -> QuestionSnapshot | None:
+    """Return the memory-mapped question snapshot, if one is configured."""
+    return get_question_snapshot()
+
+
+def get_question_cache() -> QuestionCache:
+    """Return the per-process question LRU."""
+    return question_cache
+
+
+def get_attempt_log() -> AttemptLog:
+    """Return the per-process write-behind attempt log."""
+    return attempt_log
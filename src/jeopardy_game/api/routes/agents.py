@@ -3,45 +3,54 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from jeopardy_game.api.deps import get_db
-from jeopardy_game.models.question import Question
+from jeopardy_game.api.deps import get_attempt_log, get_read_db
+from jeopardy_game.core.config import get_openai_model
+from jeopardy_game.db.queries import agent_play_question_stmt
 from jeopardy_game.schemas.agent_play import AgentPlayRequest, AgentPlayResponse
 from jeopardy_game.services.agents.factory import build_agent
-from jeopardy_game.services.answer_verification import verify_answer_for_question  # adjust import to your verifier function
+from jeopardy_game.services.agents.llm_agent import apply_skill_mistakes
+from jeopardy_game.services.answer_verification import verify_answer_outcome
+from jeopardy_game.services.attempt_log import AttemptLog
 
 
 router = APIRouter(tags=["agents"])
 
 
 @router.post("/agent-play/", response_model=AgentPlayResponse)
-def agent_play(payload: AgentPlayRequest, db: Session = Depends(get_db)) -> AgentPlayResponse:
-    # Reuse your existing query logic, or do minimal filtering here:
-    q = db.query(Question)
-
-    if payload.round:
-        q = q.filter(Question.round == payload.round)
+def agent_play(
+    payload: AgentPlayRequest,
+    db: Session = Depends(get_read_db),
+    attempt_log: AttemptLog = Depends(get_attempt_log),
+) -> AgentPlayResponse:
+    value_int: int | None = None
     if payload.value:
         # your model stores int value; convert "$200" -> 200 if needed
         try:
             value_int = int(payload.value.replace("$", "").replace(",", "").strip())
         except ValueError as e:
             raise HTTPException(status_code=400, detail="Invalid value format") from e
-        q = q.filter(Question.value == value_int)
 
-    question_row = q.order_by(Question.id.desc()).first()
-    if question_row is None:
+    stmt = agent_play_question_stmt(round_name=payload.round, value=value_int, model=get_openai_model())
+    row = db.execute(stmt).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="No questions found for given filters")
+    question_row, precomputed = row
 
-    # Agent answers
-    agent = build_agent(name=payload.agent_name, skill=payload.skill)
-    agent_answer = agent.answer_question(
-        question=question_row.question,
-        category=question_row.category,
-        round_name=question_row.round,
-        value=f"${question_row.value}",
-    )
+    # Agent answers: precomputed raw answer when available, live LLM call otherwise
+    if precomputed is not None:
+        ai_answer = apply_skill_mistakes(precomputed, payload.skill)
+    else:
+        agent = build_agent(name=payload.agent_name, skill=payload.skill)
+        ai_answer = agent.answer_question(
+            question=question_row.question,
+            category=question_row.category,
+            round_name=question_row.round,
+            value=f"${question_row.value}",
+        ).answer
 
-    verdict = verify_answer_for_question(question=question_row, user_answer=agent_answer.answer)
+    outcome = verify_answer_outcome(question=question_row, user_answer=ai_answer)
+    attempt_log.record_outcome(question_id=question_row.id, user_answer=ai_answer, outcome=outcome, source="agent")
+    verdict = outcome.out
 
     return AgentPlayResponse(
         agent_name=payload.agent_name,
@@ -51,7 +60,7 @@ def agent_play(payload: AgentPlayRequest, db: Session = Depends(get_db)) -> Agen
         category=question_row.category,
         round=question_row.round,
         value=f"${question_row.value}",
-        ai_answer=agent_answer.answer,
+        ai_answer=ai_answer,
         is_correct=verdict.is_correct,
         verifier_response=verdict.ai_response,
     )
@@ -0,0 +1,50 @@
+"""Operational counters for load shedding, LLM capacity and usage, caches and DB pools."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Request
+
+from jeopardy_game.db.pool import pool_stats
+from jeopardy_game.db.session import replica_router
+from jeopardy_game.services.attempt_log import attempt_log
+from jeopardy_game.services.llm_gate import llm_gate
+from jeopardy_game.services.question_cache import question_cache
+from jeopardy_game.services.usage import usage_ledger
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/admission", summary="Admission queue depths and shed counters")
+def admission_metrics(request: Request) -> dict[str, Any]:
+    pools = request.app.state.admission_pools
+    return {
+        "pools": {name: pool.stats() for name, pool in pools.items()},
+        "llm_gate": llm_gate.stats(),
+    }
+
+
+@router.get("/question-cache", summary="Question LRU size, hit/miss and invalidation counters")
+def question_cache_metrics() -> dict[str, Any]:
+    return question_cache.stats()
+
+
+@router.get("/attempt-log", summary="Attempt log buffer depth, write and drop counters")
+def attempt_log_metrics() -> dict[str, Any]:
+    return attempt_log.stats()
+
+
+@router.get("/llm-usage", summary="LLM requests, tokens (incl. cached) and cost per route and model")
+def llm_usage_metrics() -> dict[str, Any]:
+    return usage_ledger.snapshot()
+
+
+@router.get("/db-pool", summary="Connection pool checkouts, waits and connections in use per engine")
+def db_pool_metrics() -> dict[str, Any]:
+    return {
+        "primary": pool_stats(replica_router.primary.pool),
+        "replicas": {
+            e.url.render_as_string(hide_password=True): pool_stats(e.pool) for e in replica_router.replicas
+        },
+    }
@@ -3,18 +3,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import random
 import re
+import time
 from typing import Final
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from jeopardy_game.api.deps import get_db
-from jeopardy_game.models.question import Question
+from jeopardy_game.api.deps import (
+    get_attempt_log,
+    get_db,
+    get_question_cache,
+    get_read_db,
+    get_snapshot,
+)
+from jeopardy_game.core.config import (
+    get_difficulty_min_attempts,
+    get_job_max_wait_s,
+    get_job_poll_interval_s,
+    get_question_max_age_s,
+)
+from jeopardy_game.core.serialization import dumps
+from jeopardy_game.db.queries import (
+    bucket_id_bounds_stmt,
+    bucket_question_from_id_stmt,
+    random_question_stmt,
+    search_questions_stmt,
+)
+from jeopardy_game.db.snapshot import QuestionSnapshot
+from jeopardy_game.models.question import Question, QuestionRecord
+from jeopardy_game.models.verification_job import TERMINAL_STATUSES
 from jeopardy_game.schemas.question import QuestionOut
-from jeopardy_game.schemas.verify import VerifyAnswerIn, VerifyAnswerOut
-from jeopardy_game.services.answer_verification import verify_answer_for_question
+from jeopardy_game.schemas.verify import VerifyAnswerIn, VerifyAnswerOut, VerifyJobOut
+from jeopardy_game.services.answer_verification import VerificationOutcome, verify_answer_outcome
+from jeopardy_game.services.attempt_log import AttemptLog
+from jeopardy_game.services.question_cache import QuestionCache
+from jeopardy_game.services.question_stats import DIFFICULTY_LEVELS, difficulty_range
+from jeopardy_game.services.verification_jobs import enqueue_job, job_out, read_job
 
 router = APIRouter(tags=["questions"])
 
@@ -50,7 +79,7 @@ def _parse_value_to_int(value_raw: str) -> int:
     return value_int
 
 
-def _to_question_out(q: Question) -> QuestionOut:
+def _to_question_out(q: Question | QuestionRecord) -> QuestionOut:
     """Map ORM Question -> API response schema (without leaking answer)."""
     return QuestionOut(
         question_id=q.id,
@@ -61,6 +90,22 @@ def _to_question_out(q: Question) -> QuestionOut:
     )
 
 
+def _random_question_from_db(db: Session, **bucket) -> Question | None:
+    """Random question in a bucket.
+
+    SQLite draws a random id between the bucket's lowest and highest id and
+    takes the next question at or after it: two index seeks instead of
+    sorting the whole bucket. Questions that follow a gap in the bucket's ids
+    are drawn more often, which is fine for picking a clue.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return db.execute(random_question_stmt(**bucket)).scalars().first()
+    lo, hi = db.execute(bucket_id_bounds_stmt(**bucket)).one()
+    if lo is None:
+        return None
+    return db.execute(bucket_question_from_id_stmt(random.randint(lo, hi), **bucket)).scalars().first()
+
+
 @router.get(
     "/question/",
     response_model=QuestionOut,
@@ -69,25 +114,41 @@ def _to_question_out(q: Question) -> QuestionOut:
 def get_random_question(
     round_: str = Query(..., alias="round", description='One of: "Jeopardy!", "Double Jeopardy!", "Final Jeopardy!"'),
     value: str = Query(..., description='Question value like "$200"'),
-    db: Session = Depends(get_db),
+    difficulty: str | None = Query(None, description='Optional: "easy", "medium" or "hard" (from player accuracy)'),
+    db: Session = Depends(get_read_db),
+    snapshot: QuestionSnapshot | None = Depends(get_snapshot),
+    cache: QuestionCache = Depends(get_question_cache),
 ) -> QuestionOut:
-    """Return a random question matching the given round and value."""
+    """Return a random question matching the given round and value.
+
+    Served from the memory-mapped snapshot when configured, otherwise from the DB.
+    Difficulty-filtered requests always go to the DB, which holds the accuracy stats.
+    """
     if round_ not in ALLOWED_ROUNDS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid round. Allowed values: {sorted(ALLOWED_ROUNDS)}",
         )
+    if difficulty is not None and difficulty not in DIFFICULTY_LEVELS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid difficulty. Allowed values: {list(DIFFICULTY_LEVELS)}",
+        )
 
     value_int = _parse_value_to_int(value)
 
-    stmt = (
-        select(Question)
-        .where(Question.round == round_)
-        .where(Question.value == value_int)
-        .order_by(func.random())
-        .limit(1)
-    )
-    q = db.execute(stmt).scalars().first()
+    q: Question | QuestionRecord | None = None
+    snapshot = _current_snapshot(snapshot, db, cache) if difficulty is None else None
+    if snapshot is not None:
+        q = snapshot.random_question(round_name=round_, value=value_int)
+    if q is None:
+        q = _random_question_from_db(
+            db,
+            round_name=round_,
+            value=value_int,
+            accuracy_range=difficulty_range(difficulty) if difficulty else None,
+            min_attempts=get_difficulty_min_attempts(),
+        )
     if q is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,11 +158,158 @@ def get_random_question(
     return _to_question_out(q)
 
 
+@router.get(
+    "/questions/search",
+    response_model=list[QuestionOut],
+    summary="Search question text and categories",
+)
+def search_questions(
+    q: str = Query(..., min_length=2, max_length=200, description="Words to match; the last may be a prefix"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+) -> list[QuestionOut]:
+    """Full-text search over clues (FTS5 on SQLite, ILIKE elsewhere). Answers are not searched."""
+    if not q.split():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Query must contain a word.")
+    stmt = search_questions_stmt(q, dialect=db.get_bind().dialect.name, limit=limit)
+    return [_to_question_out(row) for row in db.execute(stmt).scalars()]
+
+
+def _current_snapshot(
+    snapshot: QuestionSnapshot | None, db: Session, cache: QuestionCache
+) -> QuestionSnapshot | None:
+    """The snapshot, unless it was exported from an older dataset version than the DB holds.
+
+    If the DB version cannot be read, the snapshot is trusted: it keeps serving
+    while the database is down.
+    """
+    if snapshot is None:
+        return None
+    if snapshot.dataset_version != cache.dataset_version(db, default=snapshot.dataset_version):
+        return None
+    return snapshot
+
+
+def _lookup_question(
+    question_id: int, db: Session, snapshot: QuestionSnapshot | None, cache: QuestionCache
+) -> QuestionRecord | None:
+    """Find a question by id: snapshot first, then the in-process LRU (which falls back to the DB)."""
+    snapshot = _current_snapshot(snapshot, db, cache)
+    if snapshot is not None:
+        q = snapshot.get(question_id)
+        if q is not None:
+            return q
+    return cache.get(db, question_id)
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag: hash of the exact response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses weak comparison, so a W/ prefix on the client's tag is ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@router.get(
+    "/question/{question_id}",
+    response_model=QuestionOut,
+    summary="Get a question by id (cacheable)",
+    responses={304: {"description": "Not modified (ETag matched If-None-Match)"}},
+)
+def get_question(
+    question_id: int,
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+    db: Session = Depends(get_read_db),
+    snapshot: QuestionSnapshot | None = Depends(get_snapshot),
+    cache: QuestionCache = Depends(get_question_cache),
+) -> Response:
+    """Return a question by id with a content-hash ETag and a long Cache-Control.
+
+    Clues only change when the dataset is reloaded, so HTTP caches can keep the
+    response for `JEP_QUESTION_MAX_AGE_S` and revalidate with If-None-Match.
+    """
+    q = _lookup_question(question_id, db, snapshot, cache)
+    if q is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found.")
+
+    body = dumps(_to_question_out(q).model_dump())
+    etag = _etag(body)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={get_question_max_age_s()}"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _server_timing(outcome: VerificationOutcome) -> str:
+    metrics = [f"verify-{stage};dur={ms:.1f}" for stage, ms in outcome.stage_ms.items()]
+    metrics.append(f'verify;dur={outcome.latency_ms:.1f};desc="{outcome.path}"')
+    return ", ".join(metrics)
+
 
 @router.post("/verify-answer/", response_model=VerifyAnswerOut)
-def verify_answer(payload: VerifyAnswerIn, db: Session = Depends(get_db)) -> VerifyAnswerOut:
-    q = db.get(Question, payload.question_id)
+def verify_answer(
+    payload: VerifyAnswerIn,
+    response: Response,
+    db: Session = Depends(get_read_db),
+    snapshot: QuestionSnapshot | None = Depends(get_snapshot),
+    cache: QuestionCache = Depends(get_question_cache),
+    attempt_log: AttemptLog = Depends(get_attempt_log),
+) -> VerifyAnswerOut:
+    q = _lookup_question(payload.question_id, db, snapshot, cache)
     if q is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found.")
 
-    return verify_answer_for_question(question=q, user_answer=payload.user_answer)
+    outcome = verify_answer_outcome(question=q, user_answer=payload.user_answer)
+    attempt_log.record_outcome(question_id=q.id, user_answer=payload.user_answer, outcome=outcome, source="api")
+    response.headers["X-Verify-Tier"] = outcome.tier
+    response.headers["Server-Timing"] = _server_timing(outcome)
+    return outcome.out
+
+
+@router.post(
+    "/verify-answer/jobs",
+    response_model=VerifyJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue an answer verification; poll the returned job for the verdict",
+)
+def create_verify_job(
+    payload: VerifyAnswerIn,
+    response: Response,
+    db: Session = Depends(get_db),
+    snapshot: QuestionSnapshot | None = Depends(get_snapshot),
+    cache: QuestionCache = Depends(get_question_cache),
+) -> VerifyJobOut:
+    if _lookup_question(payload.question_id, db, snapshot, cache) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found.")
+
+    job = enqueue_job(db, question_id=payload.question_id, user_answer=payload.user_answer)
+    response.headers["Location"] = f"/verify-answer/jobs/{job.id}"
+    return job_out(job)
+
+
+@router.get("/verify-answer/jobs/{job_id}", response_model=VerifyJobOut, summary="Get (or long-poll) a verification job")
+async def get_verify_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to wait for the job to finish (capped by JEP_JOB_MAX_WAIT_S)"),
+    db: Session = Depends(get_db),
+) -> VerifyJobOut:
+    """Return the job's state; with `wait`, hold the request until it finishes or the wait elapses.
+
+    The wait happens on the event loop, so long polls do not occupy threadpool workers.
+    """
+    deadline = time.monotonic() + min(wait, get_job_max_wait_s())
+    poll_s = get_job_poll_interval_s()
+    while True:
+        job = await run_in_threadpool(read_job, db, job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+        remaining = deadline - time.monotonic()
+        if job.status in TERMINAL_STATUSES or remaining <= 0:
+            return job
+        await asyncio.sleep(min(poll_s, remaining))
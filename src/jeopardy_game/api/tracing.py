@@ -0,0 +1,56 @@
+"""ASGI middleware that opens the root span of each request's trace."""
+
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from jeopardy_game.core import tracing
+
+
+class TracingMiddleware:
+    """Trace each HTTP request, continuing an incoming W3C `traceparent`.
+
+    The root span is named after the matched route template once routing has
+    run (e.g. ``POST /verify-answer/``), and sampled responses carry the trace
+    id in ``X-Trace-Id`` so a slow request can be looked up.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        method, path = scope["method"], scope["path"]
+        with tracing.start_trace(
+            f"{method} {path}", traceparent=traceparent, **{"http.method": method, "http.target": path}
+        ) as span:
+            if not isinstance(span, tracing.Span):
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.status_code", status)
+                    if status >= 500:
+                        span.error = True
+                    headers = [*message.get("headers", []), (b"x-trace-id", span.trace_id.encode())]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = scope.get("route")
+                if route is not None and hasattr(route, "path"):
+                    span.name = f"{method} {route.path}"
+                    span.set_attribute("http.route", route.path)
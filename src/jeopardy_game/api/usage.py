@@ -0,0 +1,28 @@
+"""ASGI middleware that labels LLM token usage with the request's route class."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from jeopardy_game.api.admission import route_class
+from jeopardy_game.services.usage import reset_route_label, set_route_label
+
+
+class UsageLabelMiddleware:
+    """Set the usage route label for the duration of each HTTP request."""
+
+    def __init__(self, app: ASGIApp, *, classify: Callable[[str], str | None] = route_class) -> None:
+        self.app = app
+        self._classify = classify
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = set_route_label(self._classify(scope["path"]) or "other")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_route_label(token)
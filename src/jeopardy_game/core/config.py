@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 
 
@@ -12,6 +13,16 @@ def get_database_url() -> str:
     )
 
 
+def get_database_replica_urls() -> list[str]:
+    # Comma-separated read replica URLs; reads use the primary when empty.
+    raw = os.environ.get("DATABASE_REPLICA_URLS", "")
+    return [url.strip() for url in raw.split(",") if url.strip()]
+
+
+def get_replica_cooldown_s() -> float:
+    return float(os.environ.get("JEP_REPLICA_COOLDOWN_S", "30"))
+
+
 def get_openai_api_key() -> str | None:
     return os.environ.get("OPENAI_API_KEY")
 
@@ -23,3 +34,233 @@ def get_openai_model() -> str:
 
 def get_openai_base_url() -> str:
     return os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+
+def get_snapshot_path() -> str | None:
+    # Optional memory-mapped question snapshot written by the loader.
+    return os.environ.get("JEP_SNAPSHOT_PATH") or None
+
+
+def get_questions_partitioning() -> str:
+    # "none" | "round" | "round_value" (Postgres only; applied by the loader).
+    return os.environ.get("JEP_PARTITION_QUESTIONS", "none").strip().lower()
+
+
+def get_partition_value_bounds() -> list[int]:
+    # Value range boundaries for "round_value" partitioning, e.g. "0,400,800,1201".
+    raw = os.environ.get("JEP_PARTITION_VALUE_BOUNDS", "0,400,800,1201")
+    return [int(b) for b in raw.split(",") if b.strip()]
+
+
+_ADMISSION_DEFAULTS: dict[str, tuple[int, int]] = {
+    # route class -> (max concurrent requests, max queued requests)
+    "agent": (8, 16),
+    "job_poll": (512, 256),
+    "jobs": (64, 256),
+    "verify": (32, 64),
+    "question": (64, 256),
+}
+
+
+def get_admission_limits(route_class: str) -> tuple[int, int]:
+    # e.g. JEP_ADMISSION_AGENT_CONCURRENCY=8, JEP_ADMISSION_AGENT_QUEUE=16
+    concurrency, queue = _ADMISSION_DEFAULTS.get(route_class, (64, 256))
+    prefix = f"JEP_ADMISSION_{route_class.upper()}"
+    return (
+        int(os.environ.get(f"{prefix}_CONCURRENCY", concurrency)),
+        int(os.environ.get(f"{prefix}_QUEUE", queue)),
+    )
+
+
+def get_admission_queue_timeout_s() -> float:
+    return float(os.environ.get("JEP_ADMISSION_QUEUE_TIMEOUT_S", "5"))
+
+
+def get_admission_retry_after_s() -> int:
+    return int(os.environ.get("JEP_ADMISSION_RETRY_AFTER_S", "1"))
+
+
+def get_threadpool_reserve() -> int:
+    # Worker threads on top of the threadpool-bound admission limits
+    return int(os.environ.get("JEP_THREADPOOL_RESERVE", "16"))
+
+
+def get_llm_max_concurrency() -> int:
+    # Concurrent LLM verifications per worker; beyond this, verification is heuristic-only.
+    return int(os.environ.get("JEP_LLM_MAX_CONCURRENCY", "16"))
+
+
+def get_question_cache_size() -> int:
+    # Max questions kept in the per-process LRU used by /question/{id} and /verify-answer/.
+    return int(os.environ.get("JEP_QUESTION_CACHE_SIZE", "10000"))
+
+
+def get_dataset_version_check_s() -> float:
+    # How often the LRU re-reads dataset_meta to notice a reload.
+    return float(os.environ.get("JEP_DATASET_VERSION_CHECK_S", "30"))
+
+
+def get_question_max_age_s() -> int:
+    # Cache-Control max-age for GET /question/{id}.
+    return int(os.environ.get("JEP_QUESTION_MAX_AGE_S", "86400"))
+
+
+def get_trace_exporter() -> str:
+    # "none" | "jsonl" | "otlp"
+    return os.environ.get("JEP_TRACE_EXPORTER", "none").strip().lower()
+
+
+def get_trace_file() -> str:
+    return os.environ.get("JEP_TRACE_FILE", "traces.jsonl")
+
+
+def get_trace_otlp_endpoint() -> str:
+    return os.environ.get("JEP_TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+
+
+def get_trace_sample_rate() -> float:
+    # Head sampling: fraction of new traces recorded (incoming traceparent flags take precedence).
+    return float(os.environ.get("JEP_TRACE_SAMPLE_RATE", "0.1"))
+
+
+def get_job_max_wait_s() -> float:
+    # Upper bound for ?wait= on GET /verify-answer/jobs/{id} (long polling).
+    return float(os.environ.get("JEP_JOB_MAX_WAIT_S", "30"))
+
+
+def get_job_poll_interval_s() -> float:
+    # How often long polls re-read a job and idle workers look for new ones.
+    return float(os.environ.get("JEP_JOB_POLL_INTERVAL_S", "0.5"))
+
+
+def get_job_lease_s() -> float:
+    # A running job not finished within this many seconds may be reclaimed by another worker.
+    return float(os.environ.get("JEP_JOB_LEASE_S", "120"))
+
+
+def get_job_max_attempts() -> int:
+    return int(os.environ.get("JEP_JOB_MAX_ATTEMPTS", "3"))
+
+
+def get_attempt_log_enabled() -> bool:
+    return os.environ.get("JEP_ATTEMPT_LOG", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_attempt_log_buffer_size() -> int:
+    # Max attempts held in memory awaiting a flush; beyond this new attempts are dropped.
+    return int(os.environ.get("JEP_ATTEMPT_LOG_BUFFER", "50000"))
+
+
+def get_attempt_log_batch_size() -> int:
+    return int(os.environ.get("JEP_ATTEMPT_LOG_BATCH", "1000"))
+
+
+def get_attempt_log_flush_interval_s() -> float:
+    return float(os.environ.get("JEP_ATTEMPT_LOG_FLUSH_S", "1.0"))
+
+
+def get_difficulty_bounds() -> tuple[float, float]:
+    # Accuracy cut-offs: below the first is "hard", at/above the second is "easy".
+    hard_below, easy_from = (float(b) for b in os.environ.get("JEP_DIFFICULTY_BOUNDS", "0.3,0.7").split(","))
+    return hard_below, easy_from
+
+
+def get_difficulty_min_attempts() -> int:
+    # Questions with fewer logged attempts have no difficulty yet.
+    return int(os.environ.get("JEP_DIFFICULTY_MIN_ATTEMPTS", "5"))
+
+
+# USD per 1M tokens: (input, cached input, output)
+_LLM_PRICES: dict[str, tuple[float, float, float]] = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+}
+
+
+def get_llm_prices() -> dict[str, tuple[float, float, float]]:
+    # Override or extend with JSON, e.g. JEP_LLM_PRICES='{"my-model": [1.0, 0.5, 4.0]}'
+    prices = dict(_LLM_PRICES)
+    raw = os.environ.get("JEP_LLM_PRICES")
+    if raw:
+        prices.update({model: tuple(p) for model, p in json.loads(raw).items()})
+    return prices
+
+
+def get_verify_pipeline() -> list[str]:
+    # Verification stages in order, cheapest first.
+    raw = os.environ.get("JEP_VERIFY_PIPELINE", "exact,heuristic,llm")
+    return [s.strip().lower() for s in raw.split(",") if s.strip()]
+
+
+def get_verify_deadline_s() -> float:
+    # Cap on total verification time per request, across all stages.
+    return float(os.environ.get("JEP_VERIFY_DEADLINE_S", "12"))
+
+
+# (timeout seconds, min confidence to decide)
+_VERIFY_STAGE_DEFAULTS: dict[str, tuple[float, float]] = {
+    "exact": (0.05, 1.0),
+    "heuristic": (0.05, 0.9),
+    "llm": (10.0, 0.5),
+}
+
+
+def get_verify_stage_settings(stage: str) -> tuple[float, float]:
+    # e.g. JEP_VERIFY_LLM_TIMEOUT_S=5, JEP_VERIFY_HEURISTIC_MIN_CONFIDENCE=0.4
+    timeout_s, min_confidence = _VERIFY_STAGE_DEFAULTS.get(stage, (1.0, 0.5))
+    prefix = f"JEP_VERIFY_{stage.upper()}"
+    return (
+        float(os.environ.get(f"{prefix}_TIMEOUT_S", timeout_s)),
+        float(os.environ.get(f"{prefix}_MIN_CONFIDENCE", min_confidence)),
+    )
+
+
+def get_verify_speculative_stages() -> set[str]:
+    # Stages started alongside the cheaper ones and cancelled if those decide first.
+    # e.g. JEP_VERIFY_SPECULATIVE=llm
+    return {s.strip().lower() for s in os.environ.get("JEP_VERIFY_SPECULATIVE", "").split(",") if s.strip()}
+
+
+def get_db_pool_size() -> int:
+    # Persistent connections per engine (per API worker process).
+    return int(os.environ.get("JEP_DB_POOL_SIZE", "5"))
+
+
+def get_db_max_overflow() -> int:
+    # Extra short-lived connections allowed beyond the pool size under bursts.
+    return int(os.environ.get("JEP_DB_MAX_OVERFLOW", "10"))
+
+
+def get_db_pool_timeout_s() -> float:
+    # How long a checkout waits for a free connection before failing.
+    return float(os.environ.get("JEP_DB_POOL_TIMEOUT_S", "10"))
+
+
+def get_db_pool_recycle_s() -> int:
+    # Replace connections older than this (-1: never); keep below server/proxy idle timeouts.
+    return int(os.environ.get("JEP_DB_POOL_RECYCLE_S", "1800"))
+
+
+def get_db_pre_ping() -> str:
+    # "always" | "idle" (only connections idle longer than JEP_DB_PING_IDLE_S) | "never"
+    return os.environ.get("JEP_DB_PRE_PING", "idle").strip().lower()
+
+
+def get_db_ping_idle_s() -> float:
+    return float(os.environ.get("JEP_DB_PING_IDLE_S", "30"))
+
+
+def get_db_pgbouncer() -> bool:
+    # Behind a transaction-mode pooler: no server-side prepared statements unless
+    # JEP_DB_PREPARE_THRESHOLD is set (PgBouncer >= 1.21 with max_prepared_statements).
+    return os.environ.get("JEP_DB_PGBOUNCER", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_db_prepare_threshold() -> int | None:
+    # psycopg prepares a query after this many executions on a connection; "none" disables.
+    raw = os.environ.get("JEP_DB_PREPARE_THRESHOLD")
+    if raw is None:
+        return None if get_db_pgbouncer() else 5
+    return None if raw.strip().lower() in ("", "none", "off") else int(raw)
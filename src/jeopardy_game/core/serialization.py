@@ -0,0 +1,59 @@
+"""JSON serialization backend shared by the HTTP client and API responses.
+
+Uses `orjson` when it is installed (``pip install jeopardy-game[fast]``) and
+falls back to the stdlib `json` module otherwise. Set ``JEP_JSON_BACKEND=json``
+to force the stdlib backend.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:  # optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _select_backend() -> str:
+    requested = os.environ.get("JEP_JSON_BACKEND", "auto").strip().lower()
+    if requested == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+JSON_BACKEND: str = _select_backend()
+
+
+if JSON_BACKEND == "orjson":
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize `obj` to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize `obj` to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """Parse JSON from bytes or str."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the configured serialization backend."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,446 @@
+"""Lightweight request tracing.
+
+Spans nest through a context variable, so they follow a request across the
+route handler, the threadpool it runs in and the services it calls. Traces
+are head-sampled when the root span starts (an incoming W3C `traceparent`
+header decides instead, when present); unsampled traces and code running
+outside a trace get a shared no-op span, which costs one context lookup.
+
+Finished spans go to an exporter: a local JSONL file, or an OTLP/HTTP (JSON)
+collector endpoint. Both write from a background thread, so neither the event
+loop nor request threads wait on file or network I/O. Configure with `JEP_TRACE_EXPORTER` ("none", "jsonl",
+"otlp"), `JEP_TRACE_FILE`, `JEP_TRACE_OTLP_ENDPOINT` and
+`JEP_TRACE_SAMPLE_RATE`.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+import requests
+
+from jeopardy_game.core.config import (
+    get_trace_exporter,
+    get_trace_file,
+    get_trace_otlp_endpoint,
+    get_trace_sample_rate,
+)
+from jeopardy_game.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "jeopardy-game"
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    kind: str = "internal"  # "internal" | "server" | "client"
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.error = True
+        self.attributes["error.type"] = type(exc).__name__
+        self.attributes["error.message"] = str(exc)[:500]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in for spans outside a sampled trace."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: ContextVar[Span | None] = ContextVar("jep_current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Return the active span, or None outside a sampled trace."""
+    return _current.get()
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """Parse a W3C `traceparent` into (trace_id, parent_span_id, sampled)."""
+    if not header:
+        return None
+    match = _TRACEPARENT_RE.match(header.strip().lower())
+    if not match:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class BatchSpanExporter:
+    """Queue finished spans for a background thread that writes them in batches.
+
+    The queue is bounded; spans are dropped (and counted) rather than
+    blocking the caller when the sink falls behind. Subclasses implement
+    `_write` (and `_close` for resources owned by the worker thread).
+    """
+
+    def __init__(self, *, name: str, max_queue: int, batch_size: int, interval_s: float) -> None:
+        self.batch_size = batch_size
+        self.interval_s = interval_s
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._closed = False
+        self._queue: queue.Queue[Span | None] = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        if self._closed:
+            self._drop(1)
+            return
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self._drop(1)
+
+    def _drop(self, n: int) -> None:
+        # Request threads and the worker both count drops; `+=` is not atomic
+        with self._dropped_lock:
+            self.dropped += n
+
+    def shutdown(self, timeout_s: float = 5.0) -> None:
+        """Write the spans already queued, then stop the worker (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout_s)
+        except queue.Full:
+            logger.warning("Span exporter did not drain within %.0fs; queued spans are lost", timeout_s)
+            return
+        self._thread.join(timeout=timeout_s)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                batch: list[Span] = []
+                deadline = time.monotonic() + self.interval_s
+                stop = False
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                if batch:
+                    try:
+                        self._write(batch)
+                    except Exception:
+                        self._drop(len(batch))
+                        logger.exception("Dropped %d spans; export failed", len(batch))
+                if stop:
+                    return
+        finally:
+            self._close()
+
+    def _write(self, spans: list[Span]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+
+class JsonlExporter(BatchSpanExporter):
+    """Append one JSON object per finished span to a local file."""
+
+    def __init__(self, path: str, *, max_queue: int = 4096, batch_size: int = 512, interval_s: float = 1.0) -> None:
+        self.path = path
+        self._fh = open(path, "ab")
+        super().__init__(name="jsonl-exporter", max_queue=max_queue, batch_size=batch_size, interval_s=interval_s)
+
+    def _write(self, spans: list[Span]) -> None:
+        self._fh.write(b"".join(dumps(s.to_dict()) + b"\n" for s in spans))
+        self._fh.flush()
+
+    def _close(self) -> None:
+        self._fh.close()
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_OTLP_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+class OtlpHttpExporter(BatchSpanExporter):
+    """Batch spans to an OTLP/HTTP collector (JSON encoding) from a background thread."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str = SERVICE_NAME,
+        max_queue: int = 4096,
+        batch_size: int = 512,
+        interval_s: float = 2.0,
+        timeout_s: float = 5.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout_s = timeout_s
+        self._session = requests.Session()
+        super().__init__(name="otlp-exporter", max_queue=max_queue, batch_size=batch_size, interval_s=interval_s)
+
+    def _close(self) -> None:
+        self._session.close()
+
+    def _write(self, spans: list[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "jeopardy_game"},
+                            "spans": [
+                                {
+                                    "traceId": s.trace_id,
+                                    "spanId": s.span_id,
+                                    "parentSpanId": s.parent_id or "",
+                                    "name": s.name,
+                                    "kind": _OTLP_KINDS.get(s.kind, 1),
+                                    "startTimeUnixNano": str(s.start_ns),
+                                    "endTimeUnixNano": str(s.end_ns),
+                                    "attributes": [
+                                        {"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()
+                                    ],
+                                    "status": {"code": 2 if s.error else 1},
+                                }
+                                for s in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            resp = self._session.post(
+                self.endpoint,
+                data=dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout_s,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            self._drop(len(spans))
+            logger.warning("Dropped %d spans; OTLP export failed: %s", len(spans), exc)
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None,
+        *,
+        sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self._rng = rng
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def shutdown(self) -> None:
+        """Flush and close the exporter; spans finished afterwards are dropped."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+    @contextmanager
+    def start_trace(
+        self, name: str, *, traceparent: str | None = None, **attributes: Any
+    ) -> Iterator[Span | _NoopSpan]:
+        """Open the root span of a trace (continuing `traceparent` if given)."""
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id, sampled = _new_id(16), None, self._rng() < self.sample_rate
+        if not sampled:
+            yield NOOP_SPAN
+            return
+        root = Span(name, trace_id, _new_id(8), parent_id, time.time_ns(), kind="server", attributes=attributes)
+        with self._activate(root) as span:
+            yield span
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+        """Open a child of the current span; a no-op outside a sampled trace."""
+        parent = _current.get()
+        if parent is None:
+            yield NOOP_SPAN
+            return
+        child = Span(name, parent.trace_id, _new_id(8), parent.span_id, time.time_ns(), attributes=attributes)
+        with self._activate(child) as span:
+            yield span
+
+    @contextmanager
+    def _activate(self, span: Span) -> Iterator[Span]:
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(span)
+
+    def start_span(self, name: str, **attributes: Any) -> Span | None:
+        """Start a child span without making it current (for callback-style hooks)."""
+        parent = _current.get()
+        if parent is None:
+            return None
+        return Span(name, parent.trace_id, _new_id(8), parent.span_id, time.time_ns(), attributes=attributes)
+
+    def finish(self, span: Span) -> None:
+        """End `span` and export it."""
+        span.end_ns = time.time_ns()
+        if self.exporter is not None:
+            try:
+                self.exporter.export(span)
+            except Exception:
+                logger.exception("Span export failed")
+
+
+def build_tracer() -> Tracer:
+    """Create the tracer described by configuration."""
+    kind = get_trace_exporter()
+    exporter: SpanExporter | None
+    if kind == "jsonl":
+        exporter = JsonlExporter(get_trace_file())
+    elif kind == "otlp":
+        exporter = OtlpHttpExporter(get_trace_otlp_endpoint())
+    elif kind == "none":
+        exporter = None
+    else:
+        raise RuntimeError(f"Unknown JEP_TRACE_EXPORTER={kind!r}")
+    return Tracer(exporter, sample_rate=get_trace_sample_rate())
+
+
+_tracer = build_tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Replace the process tracer; returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def start_trace(name: str, *, traceparent: str | None = None, **attributes: Any):
+    return _tracer.start_trace(name, traceparent=traceparent, **attributes)
+
+
+def span(name: str, **attributes: Any):
+    return _tracer.span(name, **attributes)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator: run the function inside a span called `name`."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with _tracer.span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
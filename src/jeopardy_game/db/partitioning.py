@@ -0,0 +1,138 @@
+"""Postgres declarative partitioning for the `questions` table.
+
+The ORM model keeps `id` as its mapper primary key, so it reads and writes a
+partitioned table unchanged. Postgres requires the partition key in every
+unique constraint, so the physical primary key becomes ``(id, round)`` (plus
+``value`` when sub-partitioned by value range); ids still come from a single
+sequence and stay unique in practice.
+
+For the same reason no table declares a foreign key to `questions.id`: a
+foreign key needs a unique constraint on exactly the referenced columns, and
+a partitioned `questions` has none on `id` alone. Tables that store a
+`question_id` (agent answers, verification jobs and attempts) leave it
+unconstrained in every layout, so the schema doesn't depend on the
+partitioning mode, and their readers treat an unknown id as a missing
+question.
+
+Layout::
+
+    questions                      PARTITION BY LIST (round)
+      questions_jeopardy           FOR VALUES IN ('Jeopardy!')        [PARTITION BY RANGE (value)]
+      questions_double_jeopardy    FOR VALUES IN ('Double Jeopardy!') [...]
+      questions_final_jeopardy     FOR VALUES IN ('Final Jeopardy!')  [...]
+      questions_default            DEFAULT
+
+Filtering on `round` (and `value`) lets the planner prune to a single
+partition, so bucket queries only touch that partition's indexes. The
+separate `round` and `(round, value)` indexes are dropped: pruning does their
+job, and the per-partition `value` index covers the bucket lookup. Lookups by
+id alone (`/verify-answer/`) probe each partition's primary key index.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from itertools import pairwise
+
+from sqlalchemy import Engine, inspect, text
+
+PARTITION_ROUNDS: tuple[str, ...] = ("Jeopardy!", "Double Jeopardy!", "Final Jeopardy!")
+
+# Same names as the indexes SQLAlchemy creates for the unpartitioned model.
+_INDEXES: tuple[tuple[str, str], ...] = (
+    ("show_number", "show_number"),
+    ("air_date", "air_date"),
+    ("category", "category"),
+    ("value", "value"),
+)
+# Redundant once rows are partitioned by round: pruning replaces them.
+_ROUND_INDEXES: tuple[tuple[str, str], ...] = (
+    ("round", "round"),
+    ("round_value", "round, value"),
+)
+
+
+def _slug(round_name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", round_name.lower()).strip("_")
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def questions_table_ddl(
+    table: str = "questions",
+    *,
+    by_round: bool = True,
+    value_bounds: Sequence[int] | None = None,
+) -> list[str]:
+    """Return the DDL statements that create the questions table.
+
+    Args:
+        table: Table name, optionally schema-qualified.
+        by_round: Partition by LIST (round). When False a plain heap is created
+            (used as the baseline in benchmarks).
+        value_bounds: Ascending value boundaries; each round partition is then
+            sub-partitioned by RANGE (value) into ``[b0, b1), [b1, b2), ...``.
+    """
+    bounds = sorted(value_bounds or [])
+    if bounds and not by_round:
+        raise ValueError("value_bounds requires by_round=True")
+
+    if not by_round:
+        pk = "id"
+    else:
+        pk = "id, round, value" if bounds else "id, round"
+    stmts = [
+        f"CREATE TABLE {table} ("
+        " id serial NOT NULL,"
+        " show_number integer NOT NULL,"
+        " air_date date NOT NULL,"
+        " round varchar(32) NOT NULL,"
+        " category varchar(128) NOT NULL,"
+        " value integer NOT NULL,"
+        " question text NOT NULL,"
+        " answer text NOT NULL,"
+        f" PRIMARY KEY ({pk})"
+        ")" + (" PARTITION BY LIST (round)" if by_round else "")
+    ]
+
+    if by_round:
+        sub = " PARTITION BY RANGE (value)" if bounds else ""
+        for round_name in PARTITION_ROUNDS:
+            part = f"{table}_{_slug(round_name)}"
+            stmts.append(
+                f"CREATE TABLE {part} PARTITION OF {table} FOR VALUES IN ({_quote(round_name)}){sub}"
+            )
+            if bounds:
+                for lo, hi in pairwise(bounds):
+                    stmts.append(
+                        f"CREATE TABLE {part}_v{lo} PARTITION OF {part} FOR VALUES FROM ({lo}) TO ({hi})"
+                    )
+                stmts.append(f"CREATE TABLE {part}_vdefault PARTITION OF {part} DEFAULT")
+        stmts.append(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    bare = table.rsplit(".", 1)[-1]
+    indexes = _INDEXES if by_round else _INDEXES + _ROUND_INDEXES
+    for suffix, cols in indexes:
+        stmts.append(f"CREATE INDEX ix_{bare}_{suffix} ON {table} ({cols})")
+
+    return stmts
+
+
+def create_partitioned_questions_table(engine: Engine, *, value_bounds: Sequence[int] | None = None) -> bool:
+    """Create `questions` as a partitioned table if it does not exist yet.
+
+    Must run before ``Base.metadata.create_all`` (which then skips the table).
+    Returns True if the table was created.
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("Table partitioning requires PostgreSQL.")
+    if inspect(engine).has_table("questions"):
+        return False
+
+    with engine.begin() as conn:
+        for stmt in questions_table_ddl(value_bounds=value_bounds):
+            conn.execute(text(stmt))
+    return True
@@ -0,0 +1,198 @@
+"""Connection pool settings, instrumentation and prepared-statement reuse.
+
+`PoolSettings.from_config()` reads the `JEP_DB_*` settings. `build_engine`
+(db/session.py) applies them to every server-backed engine:
+
+- `InstrumentedQueuePool` counts checkouts and times how long each waits
+  for a connection. The counts are served at `/metrics/db-pool`, and each
+  wait is traced as a `db.checkout` span.
+- Pre-ping "idle" checks only connections that sat unused for longer than
+  `ping_idle_s`. Busy connections skip the extra round trip that "always"
+  (SQLAlchemy's `pool_pre_ping`) makes on every checkout.
+- psycopg prepares any statement that runs `prepare_threshold` times on a
+  connection. Hot statements (marked with `prepared()`) are prepared on
+  first use.
+
+Behind a transaction-mode pooler (`pgbouncer=True`) the next execute may run
+on a different server connection, so nothing is prepared, hot statements
+included, unless `prepare_threshold` is set explicitly (PgBouncer 1.21+ with
+`max_prepared_statements`). Pre-ping is left as configured: a ping only
+reaches PgBouncer, not a server connection, but "idle" still catches a
+restarted pooler or a connection dropped by a load balancer, for the cost of
+one round trip after `ping_idle_s`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Final, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import Pool, QueuePool
+from sqlalchemy.sql import Executable
+
+from jeopardy_game.core import tracing
+from jeopardy_game.core.config import (
+    get_db_max_overflow,
+    get_db_pgbouncer,
+    get_db_ping_idle_s,
+    get_db_pool_recycle_s,
+    get_db_pool_size,
+    get_db_pool_timeout_s,
+    get_db_pre_ping,
+    get_db_prepare_threshold,
+)
+
+PRE_PING_STRATEGIES: Final[tuple[str, ...]] = ("always", "idle", "never")
+
+# Execution option marking a statement for server-side preparation on first use
+PREPARE_OPTION: Final[str] = "jep_prepare"
+
+_CHECKIN_AT: Final[str] = "jep_checkin_at"
+
+E = TypeVar("E", bound=Executable)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolSettings:
+    """Pool and driver settings for server-backed engines (see the module docstring)."""
+
+    size: int
+    max_overflow: int
+    timeout_s: float
+    recycle_s: int
+    pre_ping: str
+    ping_idle_s: float
+    prepare_threshold: int | None
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_config(cls) -> PoolSettings:
+        pre_ping = get_db_pre_ping()
+        if pre_ping not in PRE_PING_STRATEGIES:
+            raise RuntimeError(f"Unknown JEP_DB_PRE_PING={pre_ping!r}; use one of {PRE_PING_STRATEGIES}")
+        return cls(
+            size=get_db_pool_size(),
+            max_overflow=get_db_max_overflow(),
+            timeout_s=get_db_pool_timeout_s(),
+            recycle_s=get_db_pool_recycle_s(),
+            pre_ping=pre_ping,
+            ping_idle_s=get_db_ping_idle_s(),
+            prepare_threshold=get_db_prepare_threshold(),
+            pgbouncer=get_db_pgbouncer(),
+        )
+
+    @property
+    def prepares_statements(self) -> bool:
+        """Whether psycopg may prepare statements server-side (auto or for `prepared()` ones)."""
+        return self.prepare_threshold is not None or not self.pgbouncer
+
+    def engine_kwargs(self, driver: str) -> dict[str, Any]:
+        """`create_engine` arguments for a server-backed database."""
+        kwargs: dict[str, Any] = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout_s,
+            "pool_recycle": self.recycle_s,
+            "pool_pre_ping": self.pre_ping == "always",
+        }
+        if driver == "psycopg":
+            kwargs["connect_args"] = {"prepare_threshold": self.prepare_threshold}
+        return kwargs
+
+
+# PEP 695 `def prepared[E: Executable]` needs Python 3.12; the package supports 3.11
+def prepared(stmt: E) -> E:  # noqa: UP047
+    """Mark a fixed, frequently run statement for server-side preparation on first use."""
+    return stmt.execution_options(**{PREPARE_OPTION: True})
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout waits, timeouts and peak connections in use."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_s_total = 0.0
+        self._wait_s_max = 0.0
+        self._peak_in_use = 0
+
+    def _do_get(self):
+        with tracing.span("db.checkout", **{"db.pool.size": self.size()}) as span:
+            started = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except Exception:
+                with self._stats_lock:
+                    self._timeouts += 1
+                raise
+            # Includes opening a new connection when the pool had none idle
+            waited = time.perf_counter() - started
+            in_use = self.checkedout()
+            span.set_attribute("db.pool.in_use", in_use)
+        with self._stats_lock:
+            self._checkouts += 1
+            self._wait_s_total += waited
+            self._wait_s_max = max(self._wait_s_max, waited)
+            self._peak_in_use = max(self._peak_in_use, in_use)
+        return conn
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            checkouts = self._checkouts
+            return {
+                "size": self.size(),
+                "max_overflow": self._max_overflow,
+                "in_use": self.checkedout(),
+                "idle": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": checkouts,
+                "checkout_failures": self._timeouts,
+                "checkout_wait_ms_avg": round(self._wait_s_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "checkout_wait_ms_max": round(self._wait_s_max * 1000, 3),
+            }
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
+
+
+def install_idle_ping(engine: Engine, idle_s: float) -> None:
+    """Ping a connection on checkout only if it sat idle in the pool for longer than `idle_s`."""
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, record) -> None:
+        record.info[_CHECKIN_AT] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy) -> None:
+        checked_in = record.info.get(_CHECKIN_AT)
+        if checked_in is None or time.monotonic() - checked_in <= idle_s:
+            return
+        try:
+            alive = engine.dialect.do_ping(dbapi_conn)
+        except Exception as exc:
+            # The pool discards this connection and retries with a fresh one
+            raise DisconnectionError("idle connection failed pre-ping") from exc
+        if not alive:
+            raise DisconnectionError("idle connection failed pre-ping")
+
+
+def install_hot_statement_prepare(engine: Engine) -> None:
+    """Prepare statements marked with `prepared()` on their first execution (psycopg only)."""
+
+    @event.listens_for(engine, "do_execute")
+    def _do_execute(cursor, statement, parameters, context) -> bool | None:
+        if context is None or not context.execution_options.get(PREPARE_OPTION):
+            return None
+        cursor.execute(statement, parameters, prepare=True)
+        return True
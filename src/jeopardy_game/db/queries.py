@@ -0,0 +1,159 @@
+"""SQL statements issued by the API.
+
+Routes build their queries here so the plan-regression benchmark
+(`scripts/bench_query_plans.py`) explains exactly what the API runs. The
+fixed hot statements are marked `prepared()`, so psycopg prepares them
+server-side on first use (see db/pool.py).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select, and_, column, func, literal_column, or_, select, table
+
+from jeopardy_game.db.pool import prepared
+from jeopardy_game.db.sqlite import FTS_TABLE, fts_query
+from jeopardy_game.models.agent_answer import PrecomputedAgentAnswer
+from jeopardy_game.models.question import Question
+from jeopardy_game.models.verification_attempt import QuestionStats
+
+
+def _bucket(
+    stmt: Select,
+    *,
+    round_name: str,
+    value: int,
+    accuracy_range: tuple[float, float] | None,
+    min_attempts: int,
+) -> Select:
+    stmt = stmt.where(Question.round == round_name).where(Question.value == value)
+    if accuracy_range is not None:
+        low, high = accuracy_range
+        stmt = (
+            stmt.join(QuestionStats, QuestionStats.question_id == Question.id)
+            .where(QuestionStats.attempts >= min_attempts)
+            .where(QuestionStats.accuracy >= low)
+            .where(QuestionStats.accuracy < high)
+        )
+    return stmt
+
+
+def random_question_stmt(
+    *,
+    round_name: str,
+    value: int,
+    accuracy_range: tuple[float, float] | None = None,
+    min_attempts: int = 1,
+) -> Select[tuple[Question]]:
+    """Random question in a (round, value) bucket (`GET /question/`).
+
+    With `accuracy_range` ([low, high)), only questions whose rolled-up
+    accuracy falls in it over at least `min_attempts` attempts qualify.
+    """
+    stmt = _bucket(
+        select(Question),
+        round_name=round_name,
+        value=value,
+        accuracy_range=accuracy_range,
+        min_attempts=min_attempts,
+    )
+    return prepared(stmt.order_by(func.random()).limit(1))
+
+
+def bucket_id_bounds_stmt(
+    *,
+    round_name: str,
+    value: int,
+    accuracy_range: tuple[float, float] | None = None,
+    min_attempts: int = 1,
+) -> Select[tuple[int | None, int | None]]:
+    """Lowest and highest question id in a bucket (step 1 of the SQLite random sampler).
+
+    Separate scalar subqueries: SQLite answers a lone min() or max() with one
+    index seek, but scans the whole bucket for both in one SELECT.
+    """
+    bucket = {
+        "round_name": round_name,
+        "value": value,
+        "accuracy_range": accuracy_range,
+        "min_attempts": min_attempts,
+    }
+    lo = _bucket(select(func.min(Question.id)), **bucket).scalar_subquery()
+    hi = _bucket(select(func.max(Question.id)), **bucket).scalar_subquery()
+    return prepared(select(lo, hi))
+
+
+def bucket_question_from_id_stmt(
+    start_id: int,
+    *,
+    round_name: str,
+    value: int,
+    accuracy_range: tuple[float, float] | None = None,
+    min_attempts: int = 1,
+) -> Select[tuple[Question]]:
+    """First question in a bucket with id >= `start_id` (step 2 of the SQLite random sampler).
+
+    Both steps are index seeks on `ix_questions_round_value` (which carries
+    the rowid), instead of the full bucket scan and sort of ORDER BY random().
+    """
+    stmt = _bucket(
+        select(Question),
+        round_name=round_name,
+        value=value,
+        accuracy_range=accuracy_range,
+        min_attempts=min_attempts,
+    )
+    return prepared(stmt.where(Question.id >= start_id).order_by(Question.id).limit(1))
+
+
+def latest_question_stmt(*, round_name: str | None, value: int | None) -> Select[tuple[Question]]:
+    """Newest question, optionally filtered by round and value."""
+    stmt = select(Question)
+    if round_name:
+        stmt = stmt.where(Question.round == round_name)
+    if value is not None:
+        stmt = stmt.where(Question.value == value)
+    return stmt.order_by(Question.id.desc()).limit(1)
+
+
+def agent_play_question_stmt(
+    *, round_name: str | None, value: int | None, model: str
+) -> Select[tuple[Question, str | None]]:
+    """Newest matching question plus its precomputed answer for `model`, if any (`POST /agent-play/`)."""
+    stmt = latest_question_stmt(round_name=round_name, value=value).add_columns(
+        PrecomputedAgentAnswer.answer
+    ).outerjoin(
+        PrecomputedAgentAnswer,
+        and_(PrecomputedAgentAnswer.question_id == Question.id, PrecomputedAgentAnswer.model == model),
+    )
+    return prepared(stmt)
+
+
+def question_by_id_stmt(question_id: int) -> Select[tuple[Question]]:
+    """Question by primary key (`POST /verify-answer/`, issued via `Session.get`)."""
+    return prepared(select(Question).where(Question.id == question_id))
+
+
+_fts = table(FTS_TABLE, column("rowid"), column("rank"))
+
+
+def search_questions_stmt(text: str, *, dialect: str, limit: int) -> Select[tuple[Question]]:
+    """Questions whose text or category contains every word of `text` (`GET /questions/search`).
+
+    SQLite uses the `questions_fts` index ranked by bm25, with the last word
+    as a prefix; other databases fall back to ILIKE substring matching, newest first.
+    """
+    if dialect == "sqlite":
+        return (
+            select(Question)
+            .join(_fts, _fts.c.rowid == Question.id)
+            .where(literal_column(FTS_TABLE).op("MATCH")(fts_query(text)))
+            .order_by(_fts.c.rank)
+            .limit(limit)
+        )
+    stmt = select(Question)
+    for word in text.split():
+        pattern = "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        stmt = stmt.where(
+            or_(Question.question.ilike(pattern, escape="\\"), Question.category.ilike(pattern, escape="\\"))
+        )
+    return stmt.order_by(Question.id.desc()).limit(limit)
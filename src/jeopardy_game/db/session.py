@@ -1,12 +1,203 @@
-"""Database engine and session factory."""
+"""Database engines, session factories and read-replica routing."""
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
 
-from jeopardy_game.core.config import get_database_url
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.engine.interfaces import ExceptionContext
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
 
-engine = create_engine(get_database_url(), pool_pre_ping=True)
+from jeopardy_game.core import tracing
+from jeopardy_game.core.config import (
+    get_database_replica_urls,
+    get_database_url,
+    get_replica_cooldown_s,
+)
+from jeopardy_game.db.pool import (
+    InstrumentedQueuePool,
+    PoolSettings,
+    install_hot_statement_prepare,
+    install_idle_ping,
+)
+from jeopardy_game.db.sqlite import install_pragmas, is_sqlite_url, sqlite_engine_options
+
+logger = logging.getLogger(__name__)
+
+
+def build_engine(url: str, settings: PoolSettings | None = None) -> Engine:
+    """Create an engine with the application's connection and pool settings (`JEP_DB_*`)."""
+    settings = settings or PoolSettings.from_config()
+    if is_sqlite_url(url):
+        options = sqlite_engine_options(url)
+        if "poolclass" not in options:
+            # File databases: same pool sizing and stats, no network to ping or prepare for
+            options.update(
+                poolclass=InstrumentedQueuePool,
+                pool_size=settings.size,
+                max_overflow=settings.max_overflow,
+                pool_timeout=settings.timeout_s,
+            )
+        engine = create_engine(url, **options)
+        install_pragmas(engine)
+        return engine
+
+    engine = create_engine(url, **settings.engine_kwargs(make_url(url).get_driver_name()))
+    if settings.pre_ping == "idle":
+        install_idle_ping(engine, settings.ping_idle_s)
+    if engine.dialect.driver == "psycopg" and settings.prepares_statements:
+        install_hot_statement_prepare(engine)
+    return engine
+
+
+class ReplicaSession(Session):
+    """Read-only session on a replica that retries a failed read once on the primary.
+
+    Only connection-level failures are retried; the session is then rebound to
+    the primary for the rest of its life.
+    """
+
+    def __init__(self, *args: Any, primary: Engine, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._primary = primary
+
+    def _with_primary_retry(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except DBAPIError as exc:
+            if self.bind is self._primary or not (exc.connection_invalidated or _is_operational(exc.orig)):
+                raise
+            logger.warning("Read on replica %s failed; retrying on the primary", self.bind.url)
+            self.rollback()
+            self.bind = self._primary
+            return fn(*args, **kwargs)
+
+    # `get` loads through `execute`; `scalar(s)` do not, so each is wrapped
+    def execute(self, *args: Any, **kwargs: Any):
+        return self._with_primary_retry(super().execute, *args, **kwargs)
+
+    def scalar(self, *args: Any, **kwargs: Any):
+        return self._with_primary_retry(super().scalar, *args, **kwargs)
+
+    def scalars(self, *args: Any, **kwargs: Any):
+        return self._with_primary_retry(super().scalars, *args, **kwargs)
+
+
+class ReplicaRouter:
+    """Route read-only sessions to replicas (round-robin) with health-based failover.
+
+    A replica is marked unhealthy when a connection-level error is raised on it
+    and is skipped for `cooldown_s` seconds, after which it is tried again. When
+    no replica is healthy (or none are configured) reads go to the primary. The
+    read that hit the failure is retried once on the primary (`ReplicaSession`).
+    """
+
+    def __init__(self, primary: Engine, replicas: Sequence[Engine], *, cooldown_s: float = 30.0) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self._cooldown_s = cooldown_s
+        self._down_until: dict[Engine, float] = {}
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._lock = threading.Lock()
+        self._sessionmakers = {
+            primary: sessionmaker(bind=primary, autoflush=False, autocommit=False),
+            **{
+                e: sessionmaker(bind=e, class_=ReplicaSession, primary=primary, autoflush=False, autocommit=False)
+                for e in self.replicas
+            },
+        }
+        for replica in self.replicas:
+            event.listen(replica, "handle_error", self._on_error)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.engine is None:
+            return
+        if context.is_disconnect or _is_operational(context.original_exception):
+            self.mark_down(context.engine)
+
+    def mark_down(self, engine: Engine) -> None:
+        """Exclude `engine` from read routing for the cooldown period."""
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self._cooldown_s
+        logger.warning("Read replica %s marked unhealthy for %.0fs", engine.url, self._cooldown_s)
+
+    def read_engine(self) -> Engine:
+        """Pick the next healthy replica, or the primary if none is available."""
+        if self._cycle is None:
+            return self.primary
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                candidate = next(self._cycle)
+                if self._down_until.get(candidate, 0.0) <= now:
+                    self._down_until.pop(candidate, None)
+                    return candidate
+        return self.primary
+
+    def read_session(self) -> Session:
+        """Create a session bound to a read engine."""
+        return self._sessionmakers[self.read_engine()]()
+
+    def stats(self) -> dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": len(self.replicas),
+                "unhealthy": [
+                    e.url.render_as_string(hide_password=True)
+                    for e, until in self._down_until.items()
+                    if until > now
+                ],
+            }
+
+
+def _is_operational(exc: BaseException) -> bool:
+    # DBAPI modules each define their own OperationalError class.
+    return type(exc).__name__ == "OperationalError"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _trace_query_start(conn, cursor, statement, parameters, context, executemany) -> None:
+    span = tracing.get_tracer().start_span(
+        "db.query", **{"db.system": conn.dialect.name, "db.statement": statement[:1000]}
+    )
+    # Always push (even None) so the stack stays balanced with the end hooks
+    conn.info.setdefault("jep_query_spans", []).append(span)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _trace_query_end(conn, cursor, statement, parameters, context, executemany) -> None:
+    spans = conn.info.get("jep_query_spans")
+    span = spans.pop() if spans else None
+    if span is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        tracing.get_tracer().finish(span)
+
+
+@event.listens_for(Engine, "handle_error")
+def _trace_query_error(context: ExceptionContext) -> None:
+    conn = context.connection
+    spans = conn.info.get("jep_query_spans") if conn is not None else None
+    span = spans.pop() if spans else None
+    if span is not None:
+        span.record_error(context.original_exception)
+        tracing.get_tracer().finish(span)
+
+
+engine = build_engine(get_database_url())
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+replica_router = ReplicaRouter(
+    engine,
+    [build_engine(url) for url in get_database_replica_urls()],
+    cooldown_s=get_replica_cooldown_s(),
+)
@@ -0,0 +1,302 @@
+"""Memory-mapped columnar snapshot of the question corpus.
+
+The corpus is read-only between loads, so the loader can emit a compact
+snapshot file that API workers memory-map instead of querying Postgres.
+Pages of a file-backed read-only mapping are shared by every process that maps
+it, so N uvicorn workers cost one copy of the corpus in the page cache.
+
+File layout (native byte order, every section 8-byte aligned)::
+
+    b"JEPSNAP1" | u32 header length | JSON header | sections...
+
+Sections (rows sorted by (round, value, id), so each bucket is a contiguous run):
+
+    ids            int64[n]
+    rounds         uint8[n]      index into header["rounds"]
+    values         int32[n]
+    categories     uint32[n]     index into the category string table
+    cat_offsets    uint64[c+1]   offsets into cat_blob
+    cat_blob       utf-8
+    q_offsets      uint64[n+1]   offsets into q_blob
+    q_blob         utf-8
+    a_offsets      uint64[n+1]   offsets into a_blob
+    a_blob         utf-8
+    id_sorted      int64[n]      ids in ascending order (for bisect)
+    id_rows        uint32[n]     row index for each entry of id_sorted
+
+The header also carries the bucket table ``[[round_code, value, start, count], ...]``
+and the ``dataset_meta`` version the snapshot was exported from.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import random
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Any, Final
+
+from jeopardy_game.core.config import get_snapshot_path
+from jeopardy_game.models.question import QuestionRecord
+
+logger = logging.getLogger(__name__)
+
+MAGIC: Final[bytes] = b"JEPSNAP1"
+FORMAT_VERSION: Final[int] = 1
+
+_SECTIONS: Final[tuple[tuple[str, str], ...]] = (
+    ("ids", "q"),
+    ("rounds", "B"),
+    ("values", "i"),
+    ("categories", "I"),
+    ("cat_offsets", "Q"),
+    ("cat_blob", "B"),
+    ("q_offsets", "Q"),
+    ("q_blob", "B"),
+    ("a_offsets", "Q"),
+    ("a_blob", "B"),
+    ("id_sorted", "q"),
+    ("id_rows", "I"),
+)
+
+
+def _pad(n: int) -> int:
+    return (-n) % 8
+
+
+def _blob(strings: Iterable[str]) -> tuple[array, bytes]:
+    offsets = array("Q", [0])
+    parts: list[bytes] = []
+    total = 0
+    for s in strings:
+        b = s.encode("utf-8")
+        parts.append(b)
+        total += len(b)
+        offsets.append(total)
+    return offsets, b"".join(parts)
+
+
+def write_snapshot(path: str, records: Iterable[QuestionRecord], *, dataset_version: str | None = None) -> int:
+    """Write `records` to `path` atomically and return the number of rows.
+
+    The file is written next to `path` and renamed into place, so readers never
+    observe a partially written snapshot. `dataset_version` is the
+    `dataset_meta` version the records were read at; readers skip a snapshot
+    whose version no longer matches the database.
+    """
+    rows = sorted(records, key=lambda r: (r.round, r.value, r.id))
+
+    round_names = sorted({r.round for r in rows})
+    if len(round_names) > 255:
+        raise ValueError("Snapshot supports at most 255 distinct rounds.")
+    round_codes = {name: i for i, name in enumerate(round_names)}
+
+    category_names: list[str] = []
+    category_codes: dict[str, int] = {}
+    for r in rows:
+        if r.category not in category_codes:
+            category_codes[r.category] = len(category_names)
+            category_names.append(r.category)
+
+    buckets: list[list[int]] = []
+    for i, r in enumerate(rows):
+        code = round_codes[r.round]
+        if buckets and buckets[-1][0] == code and buckets[-1][1] == r.value:
+            buckets[-1][3] += 1
+        else:
+            buckets.append([code, r.value, i, 1])
+
+    by_id = sorted(range(len(rows)), key=lambda i: rows[i].id)
+    cat_offsets, cat_blob = _blob(category_names)
+    q_offsets, q_blob = _blob(r.question for r in rows)
+    a_offsets, a_blob = _blob(r.answer for r in rows)
+
+    sections: dict[str, bytes] = {
+        "ids": array("q", (r.id for r in rows)).tobytes(),
+        "rounds": bytes(round_codes[r.round] for r in rows),
+        "values": array("i", (r.value for r in rows)).tobytes(),
+        "categories": array("I", (category_codes[r.category] for r in rows)).tobytes(),
+        "cat_offsets": cat_offsets.tobytes(),
+        "cat_blob": cat_blob,
+        "q_offsets": q_offsets.tobytes(),
+        "q_blob": q_blob,
+        "a_offsets": a_offsets.tobytes(),
+        "a_blob": a_blob,
+        "id_sorted": array("q", (rows[i].id for i in by_id)).tobytes(),
+        "id_rows": array("I", by_id).tobytes(),
+    }
+
+    layout: dict[str, list[int]] = {}
+    offset = 0
+    for name, _fmt in _SECTIONS:
+        layout[name] = [offset, len(sections[name])]
+        offset += len(sections[name]) + _pad(len(sections[name]))
+
+    header = {
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(rows),
+        "dataset_version": dataset_version,
+        "rounds": round_names,
+        "buckets": buckets,
+        "sections": layout,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix_len = len(MAGIC) + 4 + len(header_bytes)
+    prefix_pad = _pad(prefix_len)
+
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(len(header_bytes + b" " * prefix_pad).to_bytes(4, "little"))
+        fh.write(header_bytes + b" " * prefix_pad)
+        for name, _fmt in _SECTIONS:
+            data = sections[name]
+            fh.write(data)
+            fh.write(b"\0" * _pad(len(data)))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+class QuestionSnapshot:
+    """Read-only view over a memory-mapped snapshot file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buf = memoryview(self._mm)
+        if bytes(buf[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a question snapshot")
+        header_len = int.from_bytes(buf[len(MAGIC) : len(MAGIC) + 4], "little")
+        data_start = len(MAGIC) + 4 + header_len
+        header: dict[str, Any] = json.loads(bytes(buf[len(MAGIC) + 4 : data_start]))
+
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {header['version']}")
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Snapshot was written on a platform with a different byte order")
+
+        self._rows: int = header["rows"]
+        self.dataset_version: str | None = header.get("dataset_version")
+        self._round_names: list[str] = header["rounds"]
+        self._round_codes = {name: i for i, name in enumerate(self._round_names)}
+        self._buckets: dict[tuple[int, int], tuple[int, int]] = {
+            (code, value): (start, count) for code, value, start, count in header["buckets"]
+        }
+
+        views: dict[str, memoryview] = {}
+        for name, fmt in _SECTIONS:
+            start, length = header["sections"][name]
+            view = buf[data_start + start : data_start + start + length]
+            views[name] = view if fmt == "B" else view.cast(fmt)
+
+        self._ids = views["ids"]
+        self._rounds = views["rounds"]
+        self._values = views["values"]
+        self._categories = views["categories"]
+        self._cat_offsets = views["cat_offsets"]
+        self._cat_blob = views["cat_blob"]
+        self._q_offsets = views["q_offsets"]
+        self._q_blob = views["q_blob"]
+        self._a_offsets = views["a_offsets"]
+        self._a_blob = views["a_blob"]
+        self._id_sorted = views["id_sorted"]
+        self._id_rows = views["id_rows"]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @staticmethod
+    def _text(offsets: memoryview, blob: memoryview, i: int) -> str:
+        return str(blob[offsets[i] : offsets[i + 1]], "utf-8")
+
+    def _record(self, row: int) -> QuestionRecord:
+        return QuestionRecord(
+            id=self._ids[row],
+            round=self._round_names[self._rounds[row]],
+            category=self._text(self._cat_offsets, self._cat_blob, self._categories[row]),
+            value=self._values[row],
+            question=self._text(self._q_offsets, self._q_blob, row),
+            answer=self._text(self._a_offsets, self._a_blob, row),
+        )
+
+    def get(self, question_id: int) -> QuestionRecord | None:
+        """Return the question with `question_id`, or None if absent."""
+        i = bisect_left(self._id_sorted, question_id)
+        if i >= self._rows or self._id_sorted[i] != question_id:
+            return None
+        return self._record(self._id_rows[i])
+
+    def random_question(self, *, round_name: str, value: int) -> QuestionRecord | None:
+        """Return a uniformly random question from the (round, value) bucket."""
+        code = self._round_codes.get(round_name)
+        if code is None:
+            return None
+        bucket = self._buckets.get((code, value))
+        if bucket is None:
+            return None
+        start, count = bucket
+        return self._record(start + random.randrange(count))
+
+
+_snapshot: QuestionSnapshot | None = None
+_snapshot_key: object = None
+_snapshot_lock = threading.Lock()
+
+
+def _file_key(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def get_question_snapshot() -> QuestionSnapshot | None:
+    """Return the process-wide snapshot, or None if none is configured.
+
+    The file is mapped on first use and mapped again whenever the loader
+    replaces it (a new inode, mtime or size), so workers pick up a reloaded
+    dataset without a restart. A configured path that does not exist (or is
+    unreadable) disables the snapshot until the file appears, and requests
+    fall back to the database.
+    """
+    global _snapshot, _snapshot_key
+    path = get_snapshot_path()
+    if not path:
+        return None
+    key = (path, _file_key(path))
+    if key == _snapshot_key:
+        return _snapshot
+
+    with _snapshot_lock:
+        if key != _snapshot_key:
+            # The old mapping is released once in-flight requests drop their references
+            try:
+                _snapshot = QuestionSnapshot(path) if key[1] is not None else None
+            except (OSError, ValueError) as exc:
+                logger.warning("Question snapshot %s unavailable, using the database: %s", path, exc)
+                _snapshot = None
+            else:
+                if _snapshot is None:
+                    logger.warning("Question snapshot %s not found, using the database", path)
+            _snapshot_key = key
+        return _snapshot
+
+
+def reset_question_snapshot() -> None:
+    """Forget the mapped snapshot so the next call re-reads configuration."""
+    global _snapshot, _snapshot_key
+    with _snapshot_lock:
+        _snapshot = None
+        _snapshot_key = None
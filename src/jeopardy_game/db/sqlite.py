@@ -0,0 +1,119 @@
+"""Embedded SQLite mode: connection pragmas and full-text search.
+
+With `DATABASE_URL=sqlite:///./jeopardy.db` the API, loader and scripts run
+without a database server. Every connection gets WAL journaling (readers
+don't block the writer), `synchronous=NORMAL` (durable at checkpoints, no
+fsync per commit), a larger page cache, memory-mapped reads and a busy
+timeout instead of immediate "database is locked" errors.
+
+`questions_fts` is an FTS5 index over question text and category, kept in
+sync with `questions` by triggers. It is created alongside `questions` by
+`create_all` on SQLite only; other databases search with ILIKE.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Final
+
+from sqlalchemy import DDL, Engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+from jeopardy_game.models.question import Question
+
+FTS_TABLE: Final[str] = "questions_fts"
+
+_PRAGMAS: Final[tuple[str, ...]] = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",  # KiB, i.e. 64 MiB
+    "mmap_size=268435456",
+    "busy_timeout=5000",
+    "foreign_keys=ON",
+)
+
+# Bulk loads: nothing to protect until the load commits, so skip syncing entirely.
+_BULK_LOAD_PRAGMAS: Final[tuple[str, ...]] = ("synchronous=OFF",)
+
+_FTS_DDL: Final[tuple[str, ...]] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "question, category, content='questions', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON questions BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, question, category) VALUES (new.id, new.question, new.category); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON questions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, category) "
+    "VALUES ('delete', old.id, old.question, old.category); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON questions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, category) "
+    "VALUES ('delete', old.id, old.question, old.category); "
+    f"INSERT INTO {FTS_TABLE}(rowid, question, category) VALUES (new.id, new.question, new.category); END",
+)
+
+for _ddl in _FTS_DDL:
+    event.listen(Question.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(
+    Question.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+def is_sqlite_url(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def sqlite_engine_options(url: str) -> dict[str, Any]:
+    """Extra `create_engine` arguments for a SQLite URL."""
+    options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if make_url(url).database in (None, "", ":memory:"):
+        # Each connection would otherwise get its own empty in-memory database
+        options["poolclass"] = StaticPool
+    return options
+
+
+def _apply(dbapi_conn, pragmas: tuple[str, ...]) -> None:
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def install_pragmas(engine: Engine, *, bulk_load: bool = False) -> None:
+    """Apply the embedded-mode pragmas to every new connection of `engine`."""
+    pragmas = _PRAGMAS + (_BULK_LOAD_PRAGMAS if bulk_load else ())
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record) -> None:
+        _apply(dbapi_conn, pragmas)
+
+
+def fts_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in user input are
+    matched literally instead of raising syntax errors.
+    """
+    words = [w.replace('"', '""') for w in text.split()]
+    if not words:
+        return None
+    quoted = [f'"{w}"' for w in words]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+@contextmanager
+def deferred_fts_index(engine: Engine) -> Iterator[None]:
+    """Bulk-insert questions without the per-row FTS trigger, then index them in one pass."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai")
+    try:
+        yield
+    finally:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(_FTS_DDL[1])
+            conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
@@ -3,11 +3,36 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 
-from jeopardy_game.api.routes import agents
+from jeopardy_game.api.admission import AdmissionMiddleware, build_admission_pools, threadpool_size
+from jeopardy_game.api.routes import agents, metrics
 from jeopardy_game.api.routes.questions import router as questions_router
-
+from jeopardy_game.api.tracing import TracingMiddleware
+from jeopardy_game.api.usage import UsageLabelMiddleware
+from jeopardy_game.core import tracing
+from jeopardy_game.core.config import get_threadpool_reserve
+from jeopardy_game.core.serialization import FastJSONResponse
+from jeopardy_game.services.attempt_log import attempt_log
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Sync endpoints share AnyIO's default limiter (40 threads); give every admitted request a worker
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(
+        limiter.total_tokens, threadpool_size(app.state.admission_pools, get_threadpool_reserve())
+    )
+    attempt_log.start()
+    try:
+        yield
+    finally:
+        attempt_log.stop()  # final flush of buffered attempts
+        tracing.get_tracer().shutdown()  # flush queued spans (the OTLP batch, the JSONL tail)
 
 
 def create_app() -> FastAPI:
@@ -15,10 +40,19 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Jeopardy Game API",
         version="0.1.0",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
     )
 
+    app.state.admission_pools = build_admission_pools()
+    app.add_middleware(UsageLabelMiddleware)
+    app.add_middleware(AdmissionMiddleware, pools=app.state.admission_pools)
+    # Added last so it wraps admission: queue waits show up in the trace
+    app.add_middleware(TracingMiddleware)
+
     app.include_router(questions_router)
     app.include_router(agents.router)
+    app.include_router(metrics.router)
 
     return app
 
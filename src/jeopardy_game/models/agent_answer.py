@@ -0,0 +1,29 @@
+"""ORM model for precomputed agent answers."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from jeopardy_game.db.base import Base
+
+
+class PrecomputedAgentAnswer(Base):
+    """Raw (pre-mistake) agent answer to a question for a given model.
+
+    Filled offline by `scripts/precompute_agent_answers.py`; `/agent-play/`
+    applies the skill-based mistake injection on top at request time.
+    """
+
+    __tablename__ = "agent_answers"
+
+    # No FK to questions.id: see db/partitioning.py
+    question_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    model: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    answer: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -0,0 +1,29 @@
+"""ORM model for dataset load metadata."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from jeopardy_game.db.base import Base
+
+QUESTIONS_DATASET = "questions"
+
+
+class DatasetMeta(Base):
+    """Version marker for a loaded dataset.
+
+    The loader writes a fresh `version` each time it (re)loads the corpus; API
+    workers compare it against the version their in-process caches were filled
+    from and drop those caches when it changes.
+    """
+
+    __tablename__ = "dataset_meta"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
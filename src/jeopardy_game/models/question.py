@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from dataclasses import dataclass
 
 from sqlalchemy import Date, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
@@ -34,3 +35,30 @@ class Question(Base):
     __table_args__ = (
         Index("ix_questions_round_value", "round", "value"),
     )
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionRecord:
+    """Immutable, session-independent view of a question row.
+
+    Exposes the same attribute names as `Question` for the fields the API reads,
+    so it can be used wherever a row is only read (snapshot and cache lookups).
+    """
+
+    id: int
+    round: str
+    category: str
+    value: int
+    question: str
+    answer: str
+
+    @classmethod
+    def from_row(cls, row: Question) -> QuestionRecord:
+        return cls(
+            id=row.id,
+            round=row.round,
+            category=row.category,
+            value=row.value,
+            question=row.question,
+            answer=row.answer,
+        )
@@ -0,0 +1,79 @@
+"""ORM models for the verification attempt log and its per-question rollup."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from jeopardy_game.db.base import Base
+
+
+class VerificationAttempt(Base):
+    """One verification (API, agent or job), written in batches by the attempt log."""
+
+    __tablename__ = "verification_attempts"
+
+    # BIGINT on Postgres; SQLite only auto-increments INTEGER PRIMARY KEY
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+
+    # No FK to questions.id: see db/partitioning.py
+    question_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    normalized_answer: Mapped[str] = mapped_column(Text, nullable=False)
+    is_correct: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+    # Verification stage that produced the verdict, and how it was reached;
+    # see `VerificationOutcome.tier` / `.path`
+    tier: Mapped[str] = mapped_column(String(16), nullable=False)
+    path: Mapped[str] = mapped_column(String(48), nullable=False)
+    # "api" | "agent" | "job"
+    source: Mapped[str] = mapped_column(String(16), nullable=False)
+    latency_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    # {stage: milliseconds} for each stage that ran
+    stage_ms: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_verification_attempts_created_at", "created_at"),
+    )
+
+
+class QuestionStats(Base):
+    """Per-question accuracy, rolled up from `verification_attempts`."""
+
+    __tablename__ = "question_stats"
+
+    question_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    correct: Mapped[int] = mapped_column(Integer, nullable=False)
+    accuracy: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class QuestionStatsRollup(Base):
+    """Single-row watermark: the id of the last attempt folded into `question_stats`."""
+
+    __tablename__ = "question_stats_rollup"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_attempt_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,54 @@
+"""ORM model for queued (asynchronous) answer verifications."""
+
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from jeopardy_game.db.base import Base
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+TERMINAL_STATUSES = frozenset({DONE, FAILED})
+
+
+def utcnow() -> dt.datetime:
+    return dt.datetime.now(dt.UTC)
+
+
+class VerificationJob(Base):
+    """A verification request processed by `scripts/verification_worker.py`.
+
+    Workers claim `queued` jobs (and `running` jobs whose lease expired) with
+    `FOR UPDATE SKIP LOCKED` on Postgres, or a conditional UPDATE on SQLite.
+    """
+
+    __tablename__ = "verification_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+
+    # No FK to questions.id: see db/partitioning.py
+    question_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    user_answer: Mapped[str] = mapped_column(Text, nullable=False)
+
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=QUEUED)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    claimed_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    is_correct: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    ai_response: Mapped[str | None] = mapped_column(Text, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Set in Python (not server-side) for sub-second FIFO ordering on SQLite too
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
+    started_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_verification_jobs_status_created", "status", "created_at"),
+    )
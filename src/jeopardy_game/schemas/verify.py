@@ -15,3 +15,12 @@ class VerifyAnswerOut(BaseModel):
 
     is_correct: bool
     ai_response: str
+
+
+class VerifyJobOut(BaseModel):
+    """State of an asynchronous verification job."""
+
+    job_id: str
+    status: str = Field(..., description='"queued", "running", "done" or "failed"')
+    result: VerifyAnswerOut | None = Field(None, description='Set once status is "done"')
+    error: str | None = Field(None, description='Set when status is "failed"')
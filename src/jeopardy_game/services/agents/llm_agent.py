@@ -2,10 +2,65 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from typing import Any, Final
 
+from jeopardy_game.core import tracing
 from jeopardy_game.services.agents.base import Agent, AgentAnswer
 from jeopardy_game.services.openai_client import OpenAIClient
 
+# Stable instructions first, per-clue fields last, so provider prompt caching
+# can reuse the prefix across calls.
+_SYSTEM_MESSAGE: Final[dict[str, str]] = {
+    "role": "system",
+    "content": (
+        "You are playing Jeopardy. You will be given the round, category, value and clue. "
+        "Answer with ONLY the short answer (no explanation, no punctuation)."
+    ),
+}
+
+_USER_TEMPLATE: Final[str] = (
+    "Round: {round_name}\n"
+    "Category: {category}\n"
+    "Value: {value}\n"
+    "Clue: {question}"
+)
+
+# Bump when the prefix changes.
+PROMPT_CACHE_KEY: Final[str] = "jeopardy-agent-v1"
+
+
+def build_agent_payload(
+    *, model: str, question: str, category: str, round_name: str, value: str, temperature: float
+) -> dict[str, Any]:
+    """Build the Responses API payload for answering a clue."""
+    prompt_user = _USER_TEMPLATE.format(
+        round_name=round_name,
+        category=category,
+        value=value,
+        question=question,
+    )
+    return {
+        "model": model,
+        "input": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt_user}],
+        "temperature": temperature,
+        "prompt_cache_key": PROMPT_CACHE_KEY,
+    }
+
+
+def mistake_rate(skill: str) -> float:
+    # Higher skill => lower mistake probability
+    return {"easy": 0.40, "medium": 0.20, "hard": 0.08}.get(skill, 0.20)
+
+
+def apply_skill_mistakes(text: str, skill: str) -> str:
+    """Apply the skill-based mistake injection to a raw agent answer."""
+    # Controlled “skill” mistakes: sometimes corrupt the answer slightly or replace with "I don't know"
+    if random.random() < mistake_rate(skill):
+        if random.random() < 0.5:
+            return "I don't know"
+        return text + "s"  # tiny perturbation
+    return text
+
 
 @dataclass(frozen=True)
 class LlmAgentConfig:
@@ -20,36 +75,22 @@ class LlmAgent(Agent):
         self.name = name
         self._client = client
         self._cfg = config
-        
 
-    def _mistake_rate(self) -> float:
-        # Higher skill => lower mistake probability
-        return {"easy": 0.40, "medium": 0.20, "hard": 0.08}.get(self._cfg.skill, 0.20)
-
-    def answer_question(self, *, question: str, category: str, round_name: str, value: str) -> AgentAnswer:
-        prompt = (
-            "You are playing Jeopardy.\n"
-            f"Round: {round_name}\n"
-            f"Category: {category}\n"
-            f"Value: {value}\n"
-            f"Clue: {question}\n\n"
-            "Answer with ONLY the short answer (no explanation, no punctuation)."
+    def base_answer(self, *, question: str, category: str, round_name: str, value: str) -> str:
+        """Return the model's raw answer, before any skill-based mistakes."""
+        payload = build_agent_payload(
+            model=self._client.model,
+            question=question,
+            category=category,
+            round_name=round_name,
+            value=value,
+            temperature=self._cfg.temperature,
         )
 
-        payload = {
-            "model": self._client.model,
-            "input": prompt,
-            "temperature": self._cfg.temperature,
-        }
-
         raw = self._client.create_response(payload)
-        text = self._client.extract_output_text(raw).strip()
-
-        # Controlled “skill” mistakes: sometimes corrupt the answer slightly or replace with "I don't know"
-        if random.random() < self._mistake_rate():
-            if random.random() < 0.5:
-                text = "I don't know"
-            else:
-                text = text + "s"  # tiny perturbation
+        return self._client.extract_output_text(raw).strip()
 
-        return AgentAnswer(answer=text, rationale=None)
+    def answer_question(self, *, question: str, category: str, round_name: str, value: str) -> AgentAnswer:
+        with tracing.span("agent.answer_question", agent=self.name, skill=self._cfg.skill):
+            text = self.base_answer(question=question, category=category, round_name=round_name, value=value)
+            return AgentAnswer(answer=apply_skill_mistakes(text, self._cfg.skill), rationale=None)
@@ -6,6 +6,8 @@ import re
 import unicodedata
 from difflib import SequenceMatcher
 
+from jeopardy_game.core.tracing import traced
+
 
 def _normalize(text: str) -> str:
     """Normalize text for approximate matching.
@@ -39,6 +41,7 @@ def _normalize(text: str) -> str:
     return t
 
 
+@traced("answer_checker.is_answer_correct")
 def is_answer_correct(user_answer: str, correct_answer: str, *, threshold: float = 0.86) -> tuple[bool, str]:
     """Check if `user_answer` matches `correct_answer` approximately.
 
@@ -0,0 +1,221 @@
+"""Write-behind log of verification attempts.
+
+Request handlers only append to a bounded in-memory buffer; a background
+thread writes the buffer to `verification_attempts` in batches when it
+reaches `batch_size` records or every `flush_interval_s`. Postgres (psycopg)
+batches go through COPY, other databases through a multi-row INSERT. When the
+buffer is full, or a batch cannot be written, attempts are dropped and counted
+rather than slowing requests down or growing memory.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from jeopardy_game.core.config import (
+    get_attempt_log_batch_size,
+    get_attempt_log_buffer_size,
+    get_attempt_log_enabled,
+    get_attempt_log_flush_interval_s,
+)
+from jeopardy_game.db.session import SessionLocal
+from jeopardy_game.models.verification_attempt import VerificationAttempt
+from jeopardy_game.services.answer_checker import _normalize
+from jeopardy_game.services.answer_verification import VerificationOutcome
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "question_id",
+    "normalized_answer",
+    "is_correct",
+    "tier",
+    "path",
+    "source",
+    "latency_ms",
+    "stage_ms",
+    "created_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AttemptRecord:
+    question_id: int
+    user_answer: str  # normalized at flush time, off the request path
+    is_correct: bool
+    tier: str
+    path: str
+    source: str
+    latency_ms: float
+    stage_ms: dict[str, float]
+    created_at: dt.datetime
+
+    def row(self) -> tuple[Any, ...]:
+        return (
+            self.question_id,
+            _normalize(self.user_answer),
+            self.is_correct,
+            self.tier,
+            self.path,
+            self.source,
+            round(self.latency_ms, 3),
+            self.stage_ms,
+            self.created_at,
+        )
+
+
+class AttemptLog:
+    """Bounded buffer of attempts with a background batch writer."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_buffer: int,
+        batch_size: int,
+        flush_interval_s: float,
+        enabled: bool = True,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.enabled = enabled
+        self._buffer: deque[AttemptRecord] = deque()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self.recorded = 0
+        self.dropped_full = 0
+        self.dropped_errors = 0
+        self.written = 0
+        self.batches = 0
+
+    def record(self, attempt: AttemptRecord) -> bool:
+        """Buffer `attempt`; returns False if it was dropped. Never blocks on I/O."""
+        if not self.enabled:
+            return False
+        with self._cond:
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped_full += 1
+                return False
+            self._buffer.append(attempt)
+            self.recorded += 1
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify()
+        return True
+
+    def record_outcome(
+        self, *, question_id: int, user_answer: str, outcome: VerificationOutcome, source: str
+    ) -> bool:
+        return self.record(
+            AttemptRecord(
+                question_id=question_id,
+                user_answer=user_answer,
+                is_correct=outcome.out.is_correct,
+                tier=outcome.tier,
+                path=outcome.path,
+                source=source,
+                latency_ms=outcome.latency_ms,
+                stage_ms=outcome.stage_ms,
+                created_at=dt.datetime.now(dt.UTC),
+            )
+        )
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    n = min(len(self._buffer), self.batch_size)
+                    batch = [self._buffer.popleft() for _ in range(n)]
+                if not batch:
+                    return written
+                try:
+                    self._write([a.row() for a in batch])
+                except Exception:
+                    self.dropped_errors += len(batch)
+                    logger.warning("Dropped %d attempts; batch write failed", len(batch), exc_info=True)
+                    continue
+                written += len(batch)
+                self.written += len(batch)
+                self.batches += 1
+
+    def _write(self, rows: list[tuple[Any, ...]]) -> None:
+        with self._session_factory() as db:
+            bind = db.get_bind()
+            if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg":
+                raw = db.connection().connection.driver_connection
+                with raw.cursor() as cur:
+                    with cur.copy(f"COPY {VerificationAttempt.__tablename__} ({', '.join(_COLUMNS)}) FROM STDIN") as copy:
+                        stage_ms = _COLUMNS.index("stage_ms")
+                        for row in rows:
+                            copy.write_row(row[:stage_ms] + (json.dumps(row[stage_ms]),) + row[stage_ms + 1 :])
+            else:
+                db.execute(insert(VerificationAttempt), [dict(zip(_COLUMNS, row, strict=True)) for row in rows])
+            db.commit()
+
+    def start(self) -> None:
+        """Start the background writer (no-op when disabled or already running)."""
+        if not self.enabled or self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="attempt-log", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 10.0) -> None:
+        """Stop the writer after a final flush."""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(timeout=timeout_s)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopping or len(self._buffer) >= self.batch_size,
+                    timeout=self.flush_interval_s,
+                )
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            buffered = len(self._buffer)
+        return {
+            "enabled": self.enabled,
+            "buffered": buffered,
+            "max_buffer": self.max_buffer,
+            "recorded": self.recorded,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped_full": self.dropped_full,
+            "dropped_errors": self.dropped_errors,
+        }
+
+
+attempt_log = AttemptLog(
+    SessionLocal,
+    max_buffer=get_attempt_log_buffer_size(),
+    batch_size=get_attempt_log_batch_size(),
+    flush_interval_s=get_attempt_log_flush_interval_s(),
+    enabled=get_attempt_log_enabled(),
+)
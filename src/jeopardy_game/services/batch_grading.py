@@ -0,0 +1,257 @@
+"""Streaming offline grading of logged answers.
+
+Reads (question_id, user_answer) records in chunks, joins canonical answers
+per chunk from the snapshot or the database, grades chunks with the heuristic
+across a process pool and optionally sends heuristic misses to a rate-limited
+LLM stage. Only a bounded number of chunks is in flight, so memory stays
+constant regardless of input size, and results are emitted in input order.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import logging
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Final, Protocol, TextIO
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from jeopardy_game.core.serialization import dumps, loads
+from jeopardy_game.db.snapshot import QuestionSnapshot
+from jeopardy_game.models.question import Question
+from jeopardy_game.services.answer_checker import is_answer_correct
+from jeopardy_game.services.rate_limit import RateLimiter
+from jeopardy_game.services.usage import set_route_label
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerSource(Protocol):
+    def lookup(self, question_ids: Iterable[int]) -> dict[int, tuple[str, str]]:
+        """Return {question_id: (clue, canonical_answer)} for the ids that exist."""
+        ...
+
+
+class SnapshotAnswerSource:
+    """Canonical answers from the memory-mapped question snapshot."""
+
+    def __init__(self, snapshot: QuestionSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def lookup(self, question_ids: Iterable[int]) -> dict[int, tuple[str, str]]:
+        found = {}
+        for qid in set(question_ids):
+            record = self._snapshot.get(qid)
+            if record is not None:
+                found[qid] = (record.question, record.answer)
+        return found
+
+
+class DatabaseAnswerSource:
+    """Canonical answers fetched with one ``IN (...)`` query per chunk."""
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self._session_factory = session_factory
+
+    def lookup(self, question_ids: Iterable[int]) -> dict[int, tuple[str, str]]:
+        ids = list(set(question_ids))
+        if not ids:
+            return {}
+        stmt = select(Question.id, Question.question, Question.answer).where(Question.id.in_(ids))
+        with self._session_factory() as db:
+            return {qid: (clue, answer) for qid, clue, answer in db.execute(stmt)}
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[dict[str, Any]]:
+    """Yield input records from an NDJSON or CSV stream."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield loads(line)
+
+
+# Fields `grade_stream` adds to every record
+GRADE_FIELDS: Final[tuple[str, ...]] = ("is_correct", "source", "explanation")
+
+
+class RecordWriter:
+    """Write result records as NDJSON or CSV.
+
+    CSV columns are fixed by the first record: its input fields, then
+    `output_fields`. Missing values are written empty, and keys that first
+    appear in later records (possible with NDJSON input) are left out.
+    """
+
+    def __init__(self, stream: TextIO, fmt: str, *, output_fields: Sequence[str] = GRADE_FIELDS) -> None:
+        self._stream = stream
+        self._fmt = fmt
+        self._output_fields = tuple(output_fields)
+        self._csv: csv.DictWriter | None = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._fmt == "csv":
+            if self._csv is None:
+                fieldnames = [k for k in record if k not in self._output_fields] + list(self._output_fields)
+                self._csv = csv.DictWriter(self._stream, fieldnames=fieldnames, restval="", extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerow(record)
+        else:
+            self._stream.write(dumps(record).decode("utf-8"))
+            self._stream.write("\n")
+
+
+def _grade_chunk(pairs: list[tuple[str, str | None]]) -> list[tuple[bool | None, str]]:
+    """Heuristic-grade (user_answer, canonical) pairs; runs in pool workers."""
+    out: list[tuple[bool | None, str]] = []
+    for user_answer, canonical in pairs:
+        if canonical is None:
+            out.append((None, "Question not found."))
+        else:
+            out.append(is_answer_correct(user_answer, canonical))
+    return out
+
+
+class LLMStage:
+    """Re-check heuristic misses with the LLM verifier under a shared rate limit.
+
+    A failed call keeps the heuristic verdict; `failures` counts them and the
+    first one is logged with its traceback.
+    """
+
+    def __init__(
+        self, verify: Callable[..., Any], *, rate_per_s: float, workers: int = 4, route_label: str = "batch"
+    ) -> None:
+        self._verify = verify
+        self._limiter = RateLimiter(rate_per_s, burst=workers)
+        # Worker threads don't inherit the caller's context; label their LLM usage here
+        self._pool = ThreadPoolExecutor(max_workers=workers, initializer=set_route_label, initargs=(route_label,))
+        self._lock = threading.Lock()
+        self.failures = 0
+
+    def _one(self, item: tuple[str, str, str]) -> tuple[bool, str] | None:
+        clue, canonical, user_answer = item
+        self._limiter.acquire()
+        try:
+            verdict = self._verify(question=clue, correct_answer=canonical, user_answer=user_answer)
+        except Exception:
+            with self._lock:
+                self.failures += 1
+                first = self.failures == 1
+            if first:
+                logger.exception("LLM re-check failed; keeping heuristic verdicts for failed calls")
+            return None
+        return verdict.is_correct, verdict.explanation
+
+    def run(self, items: list[tuple[str, str, str]]) -> list[tuple[bool, str] | None]:
+        return list(self._pool.map(self._one, items))
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+
+def _parse_record(record: dict[str, Any]) -> tuple[int, str] | None:
+    """Return (question_id, user_answer), or None when either is missing or malformed."""
+    user_answer = record.get("user_answer")
+    if user_answer is None:
+        return None
+    try:
+        return int(record.get("question_id")), str(user_answer)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def grade_stream(
+    records: Iterable[dict[str, Any]],
+    *,
+    answers: AnswerSource,
+    workers: int = 1,
+    chunk_size: int = 5000,
+    llm: LLMStage | None = None,
+    executor: Executor | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Grade `records` and yield them (in input order) with verdict fields added.
+
+    Each output record keeps the input fields and adds `is_correct` (None when
+    the question id is unknown or the record is malformed), `source`
+    ("heuristic", "llm", "missing" or "invalid") and `explanation`. A record is
+    invalid when its `question_id` is not an integer or `user_answer` is absent.
+    """
+    owns_executor = executor is None and workers > 1
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_pending = max(2, 2 * workers)
+
+    pending: deque[
+        tuple[list[dict[str, Any]], list[tuple[int, str] | None], dict[int, tuple[str, str]], Future | list]
+    ] = deque()
+
+    def finish(chunk, parsed, joined, result) -> Iterator[dict[str, Any]]:
+        verdicts = result.result() if isinstance(result, Future) else result
+        misses: list[int] = []
+        for i, (rec, key, (ok, msg)) in enumerate(zip(chunk, parsed, verdicts, strict=True)):
+            if key is None:
+                rec["is_correct"] = None
+                rec["source"] = "invalid"
+                rec["explanation"] = "Record needs an integer question_id and a user_answer."
+                continue
+            rec["is_correct"] = ok
+            rec["source"] = "missing" if ok is None else "heuristic"
+            rec["explanation"] = msg
+            if ok is False and llm is not None:
+                misses.append(i)
+        if misses:
+            items = []
+            for i in misses:
+                qid, user_answer = parsed[i]
+                clue, canonical = joined[qid]
+                items.append((clue, canonical, user_answer))
+            for i, llm_result in zip(misses, llm.run(items), strict=True):
+                if llm_result is not None:
+                    chunk[i]["is_correct"], chunk[i]["explanation"] = llm_result
+                    chunk[i]["source"] = "llm"
+        yield from chunk
+
+    it = iter(records)
+    with nullcontext() if not owns_executor else executor:  # type: ignore[union-attr]
+        while True:
+            chunk = list(itertools.islice(it, chunk_size))
+            if not chunk:
+                break
+            parsed = [_parse_record(r) for r in chunk]
+            joined = answers.lookup(key[0] for key in parsed if key is not None)
+            # Invalid records are graded as unknown ids and relabelled in finish()
+            pairs = [
+                (key[1], joined[key[0]][1] if key[0] in joined else None) if key is not None else ("", None)
+                for key in parsed
+            ]
+            result: Future | list = (
+                executor.submit(_grade_chunk, pairs) if executor is not None else _grade_chunk(pairs)
+            )
+            pending.append((chunk, parsed, joined, result))
+            while len(pending) >= max_pending:
+                yield from finish(*pending.popleft())
+        while pending:
+            yield from finish(*pending.popleft())
+
+
+def open_text(path: str, mode: str) -> TextIO:
+    """Open `path` for text I/O; "-" means stdin/stdout."""
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def detect_format(path: str, explicit: str | None = None) -> str:
+    """NDJSON unless the file name ends in ``.csv``."""
+    if explicit:
+        return explicit
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
@@ -0,0 +1,49 @@
+"""Non-blocking concurrency gate for LLM verification calls."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from jeopardy_game.core.config import get_llm_max_concurrency
+
+
+class LLMGate:
+    """Caps concurrent LLM calls; callers that cannot get a slot degrade instead of waiting."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.saturated = 0
+
+    @contextmanager
+    def try_slot(self) -> Iterator[bool]:
+        """Yield True holding a slot, or False immediately if the gate is full."""
+        with self._lock:
+            acquired = self._in_flight < self.max_concurrency
+            if acquired:
+                self._in_flight += 1
+                self.granted += 1
+            else:
+                self.saturated += 1
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "granted": self.granted,
+                "saturated": self.saturated,
+            }
+
+
+llm_gate = LLMGate(get_llm_max_concurrency())
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+from typing import Any, Final
 
 from pydantic import BaseModel, Field, ValidationError
 
 from jeopardy_game.core.config import get_openai_base_url, get_openai_model
+from jeopardy_game.core.serialization import loads
 from jeopardy_game.services.openai_client import OpenAIClient
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,69 @@ class LLMVerdict(BaseModel):
     explanation: str = Field(..., min_length=1, description="Short explanation for the verdict.")
 
 
+# Prebuilt request pieces; shared by every call and never mutated. Everything
+# before the per-call user message is identical across requests, so provider
+# prompt caching can reuse it; keep variable content out of it.
+_VERDICT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "is_correct": {"type": "boolean"},
+        "explanation": {"type": "string"},
+    },
+    "required": ["is_correct", "explanation"],
+    "additionalProperties": False,
+}
+
+_SYSTEM_MESSAGE: Final[dict[str, str]] = {
+    "role": "system",
+    "content": (
+        "You are a strict-but-fair Jeopardy judge. "
+        "Decide if the user's answer should be accepted as correct given the question and the official answer. "
+        "Be tolerant of minor spelling errors, punctuation differences, and common synonyms. "
+        "If the user's answer is clearly wrong, mark it incorrect. "
+        "Return your decision in the required JSON format."
+    ),
+}
+
+# Structured Outputs via JSON schema (enabled through `text.format`).
+_TEXT_FORMAT: Final[dict[str, Any]] = {
+    "format": {
+        "type": "json_schema",
+        "name": "jeopardy_answer_verdict",
+        "schema": _VERDICT_SCHEMA,
+        "strict": True,
+    }
+}
+
+_USER_TEMPLATE: Final[str] = (
+    "QUESTION: {question}\n"
+    "OFFICIAL ANSWER: {correct_answer}\n"
+    "USER ANSWER: {user_answer}"
+)
+
+# Routes requests sharing the prefix to the same cache; bump when the prefix changes.
+PROMPT_CACHE_KEY: Final[str] = "jeopardy-verifier-v1"
+
+
+def build_verifier_payload(*, model: str, question: str, correct_answer: str, user_answer: str) -> dict[str, Any]:
+    """Build the Responses API payload for a verification request.
+
+    Only the user message is created per call; the system message and the
+    output format are shared module-level templates and form a stable prefix.
+    """
+    prompt_user = _USER_TEMPLATE.format(
+        question=question,
+        correct_answer=correct_answer,
+        user_answer=user_answer,
+    )
+    return {
+        "model": model,
+        "input": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt_user}],
+        "text": _TEXT_FORMAT,
+        "prompt_cache_key": PROMPT_CACHE_KEY,
+    }
+
+
 class LLMAnswerVerifier:
     """Verifies answers using OpenAI Responses API."""
 
@@ -28,55 +91,18 @@ class LLMAnswerVerifier:
         self._client = OpenAIClient(api_key=api_key, base_url=get_openai_base_url())
 
     def verify(self, *, question: str, correct_answer: str, user_answer: str) -> LLMVerdict:
-        model = get_openai_model()
-
-        schema: dict[str, Any] = {
-            "type": "object",
-            "properties": {
-                "is_correct": {"type": "boolean"},
-                "explanation": {"type": "string"},
-            },
-            "required": ["is_correct", "explanation"],
-            "additionalProperties": False,
-        }
-
-        prompt_system = (
-            "You are a strict-but-fair Jeopardy judge. "
-            "Decide if the user's answer should be accepted as correct given the question and the official answer. "
-            "Be tolerant of minor spelling errors, punctuation differences, and common synonyms. "
-            "If the user's answer is clearly wrong, mark it incorrect."
+        payload = build_verifier_payload(
+            model=get_openai_model(),
+            question=question,
+            correct_answer=correct_answer,
+            user_answer=user_answer,
         )
 
-        prompt_user = (
-            f"QUESTION: {question}\n"
-            f"OFFICIAL ANSWER: {correct_answer}\n"
-            f"USER ANSWER: {user_answer}\n"
-            "Return your decision in the required JSON format."
-        )
-
-        payload: dict[str, Any] = {
-            "model": model,
-            "input": [
-                {"role": "system", "content": prompt_system},
-                {"role": "user", "content": prompt_user},
-            ],
-            # Structured Outputs via JSON schema.
-            # The docs describe enabling json_schema via text.format. :contentReference[oaicite:4]{index=4}
-            "text": {
-                "format": {
-                    "type": "json_schema",
-                    "name": "jeopardy_answer_verdict",
-                    "schema": schema,
-                    "strict": True,
-                }
-            },
-        }
-
         raw = self._client.create_response(payload=payload)
         parsed_text = _extract_output_text(raw)
         try:
-            data = json.loads(parsed_text)
-        except json.JSONDecodeError as exc:
+            data = loads(parsed_text)
+        except ValueError as exc:
             logger.warning("LLM returned non-JSON output: %r", parsed_text)
             raise RuntimeError(f"LLM output was not valid JSON: {exc}") from exc
 
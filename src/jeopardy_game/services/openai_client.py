@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import time
@@ -10,6 +9,10 @@ from typing import Any
 
 import requests
 
+from jeopardy_game.core import tracing
+from jeopardy_game.core.serialization import dumps, loads
+from jeopardy_game.services.usage import TokenUsage, usage_ledger
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,14 +34,19 @@ class OpenAIClient:
         self._timeout_s = timeout_s
         self._max_retries = max_retries
         self._session = requests.Session()
+        self._url = f"{self._base_url}/responses"
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
 
     @property
     def model(self) -> str:
         return self._model
 
     @classmethod
-    def from_env(cls) -> "OpenAIClient":
-        """Create a client from environment variables.
+    def from_env(cls, *, model: str | None = None) -> "OpenAIClient":
+        """Create a client from environment variables; `model` overrides OPENAI_MODEL.
 
         Required:
           - OPENAI_API_KEY
@@ -54,7 +62,7 @@ class OpenAIClient:
             raise RuntimeError("OPENAI_API_KEY is not set")
 
         base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").strip()
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
+        model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
 
         timeout_s = float(os.getenv("OPENAI_TIMEOUT_S", "20.0"))
         max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
@@ -69,38 +77,52 @@ class OpenAIClient:
 
     def create_response(self, payload: dict[str, Any]) -> dict[str, Any]:
         """POST /v1/responses and return the parsed JSON response."""
-        url = f"{self._base_url}/responses"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
-
-        for attempt in range(self._max_retries + 1):
-            try:
-                resp = self._session.post(
-                    url,
-                    headers=headers,
-                    data=json.dumps(payload),
-                    timeout=self._timeout_s,
-                )
-                if resp.status_code in (429, 500, 502, 503, 504):
-                    raise requests.HTTPError(
-                        f"Transient OpenAI error {resp.status_code}: {resp.text}",
-                        response=resp,
-                    )
-                resp.raise_for_status()
-                return resp.json()
-
-            except (requests.Timeout, requests.ConnectionError, requests.HTTPError) as exc:
-                if attempt >= self._max_retries:
-                    logger.exception("OpenAI request failed after retries: %s", exc)
-                    raise
-                backoff = 0.7 * (2**attempt)
-                logger.warning("OpenAI request failed (%s). Retrying in %.1fs...", exc, backoff)
-                time.sleep(backoff)
+        body = dumps(payload)
+
+        with tracing.span("openai.create_response", model=payload.get("model", self._model)) as call_span:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    with tracing.span("openai.attempt", attempt=attempt) as attempt_span:
+                        resp = self._session.post(
+                            self._url,
+                            headers=self._headers,
+                            data=body,
+                            timeout=self._timeout_s,
+                        )
+                        attempt_span.set_attribute("http.status_code", resp.status_code)
+                        if resp.status_code in (429, 500, 502, 503, 504):
+                            raise requests.HTTPError(
+                                f"Transient OpenAI error {resp.status_code}: {resp.text}",
+                                response=resp,
+                            )
+                        resp.raise_for_status()
+                    call_span.set_attribute("attempts", attempt + 1)
+                    resp_json = loads(resp.content)
+                    self._record_usage(payload.get("model", self._model), resp_json, call_span)
+                    return resp_json
+
+                except (requests.Timeout, requests.ConnectionError, requests.HTTPError) as exc:
+                    if attempt >= self._max_retries:
+                        call_span.set_attribute("attempts", attempt + 1)
+                        logger.exception("OpenAI request failed after retries: %s", exc)
+                        raise
+                    backoff = 0.7 * (2**attempt)
+                    logger.warning("OpenAI request failed (%s). Retrying in %.1fs...", exc, backoff)
+                    with tracing.span("openai.backoff", backoff_s=backoff):
+                        time.sleep(backoff)
 
         raise RuntimeError("Unreachable")
 
+    @staticmethod
+    def _record_usage(model: str, resp_json: dict[str, Any], span: Any) -> None:
+        usage = TokenUsage.from_response(resp_json)
+        if usage is None:
+            return
+        usage_ledger.record(model=model, usage=usage)
+        span.set_attribute("llm.input_tokens", usage.input_tokens)
+        span.set_attribute("llm.cached_input_tokens", usage.cached_input_tokens)
+        span.set_attribute("llm.output_tokens", usage.output_tokens)
+
     @staticmethod
     def extract_output_text(resp_json: dict[str, Any]) -> str:
         """Extract plain text from a Responses API JSON payload.
@@ -0,0 +1,125 @@
+"""Bounded in-process LRU of question rows, invalidated on dataset reload."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from jeopardy_game.core.config import get_dataset_version_check_s, get_question_cache_size
+from jeopardy_game.db.pool import PREPARE_OPTION
+from jeopardy_game.models.dataset_meta import QUESTIONS_DATASET, DatasetMeta
+from jeopardy_game.models.question import Question, QuestionRecord
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+class QuestionCache:
+    """LRU of `QuestionRecord`s by id.
+
+    Clues only change when the loader runs, and it writes a new
+    `dataset_meta.version` when it does. At most once per `version_check_s`
+    the cache re-reads that version and clears itself when it changed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        version_check_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.version_check_s = version_check_s
+        self._clock = clock
+        self._data: OrderedDict[int, QuestionRecord] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: object = _UNSET
+        self._next_check = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, db: Session, question_id: int) -> QuestionRecord | None:
+        """Return the question from the cache, loading it through `db` on a miss."""
+        self._check_version(db)
+        with self._lock:
+            record = self._data.get(question_id)
+            if record is not None:
+                self._data.move_to_end(question_id)
+                self.hits += 1
+                return record
+            self.misses += 1
+
+        row = db.get(Question, question_id, execution_options={PREPARE_OPTION: True})
+        if row is None:
+            return None
+        record = QuestionRecord.from_row(row)
+        if self.maxsize > 0:
+            with self._lock:
+                self._data[question_id] = record
+                self._data.move_to_end(question_id)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return record
+
+    def dataset_version(self, db: Session, default: str | None = None) -> str | None:
+        """The `dataset_meta` version last read (re-read at most once per `version_check_s`).
+
+        Returns `default` while the version has never been read, e.g. because the
+        database has been unreachable since startup.
+        """
+        self._check_version(db)
+        with self._lock:
+            return default if self._version is _UNSET else self._version
+
+    def _check_version(self, db: Session) -> None:
+        now = self._clock()
+        with self._lock:
+            if now < self._next_check:
+                return
+            # Claim the check so concurrent requests don't all query dataset_meta
+            self._next_check = now + self.version_check_s
+
+        try:
+            version = db.scalar(select(DatasetMeta.version).where(DatasetMeta.name == QUESTIONS_DATASET))
+        except SQLAlchemyError:
+            logger.warning("Could not read dataset version; keeping cached questions", exc_info=True)
+            db.rollback()
+            return
+
+        with self._lock:
+            if version != self._version:
+                if self._version is not _UNSET:
+                    self.invalidations += 1
+                self._data.clear()
+                self._version = version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._version = _UNSET
+            self._next_check = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "dataset_version": None if self._version is _UNSET else self._version,
+            }
+
+
+question_cache = QuestionCache(get_question_cache_size(), version_check_s=get_dataset_version_check_s())
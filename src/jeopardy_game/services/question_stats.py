@@ -0,0 +1,101 @@
+"""Roll the attempt log up into per-question accuracy and map it to difficulty levels."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Final
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from jeopardy_game.core.config import get_difficulty_bounds
+from jeopardy_game.models.verification_attempt import (
+    QuestionStats,
+    QuestionStatsRollup,
+    VerificationAttempt,
+)
+
+DIFFICULTY_LEVELS: Final[tuple[str, ...]] = ("easy", "medium", "hard")
+
+# Primary key of the single `question_stats_rollup` row
+_ROLLUP_ROW: Final[int] = 1
+
+
+def difficulty_range(level: str) -> tuple[float, float]:
+    """Accuracy interval [low, high) for a difficulty level."""
+    hard_below, easy_from = get_difficulty_bounds()
+    return {
+        "easy": (easy_from, 2.0),
+        "medium": (hard_below, easy_from),
+        "hard": (-1.0, hard_below),
+    }[level]
+
+
+def _upsert(db: Session, rows: list[dict]):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(QuestionStats).values(rows)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(QuestionStats).values(rows)
+    else:
+        raise RuntimeError(f"question_stats rollup does not support {dialect!r}")
+    attempts = QuestionStats.attempts + stmt.excluded.attempts
+    correct = QuestionStats.correct + stmt.excluded.correct
+    return stmt.on_conflict_do_update(
+        index_elements=[QuestionStats.question_id],
+        set_={
+            "attempts": attempts,
+            "correct": correct,
+            "accuracy": correct * 1.0 / attempts,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def rollup_attempts(db: Session, *, batch_size: int = 50_000, settle_s: float = 60.0) -> int:
+    """Fold new attempts into `question_stats`; returns the number of attempts processed.
+
+    Works incrementally from an id watermark in `question_stats_rollup`. Each batch and
+    its watermark commit together, so an interrupted run neither loses nor
+    double-counts attempts. Attempts younger than `settle_s` are left for the
+    next run, giving in-flight write-behind batches with lower ids time to commit.
+    """
+    cutoff = dt.datetime.now(dt.UTC) - dt.timedelta(seconds=settle_s)
+    processed = 0
+    while True:
+        marker = db.get(QuestionStatsRollup, _ROLLUP_ROW)
+        watermark = marker.last_attempt_id if marker is not None else 0
+
+        window = (
+            select(VerificationAttempt.id)
+            .where(VerificationAttempt.id > watermark, VerificationAttempt.created_at < cutoff)
+            .order_by(VerificationAttempt.id)
+            .limit(batch_size)
+            .subquery()
+        )
+        upper, count = db.execute(select(func.max(window.c.id), func.count())).one()
+        if not count:
+            db.rollback()
+            return processed
+
+        agg = (
+            select(
+                VerificationAttempt.question_id,
+                func.count().label("attempts"),
+                func.sum(case((VerificationAttempt.is_correct, 1), else_=0)).label("correct"),
+            )
+            .where(VerificationAttempt.id > watermark, VerificationAttempt.id <= upper)
+            # Agent answers carry injected mistakes; difficulty reflects players only
+            .where(VerificationAttempt.source != "agent")
+            .group_by(VerificationAttempt.question_id)
+        )
+        rows = [
+            {"question_id": qid, "attempts": n, "correct": ok, "accuracy": ok / n}
+            for qid, n, ok in db.execute(agg)
+        ]
+        if rows:
+            db.execute(_upsert(db, rows))
+        db.merge(QuestionStatsRollup(id=_ROLLUP_ROW, last_attempt_id=upper))
+        db.commit()
+        processed += count
@@ -0,0 +1,112 @@
+"""LLM token accounting per route and model.
+
+`OpenAIClient` reports the `usage` block of every response here. The route
+label comes from a context variable that `UsageLabelMiddleware` sets per
+request (scripts set their own), so services don't need to pass it along.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from jeopardy_game.core.config import get_llm_prices
+
+_route_label: ContextVar[str] = ContextVar("jep_llm_route", default="other")
+
+
+def set_route_label(label: str):
+    """Label LLM usage in the current context; returns a token for `reset_route_label`."""
+    return _route_label.set(label)
+
+
+def reset_route_label(token) -> None:
+    _route_label.reset(token)
+
+
+def current_route_label() -> str:
+    return _route_label.get()
+
+
+@dataclass(frozen=True, slots=True)
+class TokenUsage:
+    input_tokens: int
+    cached_input_tokens: int
+    output_tokens: int
+
+    @classmethod
+    def from_response(cls, resp_json: Mapping[str, Any]) -> TokenUsage | None:
+        """Parse the Responses API `usage` block (None if absent)."""
+        usage = resp_json.get("usage")
+        if not usage:
+            return None
+        details = usage.get("input_tokens_details") or {}
+        return cls(
+            input_tokens=int(usage.get("input_tokens") or 0),
+            cached_input_tokens=int(details.get("cached_tokens") or 0),
+            output_tokens=int(usage.get("output_tokens") or 0),
+        )
+
+
+class UsageLedger:
+    """Running token and cost totals keyed by (route, model)."""
+
+    def __init__(self, prices: Mapping[str, tuple[float, float, float]]) -> None:
+        self._prices = dict(prices)
+        self._lock = threading.Lock()
+        self._totals: dict[tuple[str, str], list[int]] = {}
+
+    def record(self, *, model: str, usage: TokenUsage, route: str | None = None) -> None:
+        key = (route or current_route_label(), model)
+        with self._lock:
+            totals = self._totals.setdefault(key, [0, 0, 0, 0])
+            totals[0] += 1
+            totals[1] += usage.input_tokens
+            totals[2] += usage.cached_input_tokens
+            totals[3] += usage.output_tokens
+
+    def cost_usd(self, model: str, *, input_tokens: int, cached_input_tokens: int, output_tokens: int) -> float | None:
+        price = self._prices.get(model)
+        if price is None:
+            # Dated snapshots ("gpt-4o-mini-2024-07-18") bill like their base model
+            price = next((p for name, p in self._prices.items() if model.startswith(name + "-")), None)
+        if price is None:
+            return None
+        input_price, cached_price, output_price = price
+        uncached = input_tokens - cached_input_tokens
+        return (uncached * input_price + cached_input_tokens * cached_price + output_tokens * output_price) / 1e6
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            items = sorted(self._totals.items())
+        rows = []
+        for (route, model), (requests, input_tokens, cached, output_tokens) in items:
+            cost = self.cost_usd(
+                model, input_tokens=input_tokens, cached_input_tokens=cached, output_tokens=output_tokens
+            )
+            rows.append(
+                {
+                    "route": route,
+                    "model": model,
+                    "requests": requests,
+                    "input_tokens": input_tokens,
+                    "cached_input_tokens": cached,
+                    "output_tokens": output_tokens,
+                    "cache_hit_ratio": round(cached / input_tokens, 4) if input_tokens else None,
+                    "cost_usd": None if cost is None else round(cost, 6),
+                }
+            )
+        return {
+            "by_route_model": rows,
+            "total_cost_usd": round(sum(r["cost_usd"] or 0.0 for r in rows), 6),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+
+usage_ledger = UsageLedger(get_llm_prices())
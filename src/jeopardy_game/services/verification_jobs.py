@@ -0,0 +1,173 @@
+"""Durable queue of verification jobs stored in the `verification_jobs` table."""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import threading
+from collections.abc import Callable
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from jeopardy_game.models.question import Question
+from jeopardy_game.models.verification_job import (
+    DONE,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    VerificationJob,
+    utcnow,
+)
+from jeopardy_game.schemas.verify import VerifyAnswerOut, VerifyJobOut
+from jeopardy_game.services.answer_verification import verify_answer_outcome
+from jeopardy_game.services.attempt_log import AttemptLog
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_job(db: Session, *, question_id: int, user_answer: str) -> VerificationJob:
+    """Insert a queued job and commit."""
+    job = VerificationJob(question_id=question_id, user_answer=user_answer, status=QUEUED)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def job_out(job: VerificationJob) -> VerifyJobOut:
+    result = None
+    if job.status == DONE:
+        result = VerifyAnswerOut(is_correct=bool(job.is_correct), ai_response=job.ai_response or "")
+    return VerifyJobOut(job_id=job.id, status=job.status, result=result, error=job.error)
+
+
+def read_job(db: Session, job_id: str) -> VerifyJobOut | None:
+    """Read a job's current state, ending the transaction so the next read sees new commits."""
+    try:
+        job = db.get(VerificationJob, job_id, populate_existing=True)
+        return None if job is None else job_out(job)
+    finally:
+        db.rollback()
+
+
+def _claimable(cutoff: dt.datetime):
+    return or_(
+        VerificationJob.status == QUEUED,
+        and_(VerificationJob.status == RUNNING, VerificationJob.started_at < cutoff),
+    )
+
+
+def claim_jobs(db: Session, *, worker_id: str, limit: int, lease_s: float) -> list[str]:
+    """Claim up to `limit` jobs (oldest first) for `worker_id`; returns their ids.
+
+    Running jobs whose lease expired (a crashed worker) are claimable again.
+    """
+    now = utcnow()
+    cutoff = now - dt.timedelta(seconds=lease_s)
+    claim = (
+        update(VerificationJob)
+        .values(status=RUNNING, claimed_by=worker_id, started_at=now, attempts=VerificationJob.attempts + 1)
+        .execution_options(synchronize_session=False)
+    )
+    candidates = (
+        select(VerificationJob.id)
+        .where(_claimable(cutoff))
+        .order_by(VerificationJob.created_at)
+        .limit(limit)
+    )
+
+    if db.get_bind().dialect.name == "postgresql":
+        ids = list(db.scalars(candidates.with_for_update(skip_locked=True)))
+        if ids:
+            db.execute(claim.where(VerificationJob.id.in_(ids)))
+        db.commit()
+        return ids
+
+    # No row locks (SQLite): re-check the claim condition in the UPDATE itself;
+    # a worker that lost the race sees rowcount 0 and skips the job.
+    claimed = []
+    for job_id in list(db.scalars(candidates)):
+        result = db.execute(claim.where(VerificationJob.id == job_id, _claimable(cutoff)))
+        if result.rowcount == 1:
+            claimed.append(job_id)
+    db.commit()
+    return claimed
+
+
+def process_job(
+    db: Session, job_id: str, *, worker_id: str, max_attempts: int, attempt_log: AttemptLog | None = None
+) -> None:
+    """Verify a claimed job and store its result."""
+    job = db.get(VerificationJob, job_id, populate_existing=True)
+    if job is None or job.claimed_by != worker_id:
+        return  # reclaimed by another worker after our lease expired
+
+    if job.attempts > max_attempts:
+        job.status, job.error = FAILED, f"Gave up after {max_attempts} attempts."
+    else:
+        question = db.get(Question, job.question_id)
+        if question is None:
+            job.status, job.error = FAILED, "Question not found."
+        else:
+            try:
+                outcome = verify_answer_outcome(question=question, user_answer=job.user_answer)
+            except Exception as exc:
+                logger.exception("Verification job %s failed", job_id)
+                job.status, job.error = FAILED, str(exc)[:500]
+            else:
+                job.status, job.is_correct, job.ai_response = DONE, outcome.out.is_correct, outcome.out.ai_response
+                if attempt_log is not None:
+                    attempt_log.record_outcome(
+                        question_id=job.question_id, user_answer=job.user_answer, outcome=outcome, source="job"
+                    )
+    job.finished_at = utcnow()
+    db.commit()
+
+
+def work_batch(
+    db: Session,
+    *,
+    worker_id: str,
+    batch_size: int,
+    lease_s: float,
+    max_attempts: int,
+    attempt_log: AttemptLog | None = None,
+) -> int:
+    """Claim and process one batch; returns the number of jobs handled."""
+    ids = claim_jobs(db, worker_id=worker_id, limit=batch_size, lease_s=lease_s)
+    for job_id in ids:
+        process_job(db, job_id, worker_id=worker_id, max_attempts=max_attempts, attempt_log=attempt_log)
+    return len(ids)
+
+
+def run_worker(
+    session_factory: Callable[[], Session],
+    *,
+    worker_id: str,
+    batch_size: int,
+    poll_interval_s: float,
+    lease_s: float,
+    max_attempts: int,
+    stop: threading.Event,
+    attempt_log: AttemptLog | None = None,
+) -> int:
+    """Process jobs until `stop` is set, sleeping `poll_interval_s` when the queue is empty."""
+    processed = 0
+    while not stop.is_set():
+        try:
+            with session_factory() as db:
+                handled = work_batch(
+                    db,
+                    worker_id=worker_id,
+                    batch_size=batch_size,
+                    lease_s=lease_s,
+                    max_attempts=max_attempts,
+                    attempt_log=attempt_log,
+                )
+        except Exception:
+            logger.exception("Worker %s: batch failed", worker_id)
+            handled = 0
+        processed += handled
+        if handled == 0:
+            stop.wait(poll_interval_s)
+    return processed
@@ -0,0 +1,263 @@
+"""Configurable answer verification pipeline.
+
+A pipeline is an ordered list of stages (tiers), cheapest first. Each stage
+returns a verdict with a confidence, or abstains; the first verdict whose
+confidence reaches the stage's threshold decides. Stages that run on the
+worker pool get their own timeout, and a global deadline caps the whole
+request. When no stage decides, the most confident undecided verdict is used
+(in practice the heuristic's "incorrect"), so LLM outages, saturation and
+timeouts degrade to the heuristic instead of failing.
+
+A stage can be marked speculative: it is started when the pipeline starts and
+runs alongside the cheaper stages. If one of those decides first, it is
+cancelled. A cancelled call that has not reached the provider yet is skipped,
+and the result of one already in flight is discarded. The same applies to a
+stage that times out. A call that is already running cannot be interrupted,
+though. It keeps its worker thread and its `llm_gate` slot until the provider
+answers or the client's own `OPENAI_TIMEOUT_S` expires.
+
+Configure with `JEP_VERIFY_PIPELINE` (e.g. "exact,heuristic,llm"),
+`JEP_VERIFY_DEADLINE_S`, `JEP_VERIFY_<STAGE>_TIMEOUT_S`,
+`JEP_VERIFY_<STAGE>_MIN_CONFIDENCE` and `JEP_VERIFY_SPECULATIVE` (e.g. "llm").
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+
+from jeopardy_game.core import tracing
+from jeopardy_game.core.config import (
+    get_llm_max_concurrency,
+    get_openai_api_key,
+    get_verify_deadline_s,
+    get_verify_pipeline,
+    get_verify_speculative_stages,
+    get_verify_stage_settings,
+)
+from jeopardy_game.models.question import Question, QuestionRecord
+from jeopardy_game.schemas.verify import VerifyAnswerOut
+from jeopardy_game.services.answer_checker import _normalize, is_answer_correct
+from jeopardy_game.services.llm_gate import llm_gate
+from jeopardy_game.services.llm_verifier import LLMAnswerVerifier
+
+logger = logging.getLogger(__name__)
+
+AnyQuestion = Question | QuestionRecord
+
+
+@dataclass(frozen=True, slots=True)
+class StageVerdict:
+    is_correct: bool
+    confidence: float  # in [0, 1]
+    explanation: str
+
+
+class StageAbstained(Exception):
+    """Raised by a stage that cannot give a verdict (e.g. LLM not configured)."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+StageFn = Callable[[AnyQuestion, str, threading.Event], StageVerdict]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: StageFn
+    timeout_s: float
+    min_confidence: float
+    # Cheap CPU-bound stages run on the caller's thread; their timeout is not enforced.
+    inline: bool = False
+    speculative: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationOutcome:
+    """A verdict plus how it was reached (for headers, traces and the attempt log)."""
+
+    out: VerifyAnswerOut
+    # Stage that produced the verdict ("exact", "heuristic", "llm", or "none")
+    tier: str
+    # `tier` if it decided, else "<tier>:<why later stages did not decide>", e.g. "heuristic:llm_saturated"
+    path: str
+    latency_ms: float
+    stage_ms: dict[str, float] = field(default_factory=dict)
+
+
+# --- built-in stages ---------------------------------------------------------
+
+
+def exact_stage(question: AnyQuestion, user_answer: str, cancel: threading.Event) -> StageVerdict:
+    normalized = _normalize(user_answer)
+    if normalized and normalized == _normalize(question.answer):
+        return StageVerdict(True, 1.0, f"Exact match after normalization: '{question.answer}'.")
+    raise StageAbstained("no_match")
+
+
+def heuristic_stage(question: AnyQuestion, user_answer: str, cancel: threading.Event) -> StageVerdict:
+    ok, msg = is_answer_correct(user_answer, question.answer)
+    # Accepts are reliable; rejects of near-misses and paraphrases are not.
+    return StageVerdict(ok, 1.0 if ok else 0.5, msg)
+
+
+def llm_stage(question: AnyQuestion, user_answer: str, cancel: threading.Event) -> StageVerdict:
+    api_key = get_openai_api_key()
+    if not api_key:
+        raise StageAbstained("unconfigured")
+    with llm_gate.try_slot() as acquired:
+        if not acquired:
+            raise StageAbstained("saturated")
+        if cancel.is_set():
+            raise StageAbstained("cancelled")
+        with tracing.span("llm_verifier.verify"):
+            verdict = LLMAnswerVerifier(api_key=api_key).verify(
+                question=question.question,
+                correct_answer=question.answer,
+                user_answer=user_answer,
+            )
+    return StageVerdict(verdict.is_correct, 0.95, verdict.explanation)
+
+
+# name -> (function, runs inline)
+STAGES: dict[str, tuple[StageFn, bool]] = {
+    "exact": (exact_stage, True),
+    "heuristic": (heuristic_stage, True),
+    "llm": (llm_stage, False),
+}
+
+
+def register_stage(name: str, fn: StageFn, *, inline: bool = False) -> None:
+    """Make a stage available to `JEP_VERIFY_PIPELINE`."""
+    STAGES[name] = (fn, inline)
+
+
+# --- pipeline ----------------------------------------------------------------
+
+
+class VerificationPipeline:
+    def __init__(self, stages: Sequence[Stage], *, deadline_s: float, executor: ThreadPoolExecutor) -> None:
+        self.stages = tuple(stages)
+        self.deadline_s = deadline_s
+        self._executor = executor
+
+    def _submit(self, stage: Stage, question: AnyQuestion, user_answer: str, cancel: threading.Event) -> Future:
+        # Carry the trace and usage-route context into the worker thread
+        ctx = contextvars.copy_context()
+        return self._executor.submit(ctx.run, stage.run, question, user_answer, cancel)
+
+    def verify(self, *, question: AnyQuestion, user_answer: str) -> VerificationOutcome:
+        started = time.perf_counter()
+        deadline = started + self.deadline_s
+        cancel = threading.Event()
+        stage_ms: dict[str, float] = {}
+        submitted: list[Future] = []
+
+        def submit(stage: Stage) -> Future:
+            future = self._submit(stage, question, user_answer, cancel)
+            submitted.append(future)
+            return future
+
+        in_flight: dict[str, tuple[Future, float]] = {
+            s.name: (submit(s), time.perf_counter()) for s in self.stages if s.speculative and not s.inline
+        }
+        fallback: tuple[StageVerdict, str] | None = None
+        reason = "undecided"
+
+        def finish(verdict: StageVerdict | None, tier: str, path: str) -> VerificationOutcome:
+            if verdict is None:
+                out = VerifyAnswerOut(is_correct=False, ai_response="Unable to verify the answer.")
+            else:
+                out = VerifyAnswerOut(is_correct=verdict.is_correct, ai_response=verdict.explanation)
+            return VerificationOutcome(
+                out=out,
+                tier=tier,
+                path=path,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                stage_ms=stage_ms,
+            )
+
+        try:
+            for stage in self.stages:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    reason = "deadline"
+                    break
+                verdict: StageVerdict | None = None
+                with tracing.span(f"verify.{stage.name}") as span:
+                    t0 = time.perf_counter()
+                    try:
+                        if stage.inline:
+                            verdict = stage.run(question, user_answer, cancel)
+                        else:
+                            future, t0 = in_flight.pop(stage.name, None) or (submit(stage), t0)
+                            verdict = future.result(timeout=min(stage.timeout_s, remaining))
+                    except FutureTimeout:
+                        reason = f"{stage.name}_timeout"
+                    except StageAbstained as exc:
+                        reason = f"{stage.name}_{exc.reason}"
+                    except Exception:
+                        logger.warning("Verification stage %s failed", stage.name, exc_info=True)
+                        reason = f"{stage.name}_error"
+                    stage_ms[stage.name] = round((time.perf_counter() - t0) * 1000, 3)
+                    if verdict is not None:
+                        span.set_attribute("confidence", verdict.confidence)
+                        span.set_attribute("is_correct", verdict.is_correct)
+                    else:
+                        span.set_attribute("abstained", reason)
+
+                if verdict is None:
+                    continue
+                if verdict.confidence >= stage.min_confidence:
+                    return finish(verdict, stage.name, stage.name)
+                if fallback is None or verdict.confidence > fallback[0].confidence:
+                    fallback = (verdict, stage.name)
+                reason = "undecided"
+        finally:
+            # Skip queued calls (speculative or timed out); running ones see `cancel`
+            cancel.set()
+            for future in submitted:
+                future.cancel()
+
+        if fallback is None:
+            return finish(None, "none", f"none:{reason}")
+        return finish(fallback[0], fallback[1], f"{fallback[1]}:{reason}")
+
+
+def build_pipeline(
+    names: Sequence[str] | None = None, *, executor: ThreadPoolExecutor | None = None
+) -> VerificationPipeline:
+    """Build a pipeline from configuration (or the given stage names)."""
+    speculative = get_verify_speculative_stages()
+    stages = []
+    for name in names or get_verify_pipeline():
+        if name not in STAGES:
+            raise RuntimeError(f"Unknown verification stage {name!r}; known: {sorted(STAGES)}")
+        fn, inline = STAGES[name]
+        timeout_s, min_confidence = get_verify_stage_settings(name)
+        stages.append(
+            Stage(
+                name=name,
+                run=fn,
+                timeout_s=timeout_s,
+                min_confidence=min_confidence,
+                inline=inline,
+                speculative=name in speculative,
+            )
+        )
+    if executor is None:
+        # Blocking LLM calls; the LLM gate bounds how many are in flight.
+        executor = ThreadPoolExecutor(max_workers=2 * get_llm_max_concurrency(), thread_name_prefix="verify-stage")
+    return VerificationPipeline(stages, deadline_s=get_verify_deadline_s(), executor=executor)
+
+
+verification_pipeline = build_pipeline()
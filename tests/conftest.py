@@ -6,24 +6,22 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from jeopardy_game.api.deps import get_db
+from jeopardy_game.api.deps import get_attempt_log, get_db, get_question_cache, get_read_db
 from jeopardy_game.db.base import Base
+from jeopardy_game.db.session import build_engine
 from jeopardy_game.main import app as fastapi_app
 from jeopardy_game.models.question import Question
+from jeopardy_game.services.attempt_log import AttemptLog
+from jeopardy_game.services.question_cache import QuestionCache
 
 
 @pytest.fixture()
 def db_session() -> Generator[Session, None, None]:
     """Provide a SQLite in-memory DB session shared across threads."""
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,  # critical: reuse the same connection
-    )
+    # Embedded-mode engine: one shared connection (StaticPool), app pragmas, FTS index
+    engine = build_engine("sqlite+pysqlite:///:memory:")
     TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
     Base.metadata.create_all(bind=engine)
@@ -69,6 +67,13 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         yield db_session
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_read_db] = override_get_db
+    # Fresh LRU per test: ids repeat across the per-test in-memory databases
+    cache = QuestionCache(100, version_check_s=0)
+    fastapi_app.dependency_overrides[get_question_cache] = lambda: cache
+    # Not started: tests flush it explicitly, on the test thread's shared session
+    attempts = AttemptLog(lambda: db_session, max_buffer=1000, batch_size=100, flush_interval_s=1.0)
+    fastapi_app.dependency_overrides[get_attempt_log] = lambda: attempts
 
     try:
         with TestClient(fastapi_app) as c:
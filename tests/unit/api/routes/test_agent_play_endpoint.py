@@ -0,0 +1,37 @@
+# tests/unit/api/routes/test_agent_play_endpoint.py
+from __future__ import annotations
+
+import random
+
+from jeopardy_game.models.agent_answer import PrecomputedAgentAnswer
+
+
+def test_agent_play_serves_precomputed_answer(client, db_session, monkeypatch):
+    # No API key: any live LLM call would fail
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("OPENAI_MODEL", "test-model")
+    monkeypatch.setattr(random, "random", lambda: 0.99)  # no skill mistakes
+
+    db_session.add(PrecomputedAgentAnswer(question_id=2, model="test-model", answer="McDonald's"))
+    db_session.commit()
+
+    resp = client.post("/agent-play/", json={"skill": "hard", "round": "Jeopardy!", "value": "$200"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["question_id"] == 2
+    assert data["ai_answer"] == "McDonald's"
+    assert data["is_correct"] is True
+
+
+def test_agent_play_applies_skill_mistakes_to_precomputed_answer(client, db_session, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("OPENAI_MODEL", "test-model")
+    monkeypatch.setattr(random, "random", lambda: 0.0)  # always "I don't know"
+
+    db_session.add(PrecomputedAgentAnswer(question_id=2, model="test-model", answer="McDonald's"))
+    db_session.commit()
+
+    resp = client.post("/agent-play/", json={"skill": "easy"})
+    assert resp.status_code == 200
+    assert resp.json()["ai_answer"] == "I don't know"
+    assert resp.json()["is_correct"] is False
@@ -0,0 +1,51 @@
+# tests/unit/api/routes/test_question_by_id_endpoint.py
+from __future__ import annotations
+
+from jeopardy_game.api.deps import get_question_cache
+from jeopardy_game.main import app as fastapi_app
+from jeopardy_game.models.dataset_meta import QUESTIONS_DATASET, DatasetMeta
+from jeopardy_game.models.question import Question
+
+
+def test_get_question_by_id_sets_etag_and_cache_control(client):
+    resp = client.get("/question/1")
+    assert resp.status_code == 200
+    assert resp.json()["question_id"] == 1
+    assert "answer" not in resp.json()
+    etag = resp.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert "max-age=" in resp.headers["cache-control"]
+
+    again = client.get("/question/1", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    assert client.get("/question/1", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/question/2", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_get_question_by_id_not_found(client):
+    assert client.get("/question/999").status_code == 404
+
+
+def test_cache_is_shared_with_verify_and_dropped_on_reload(client, db_session):
+    cache = fastapi_app.dependency_overrides[get_question_cache]()
+    db_session.add(DatasetMeta(name=QUESTIONS_DATASET, version="v1"))
+    db_session.commit()
+
+    etag = client.get("/question/1").headers["etag"]
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Copernicus"})
+    assert resp.json()["is_correct"] is True
+    assert cache.stats()["hits"] == 1
+
+    # Simulate a reload that changes the clue and bumps the version
+    db_session.get(Question, 1).answer = "Kepler"
+    db_session.get(Question, 1).question = "Reloaded clue"
+    db_session.get(DatasetMeta, QUESTIONS_DATASET).version = "v2"
+    db_session.commit()
+
+    resp = client.get("/question/1", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["question"] == "Reloaded clue"
+    assert cache.stats()["invalidations"] == 1
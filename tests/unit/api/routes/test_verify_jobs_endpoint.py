@@ -0,0 +1,52 @@
+# tests/unit/api/routes/test_verify_jobs_endpoint.py
+from __future__ import annotations
+
+from jeopardy_game.models.verification_job import RUNNING, VerificationJob
+from jeopardy_game.services.verification_jobs import claim_jobs, work_batch
+
+
+def _work(db_session, worker_id: str = "w1") -> int:
+    return work_batch(db_session, worker_id=worker_id, batch_size=10, lease_s=60, max_attempts=3)
+
+
+def test_job_is_queued_then_processed_by_worker(client, db_session, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    resp = client.post("/verify-answer/jobs", json={"question_id": 1, "user_answer": "Copernicus"})
+    assert resp.status_code == 202
+    job = resp.json()
+    assert job["status"] == "queued"
+    assert resp.headers["location"] == f"/verify-answer/jobs/{job['job_id']}"
+
+    assert client.get(f"/verify-answer/jobs/{job['job_id']}").json()["status"] == "queued"
+
+    assert _work(db_session) == 1
+    done = client.get(f"/verify-answer/jobs/{job['job_id']}", params={"wait": 5}).json()
+    assert done["status"] == "done"
+    assert done["result"]["is_correct"] is True
+
+
+def test_unknown_question_and_job_are_404(client):
+    assert client.post("/verify-answer/jobs", json={"question_id": 999, "user_answer": "x"}).status_code == 404
+    assert client.get("/verify-answer/jobs/nope").status_code == 404
+
+
+def test_long_poll_returns_current_state_when_wait_elapses(client, monkeypatch):
+    monkeypatch.setenv("JEP_JOB_POLL_INTERVAL_S", "0.01")
+    job_id = client.post("/verify-answer/jobs", json={"question_id": 1, "user_answer": "x"}).json()["job_id"]
+    assert client.get(f"/verify-answer/jobs/{job_id}", params={"wait": 0.05}).json()["status"] == "queued"
+
+
+def test_claims_are_exclusive_and_expired_leases_are_reclaimed(db_session):
+    db_session.add_all([VerificationJob(question_id=1, user_answer="a"), VerificationJob(question_id=2, user_answer="b")])
+    db_session.commit()
+
+    first = claim_jobs(db_session, worker_id="w1", limit=10, lease_s=60)
+    assert len(first) == 2
+    assert claim_jobs(db_session, worker_id="w2", limit=10, lease_s=60) == []
+
+    # w1 "crashed": with a zero lease its running jobs become claimable again
+    reclaimed = claim_jobs(db_session, worker_id="w2", limit=10, lease_s=0)
+    assert sorted(reclaimed) == sorted(first)
+    job = db_session.get(VerificationJob, first[0], populate_existing=True)
+    assert (job.status, job.claimed_by, job.attempts) == (RUNNING, "w2", 2)
@@ -0,0 +1,126 @@
+# tests/unit/api/test_admission.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from jeopardy_game.api.admission import AdmissionPool, AdmissionRejected, route_class
+from jeopardy_game.api.deps import get_attempt_log
+from jeopardy_game.main import app as fastapi_app
+from jeopardy_game.services import openai_client, verification_pipeline
+from jeopardy_game.services.llm_gate import LLMGate
+
+
+def test_pool_queues_then_sheds():
+    async def scenario():
+        pool = AdmissionPool("t", max_concurrency=1, max_queue=1, queue_timeout_s=1.0)
+        await pool.acquire()
+
+        queued = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert pool.stats()["queue_depth"] == 1
+
+        with pytest.raises(AdmissionRejected):
+            await pool.acquire()
+
+        pool.release()  # hands the slot to the queued request
+        await queued
+        assert pool.stats()["in_flight"] == 1
+        pool.release()
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["in_flight"] == 0
+    assert stats["admitted"] == 2
+    assert stats["shed"] == 1
+
+
+def test_pool_queue_timeout():
+    async def scenario():
+        pool = AdmissionPool("t", max_concurrency=1, max_queue=4, queue_timeout_s=0.01)
+        await pool.acquire()
+        with pytest.raises(AdmissionRejected):
+            await pool.acquire()
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["timed_out"] == 1
+    assert stats["queue_depth"] == 0
+
+
+def test_job_polls_have_their_own_route_class():
+    assert route_class("/verify-answer/jobs") == "jobs"
+    assert route_class("/verify-answer/jobs/abc123") == "job_poll"
+    assert route_class("/verify-answer/") == "verify"
+
+
+def test_full_route_class_returns_503(client, monkeypatch):
+    pools = fastapi_app.state.admission_pools
+    monkeypatch.setattr(pools["question"], "max_concurrency", 0)
+    monkeypatch.setattr(pools["question"], "max_queue", 0)
+
+    resp = client.get("/question/", params={"round": "Jeopardy!", "value": "$200"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"]
+
+    # Other route classes are unaffected
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Copernicus"})
+    assert resp.status_code == 200
+
+    metrics = client.get("/metrics/admission").json()
+    assert metrics["pools"]["question"]["shed"] >= 1
+
+
+def test_verify_degrades_to_heuristic_when_llm_saturated(client, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    gate = LLMGate(0)
+    monkeypatch.setattr(verification_pipeline, "llm_gate", gate)
+
+    def fail_create_response(self, payload):
+        raise AssertionError("LLM must not be called while saturated")
+
+    monkeypatch.setattr(openai_client.OpenAIClient, "create_response", fail_create_response)
+
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Coperniadawdacs"})
+    assert resp.status_code == 200
+    assert resp.json()["is_correct"] is False
+    assert resp.headers["x-verify-tier"] == "heuristic"
+    assert gate.stats()["saturated"] == 1
+
+
+def test_question_responds_while_llm_classes_are_saturated(client, monkeypatch):
+    pools = fastapi_app.state.admission_pools
+    agent, verify = pools["agent"].max_concurrency, pools["verify"].max_concurrency
+    release = threading.Event()
+    log = fastapi_app.dependency_overrides[get_attempt_log]
+
+    def blocking_attempt_log():
+        # Sync dependency: holds a worker thread, like a slow LLM call would
+        release.wait(10)
+        return log()
+
+    fastapi_app.dependency_overrides[get_attempt_log] = blocking_attempt_log
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    calls = [("/agent-play/", {})] * agent + [("/verify-answer/", {"question_id": 1, "user_answer": "x"})] * verify
+    workers = [threading.Thread(target=client.post, args=(path,), kwargs={"json": body}) for path, body in calls]
+    try:
+        for w in workers:
+            w.start()
+        deadline = time.monotonic() + 5
+        while pools["agent"].stats()["in_flight"] < agent or pools["verify"].stats()["in_flight"] < verify:
+            assert time.monotonic() < deadline, "agent/verify never saturated"
+            time.sleep(0.01)
+
+        got = []
+        probe = threading.Thread(target=lambda: got.append(client.get("/question/1")))
+        probe.start()
+        probe.join(5)
+        assert got and got[0].status_code == 200
+    finally:
+        release.set()
+        for w in workers:
+            w.join()
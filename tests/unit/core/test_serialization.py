@@ -0,0 +1,29 @@
+# tests/unit/core/test_serialization.py
+from __future__ import annotations
+
+from jeopardy_game.core.serialization import FastJSONResponse, dumps, loads
+from jeopardy_game.services.llm_verifier import build_verifier_payload
+
+
+def test_dumps_loads_roundtrip_unicode():
+    obj = {"answer": "café", "value": 200, "ok": True, "items": [1, None]}
+    data = dumps(obj)
+    assert isinstance(data, bytes)
+    assert loads(data) == obj
+    assert loads(data.decode("utf-8")) == obj
+
+
+def test_fast_json_response_renders_compact_bytes():
+    resp = FastJSONResponse({"is_correct": True, "ai_response": "ok"})
+    assert loads(resp.body) == {"is_correct": True, "ai_response": "ok"}
+    assert resp.headers["content-type"] == "application/json"
+
+
+def test_verifier_payload_reuses_templates():
+    p1 = build_verifier_payload(model="m", question="q1", correct_answer="a1", user_answer="u1")
+    p2 = build_verifier_payload(model="m", question="q2", correct_answer="a2", user_answer="u2")
+
+    assert p1["text"] is p2["text"]
+    assert p1["input"][0] is p2["input"][0]
+    assert "USER ANSWER: u1" in p1["input"][1]["content"]
+    assert loads(dumps(p1)) == p1
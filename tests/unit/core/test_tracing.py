@@ -0,0 +1,160 @@
+# tests/unit/core/test_tracing.py
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from jeopardy_game.core import tracing
+from jeopardy_game.core.tracing import JsonlExporter, Span, Tracer, parse_traceparent
+from jeopardy_game.main import app as fastapi_app
+from jeopardy_game.services.openai_client import OpenAIClient
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.closed = False
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        self.closed = True
+
+    def named(self, name: str) -> list[Span]:
+        return [s for s in self.spans if s.name == name]
+
+
+@pytest.fixture()
+def exporter():
+    exporter = ListExporter()
+    previous = tracing.set_tracer(Tracer(exporter, sample_rate=1.0))
+    try:
+        yield exporter
+    finally:
+        tracing.set_tracer(previous)
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+    assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert parse_traceparent("garbage") is None
+
+
+def test_request_trace_continues_traceparent_and_nests_spans(client, exporter):
+    resp = client.post(
+        "/verify-answer/",
+        json={"question_id": 1, "user_answer": "Copernicus"},
+        headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["x-trace-id"] == TRACE_ID
+
+    (root,) = exporter.named("POST /verify-answer/")
+    assert root.parent_id == PARENT_ID
+    assert root.attributes["http.status_code"] == 200
+    assert {s.trace_id for s in exporter.spans} == {TRACE_ID}
+
+    (exact,) = exporter.named("verify.exact")
+    assert exact.parent_id == root.span_id
+    assert exact.attributes["is_correct"] is True
+    assert not exporter.named("answer_checker.is_answer_correct")  # decided by the cheaper tier
+    queries = exporter.named("db.query")
+    assert queries and all(q.attributes["db.system"] == "sqlite" for q in queries)
+    (wait,) = exporter.named("admission.wait")
+    assert wait.parent_id == root.span_id
+
+
+def test_head_sampling_drops_unsampled_traces(client):
+    exporter = ListExporter()
+    previous = tracing.set_tracer(Tracer(exporter, sample_rate=0.0))
+    try:
+        resp = client.get("/question/1")
+        assert "x-trace-id" not in resp.headers
+        assert exporter.spans == []
+
+        # An upstream sampling decision wins over the local rate
+        client.get("/question/1", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+        assert exporter.named("GET /question/{question_id}")
+    finally:
+        tracing.set_tracer(previous)
+
+
+def test_openai_retries_and_backoff_are_traced(exporter, monkeypatch):
+    class FakeResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.text = "busy"
+            self.content = b'{"output": []}'
+
+        def raise_for_status(self) -> None:
+            if self.status_code >= 400:
+                raise requests.HTTPError(self.text, response=self)
+
+    replies = iter([FakeResponse(503), FakeResponse(200)])
+    client = OpenAIClient(api_key="k", max_retries=2)
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: next(replies))
+    monkeypatch.setattr("jeopardy_game.services.openai_client.time.sleep", lambda s: None)
+
+    with tracing.start_trace("test"):
+        assert client.create_response({"model": "m"}) == {"output": []}
+
+    (call,) = exporter.named("openai.create_response")
+    assert call.attributes["attempts"] == 2
+    attempts = exporter.named("openai.attempt")
+    assert [a.attributes["http.status_code"] for a in attempts] == [503, 200]
+    assert [a.error for a in attempts] == [True, False]
+    (backoff,) = exporter.named("openai.backoff")
+    assert backoff.parent_id == call.span_id
+
+
+def test_jsonl_exporter_writes_one_line_per_span(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(JsonlExporter(str(path)))
+    with tracer.start_trace("root"):
+        with tracer.span("child", n=1):
+            pass
+    tracer.exporter.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["child", "root"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+    assert lines[0]["attributes"] == {"n": 1}
+
+
+def test_jsonl_exporter_drops_spans_after_shutdown(tmp_path):
+    exporter = JsonlExporter(str(tmp_path / "traces.jsonl"), max_queue=1)
+    exporter.shutdown()
+    exporter.export(Span("late", TRACE_ID, PARENT_ID, None, 0))
+    assert exporter.dropped == 1
+
+
+def test_exporter_counts_concurrent_drops_exactly(tmp_path):
+    exporter = JsonlExporter(str(tmp_path / "traces.jsonl"))
+    exporter.shutdown()
+    span = Span("late", TRACE_ID, PARENT_ID, None, 0)
+
+    def export_many():
+        for _ in range(10_000):
+            exporter.export(span)
+
+    threads = [threading.Thread(target=export_many) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert exporter.dropped == 40_000
+
+
+def test_app_shutdown_closes_the_exporter(exporter):
+    with TestClient(fastapi_app):
+        assert not exporter.closed
+    assert exporter.closed
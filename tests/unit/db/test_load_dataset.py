@@ -0,0 +1,60 @@
+# tests/unit/db/test_load_dataset.py
+from __future__ import annotations
+
+import csv
+import importlib.util
+from collections import Counter
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.models.question import Question
+
+SCRIPTS = Path(__file__).resolve().parents[3] / "scripts"
+
+
+def _script(name: str):
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_value_accepts_thousands_separators():
+    loader = _script("load_dataset")
+    assert [loader.parse_value(v) for v in ("$200", "200", " $1,200 ", "$12,000")] == [200, 200, 1200, 12000]
+    assert [loader.parse_value(v) for v in ("None", "$1,20", "1,2000", "")] == [None, None, None, None]
+
+
+def test_synthetic_dataset_round_trips_through_the_loader(tmp_path, monkeypatch):
+    generator = _script("generate_synthetic_dataset")
+    loader = _script("load_dataset")
+
+    csv_path = tmp_path / "synthetic.csv"
+    rows = list(generator.generate_rows(3000, seed=1))
+    with open(csv_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(generator.HEADER)
+        writer.writerows(rows)
+
+    expected = Counter(
+        (row[2], v) for row in rows if (v := loader.parse_value(row[4])) is not None and v <= 1200
+    )
+    assert any("," in row[4] for row in rows)
+    assert expected[("Double Jeopardy!", 1000)]
+
+    db_url = f"sqlite:///{tmp_path / 'jeopardy.db'}"
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    monkeypatch.setenv("JEP_CSV_PATH", str(csv_path))
+    monkeypatch.delenv("JEP_SNAPSHOT_PATH", raising=False)
+    loader.main()
+
+    engine = build_engine(db_url)
+    with engine.connect() as conn:
+        counts = conn.execute(
+            select(Question.round, Question.value, func.count()).group_by(Question.round, Question.value)
+        )
+        loaded = Counter({(round_name, value): n for round_name, value, n in counts})
+    engine.dispose()
+    assert loaded == expected
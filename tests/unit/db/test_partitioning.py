@@ -0,0 +1,31 @@
+# tests/unit/db/test_partitioning.py
+from __future__ import annotations
+
+from jeopardy_game.db.partitioning import questions_table_ddl
+
+
+def test_round_partitioning_ddl():
+    ddl = questions_table_ddl()
+
+    assert ddl[0].endswith("PARTITION BY LIST (round)")
+    assert "PRIMARY KEY (id, round)" in ddl[0]
+    assert any("questions_double_jeopardy PARTITION OF questions FOR VALUES IN ('Double Jeopardy!')" in s for s in ddl)
+    assert any(s.endswith("questions_default PARTITION OF questions DEFAULT") for s in ddl)
+    # Pruning replaces the round indexes
+    assert not any("ix_questions_round" in s for s in ddl)
+
+
+def test_round_value_partitioning_ddl():
+    ddl = questions_table_ddl("bench.questions", value_bounds=[800, 0, 400])
+
+    assert "PRIMARY KEY (id, round, value)" in ddl[0]
+    assert any("bench.questions_jeopardy_v0 PARTITION OF bench.questions_jeopardy FOR VALUES FROM (0) TO (400)" in s for s in ddl)
+    assert any("bench.questions_jeopardy_v400 PARTITION OF bench.questions_jeopardy FOR VALUES FROM (400) TO (800)" in s for s in ddl)
+    assert any(s.endswith("bench.questions_final_jeopardy_vdefault PARTITION OF bench.questions_final_jeopardy DEFAULT") for s in ddl)
+
+
+def test_plain_table_ddl_keeps_model_indexes():
+    ddl = questions_table_ddl(by_round=False)
+
+    assert "PARTITION" not in " ".join(ddl)
+    assert "CREATE INDEX ix_questions_round_value ON questions (round, value)" in ddl
@@ -0,0 +1,80 @@
+# tests/unit/db/test_replica_routing.py
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from jeopardy_game.db.base import Base
+from jeopardy_game.db.session import ReplicaRouter, build_engine
+from jeopardy_game.models.question import Question
+
+
+def _seed(url: str, answer: str):
+    engine = build_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(
+            Question(
+                show_number=1,
+                air_date=dt.date(2004, 12, 31),
+                round="Jeopardy!",
+                category="HISTORY",
+                value=200,
+                question="q",
+                answer=answer,
+            )
+        )
+        db.commit()
+    return engine
+
+
+def _read_answer(router: ReplicaRouter) -> str:
+    with router.read_session() as db:
+        return db.execute(select(Question.answer)).scalar_one()
+
+
+@pytest.fixture()
+def engines(tmp_path):
+    primary = _seed(f"sqlite:///{tmp_path / 'primary.db'}", "primary")
+    replica_a = _seed(f"sqlite:///{tmp_path / 'a.db'}", "a")
+    replica_b = _seed(f"sqlite:///{tmp_path / 'b.db'}", "b")
+    return primary, replica_a, replica_b
+
+
+def test_reads_round_robin_across_replicas(engines):
+    primary, replica_a, replica_b = engines
+    router = ReplicaRouter(primary, [replica_a, replica_b])
+
+    assert [_read_answer(router) for _ in range(4)] == ["a", "b", "a", "b"]
+
+
+def test_no_replicas_reads_from_primary(engines):
+    primary, _, _ = engines
+    router = ReplicaRouter(primary, [])
+
+    assert _read_answer(router) == "primary"
+
+
+def test_failed_replica_is_skipped_until_cooldown(engines, tmp_path):
+    primary, replica_a, _ = engines
+    broken = build_engine(f"sqlite:///{tmp_path / 'missing' / 'dir' / 'x.db'}")
+    router = ReplicaRouter(primary, [broken, replica_a], cooldown_s=60)
+
+    assert _read_answer(router) == "primary"  # the failed read is retried on the primary
+
+    assert router.stats()["unhealthy"]
+    assert [_read_answer(router) for _ in range(3)] == ["a", "a", "a"]
+
+
+def test_all_replicas_down_falls_back_to_primary(engines, tmp_path):
+    primary, _, _ = engines
+    broken = build_engine(f"sqlite:///{tmp_path / 'missing' / 'x.db'}")
+    router = ReplicaRouter(primary, [broken], cooldown_s=60)
+
+    with router.read_session() as db:
+        assert db.get(Question, 1).answer == "primary"
+        assert db.bind is primary
+    assert _read_answer(router) == "primary"
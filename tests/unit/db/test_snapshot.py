@@ -0,0 +1,107 @@
+# tests/unit/db/test_snapshot.py
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from jeopardy_game.api.deps import get_read_db, get_snapshot
+from jeopardy_game.db.snapshot import QuestionSnapshot, reset_question_snapshot, write_snapshot
+from jeopardy_game.main import app as fastapi_app
+from jeopardy_game.models.dataset_meta import QUESTIONS_DATASET, DatasetMeta
+from jeopardy_game.models.question import Question, QuestionRecord
+
+RECORDS = [
+    QuestionRecord(id=7, round="Jeopardy!", category="SCIENCE", value=400, question="H2O", answer="Water"),
+    QuestionRecord(id=3, round="Jeopardy!", category="CAFÉS", value=200, question="Crème brûlée?", answer="Dessert"),
+    QuestionRecord(id=12, round="Double Jeopardy!", category="SCIENCE", value=400, question="NaCl", answer="Salt"),
+    QuestionRecord(id=5, round="Jeopardy!", category="SCIENCE", value=200, question="Au", answer="Gold"),
+]
+
+
+@pytest.fixture()
+def snapshot(tmp_path) -> QuestionSnapshot:
+    path = tmp_path / "questions.snap"
+    assert write_snapshot(str(path), RECORDS) == len(RECORDS)
+    return QuestionSnapshot(str(path))
+
+
+def test_snapshot_lookup_by_id(snapshot):
+    assert len(snapshot) == 4
+    for record in RECORDS:
+        assert snapshot.get(record.id) == record
+    assert snapshot.get(4) is None
+    assert snapshot.get(99) is None
+
+
+def test_snapshot_random_question_stays_in_bucket(snapshot):
+    seen = {snapshot.random_question(round_name="Jeopardy!", value=200).id for _ in range(50)}
+    assert seen == {3, 5}
+    assert snapshot.random_question(round_name="Jeopardy!", value=1200) is None
+    assert snapshot.random_question(round_name="Final Jeopardy!", value=200) is None
+
+
+def test_endpoints_served_from_snapshot(client, snapshot, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    fastapi_app.dependency_overrides[get_snapshot] = lambda: snapshot
+
+    resp = client.get("/question/", params={"round": "Double Jeopardy!", "value": "$400"})
+    assert resp.status_code == 200
+    assert resp.json()["question_id"] == 12
+
+    resp = client.post("/verify-answer/", json={"question_id": 7, "user_answer": "water"})
+    assert resp.status_code == 200
+    assert resp.json()["is_correct"] is True
+
+    # Ids missing from the snapshot fall back to the database
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Copernicus"})
+    assert resp.status_code == 200
+    assert resp.json()["is_correct"] is True
+
+
+def test_snapshot_serves_while_database_is_unreachable(client, tmp_path):
+    path = tmp_path / "questions.snap"
+    write_snapshot(str(path), RECORDS, dataset_version="v1")
+    snapshot = QuestionSnapshot(str(path))
+    unreachable = Session(create_engine(f"sqlite:///{tmp_path / 'missing' / 'jeopardy.db'}"))
+    fastapi_app.dependency_overrides[get_snapshot] = lambda: snapshot
+    fastapi_app.dependency_overrides[get_read_db] = lambda: unreachable
+
+    resp = client.get("/question/7")
+    assert resp.status_code == 200
+    assert resp.json()["question"] == "H2O"
+
+
+def test_dataset_reload_replaces_stale_snapshot(client, db_session, tmp_path, monkeypatch):
+    path = tmp_path / "questions.snap"
+    monkeypatch.setenv("JEP_SNAPSHOT_PATH", str(path))
+    reset_question_snapshot()
+
+    def load(version: str, clue: str) -> None:
+        db_session.get(Question, 1).question = clue
+        db_session.merge(DatasetMeta(name=QUESTIONS_DATASET, version=version))
+        db_session.commit()
+
+    def clue() -> str:
+        return client.get("/question/1").json()["question"]
+
+    def export(version: str, clue: str) -> None:
+        record = QuestionRecord.from_row(db_session.get(Question, 1))
+        write_snapshot(str(path), [dataclasses.replace(record, question=clue)], dataset_version=version)
+
+    load("v1", "v1 clue")
+    export("v1", "v1 clue")
+    assert clue() == "v1 clue"
+
+    # Reloaded in the DB, snapshot not yet rewritten: the old file is skipped
+    load("v2", "v2 clue")
+    assert clue() == "v2 clue"
+
+    # The loader's new snapshot is mapped without a restart
+    export("v2", "v2 clue")
+    db_session.get(Question, 1).question = "db only"
+    db_session.commit()
+    assert clue() == "v2 clue"
+    reset_question_snapshot()
@@ -0,0 +1,70 @@
+# tests/unit/db/test_sqlite.py
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import text
+
+from jeopardy_game.db.base import Base
+from jeopardy_game.db.session import build_engine
+from jeopardy_game.db.sqlite import fts_query
+from jeopardy_game.models.question import Question
+
+
+def test_file_engine_uses_wal_and_tuned_pragmas(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'jeopardy.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM sqlite_master WHERE name = 'questions_fts'")).scalar()
+    engine.dispose()
+
+
+def test_fts_query_quotes_user_input():
+    assert fts_query('  this "man\'s  theory ') == '"this" """man\'s" "theory"*'
+    assert fts_query("   ") is None
+
+
+def test_search_endpoint_matches_words_and_prefixes(client):
+    resp = client.get("/questions/search", params={"q": "billionth burg"})
+    assert resp.status_code == 200
+    assert [q["question_id"] for q in resp.json()] == [2]
+    assert "answer" not in resp.json()[0]
+
+    assert [q["question_id"] for q in client.get("/questions/search", params={"q": "history"}).json()] == [1]
+    # FTS5 syntax in the query is matched literally, not parsed
+    assert client.get("/questions/search", params={"q": 'NEAR( "x" OR'}).json() == []
+    assert client.get("/questions/search", params={"q": "  "}).status_code == 400
+
+
+def test_search_index_follows_updates(client, db_session):
+    db_session.add(
+        Question(
+            show_number=1,
+            air_date=dt.date(2001, 1, 1),
+            round="Jeopardy!",
+            category="SCIENCE",
+            value=400,
+            question="This element has the symbol Fe",
+            answer="Iron",
+        )
+    )
+    db_session.commit()
+    assert len(client.get("/questions/search", params={"q": "symbol fe"}).json()) == 1
+
+    db_session.get(Question, 1).question = "Rewritten clue about telescopes"
+    db_session.commit()
+    assert client.get("/questions/search", params={"q": "galileo"}).json() == []
+    assert [q["question_id"] for q in client.get("/questions/search", params={"q": "telescope"}).json()] == [1]
+
+
+def test_random_sampler_reaches_every_question_in_bucket(client):
+    seen = {
+        client.get("/question/", params={"round": "Jeopardy!", "value": "$200"}).json()["question_id"]
+        for _ in range(60)
+    }
+    assert seen == {1, 2}
+    assert client.get("/question/", params={"round": "Jeopardy!", "value": "$1000"}).status_code == 404
@@ -0,0 +1,109 @@
+# tests/unit/services/test_attempt_log.py
+from __future__ import annotations
+
+import datetime as dt
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from jeopardy_game.api.deps import get_attempt_log
+from jeopardy_game.db.base import Base
+from jeopardy_game.main import app as fastapi_app
+from jeopardy_game.models.dataset_meta import DatasetMeta
+from jeopardy_game.models.verification_attempt import (
+    QuestionStats,
+    QuestionStatsRollup,
+    VerificationAttempt,
+)
+from jeopardy_game.services.attempt_log import AttemptLog, AttemptRecord
+from jeopardy_game.services.question_stats import rollup_attempts
+
+
+def _attempt(question_id: int = 1, *, is_correct: bool = True, source: str = "api") -> AttemptRecord:
+    return AttemptRecord(
+        question_id=question_id,
+        user_answer="What is Copernicus?",
+        is_correct=is_correct,
+        tier="heuristic",
+        path="heuristic",
+        source=source,
+        latency_ms=0.5,
+        stage_ms={"exact": 0.1, "heuristic": 0.4},
+        created_at=dt.datetime.now(dt.UTC),
+    )
+
+
+def test_full_buffer_drops_and_counts():
+    log = AttemptLog(lambda: None, max_buffer=2, batch_size=10, flush_interval_s=1.0)
+    assert log.record(_attempt()) and log.record(_attempt())
+    assert not log.record(_attempt())
+    assert log.stats()["buffered"] == 2
+    assert log.stats()["dropped_full"] == 1
+
+
+def test_background_writer_flushes_in_batches():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    log = AttemptLog(sessionmaker(bind=engine), max_buffer=100, batch_size=5, flush_interval_s=30.0)
+    log.start()
+    try:
+        for _ in range(5):
+            log.record(_attempt())
+        deadline = time.monotonic() + 5
+        while log.stats()["written"] < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log.stats()["written"] == 5  # size trigger, long before the 30 s timer
+        log.record(_attempt())
+    finally:
+        log.stop()  # final flush writes the straggler
+    assert log.stats()["written"] == 6
+    with sessionmaker(bind=engine)() as db:
+        answers = db.scalars(select(VerificationAttempt.normalized_answer)).all()
+    assert answers == ["copernicus"] * 6
+
+
+def test_verify_logs_attempts_and_rollup_drives_difficulty_filter(client, db_session, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("JEP_DIFFICULTY_MIN_ATTEMPTS", "2")
+    log = fastapi_app.dependency_overrides[get_attempt_log]()
+
+    params = {"round": "Jeopardy!", "value": "$200", "difficulty": "hard"}
+    assert client.get("/question/", params=params).status_code == 404  # no stats yet
+
+    for answer in ("Galileo", "Kepler", "Brahe", "Copernicus"):
+        client.post("/verify-answer/", json={"question_id": 1, "user_answer": answer})
+    client.post("/verify-answer/", json={"question_id": 2, "user_answer": "McDonald's"})
+    assert log.flush() == 5
+
+    paths = db_session.scalars(select(VerificationAttempt.path).where(VerificationAttempt.question_id == 1)).all()
+    assert sorted(paths) == ["exact"] + ["heuristic:llm_unconfigured"] * 3
+
+    assert rollup_attempts(db_session, settle_s=0) == 5
+    assert rollup_attempts(db_session, settle_s=0) == 0  # watermark: nothing counted twice
+    (watermark,) = db_session.scalars(select(QuestionStatsRollup)).all()
+    assert watermark.last_attempt_id == db_session.scalar(select(func.max(VerificationAttempt.id)))
+    assert db_session.scalars(select(DatasetMeta)).all() == []
+    stats = db_session.get(QuestionStats, 1)
+    assert (stats.attempts, stats.correct) == (4, 1)  # accuracy 0.25 -> "hard"
+
+    resp = client.get("/question/", params=params)
+    assert resp.status_code == 200
+    assert resp.json()["question_id"] == 1
+    # Question 2 has one attempt, below the minimum
+    assert client.get("/question/", params={**params, "difficulty": "easy"}).status_code == 404
+    assert client.get("/question/", params={**params, "difficulty": "impossible"}).status_code == 400
+
+
+def test_rollup_ignores_agent_attempts(db_session):
+    log = AttemptLog(lambda: db_session, max_buffer=10, batch_size=10, flush_interval_s=1.0)
+    log.record(_attempt(1, is_correct=False, source="agent"))
+    log.record(_attempt(1, is_correct=True, source="job"))
+    log.flush()
+
+    assert rollup_attempts(db_session, settle_s=0) == 2
+    stats = db_session.get(QuestionStats, 1)
+    assert (stats.attempts, stats.correct, stats.accuracy) == (1, 1, 1.0)
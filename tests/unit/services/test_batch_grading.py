@@ -0,0 +1,117 @@
+# tests/unit/services/test_batch_grading.py
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from jeopardy_game.db.snapshot import QuestionSnapshot, write_snapshot
+from jeopardy_game.models.question import QuestionRecord
+from jeopardy_game.services.batch_grading import (
+    LLMStage,
+    RecordWriter,
+    SnapshotAnswerSource,
+    grade_stream,
+    read_records,
+)
+from jeopardy_game.services.usage import current_route_label
+
+RECORDS = [
+    QuestionRecord(id=1, round="Jeopardy!", category="SCIENCE", value=200, question="H2O", answer="Water"),
+    QuestionRecord(id=2, round="Jeopardy!", category="SCIENCE", value=400, question="NaCl", answer="Salt"),
+]
+
+
+@pytest.fixture()
+def answers(tmp_path) -> SnapshotAnswerSource:
+    path = tmp_path / "questions.snap"
+    write_snapshot(str(path), RECORDS)
+    return SnapshotAnswerSource(QuestionSnapshot(str(path)))
+
+
+def _log(n: int) -> list[dict]:
+    choices = [(1, "water"), (2, "pepper"), (99, "anything")]
+    return [{"attempt": i, "question_id": choices[i % 3][0], "user_answer": choices[i % 3][1]} for i in range(n)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_grade_stream_keeps_order_and_passes_fields_through(answers, workers):
+    out = list(grade_stream(_log(30), answers=answers, workers=workers, chunk_size=4))
+
+    assert [r["attempt"] for r in out] == list(range(30))
+    assert {(r["question_id"], r["is_correct"], r["source"]) for r in out} == {
+        (1, True, "heuristic"),
+        (2, False, "heuristic"),
+        (99, None, "missing"),
+    }
+
+
+def test_llm_stage_only_sees_heuristic_misses(answers):
+    seen = []
+
+    def verify(*, question, correct_answer, user_answer):
+        seen.append((user_answer, current_route_label()))
+        return SimpleNamespace(is_correct=True, explanation="close enough")
+
+    llm = LLMStage(verify, rate_per_s=1000, workers=2, route_label="grading")
+    try:
+        out = list(grade_stream(_log(6), answers=answers, llm=llm, chunk_size=4))
+    finally:
+        llm.close()
+
+    assert seen == [("pepper", "grading"), ("pepper", "grading")]
+    assert [r["source"] for r in out if r["question_id"] == 2] == ["llm", "llm"]
+
+
+def test_malformed_records_are_marked_invalid(answers):
+    records = [
+        {"question_id": "", "user_answer": "water"},
+        {"user_answer": "water"},
+        {"question_id": "abc", "user_answer": "water"},
+        {"question_id": 1, "user_answer": None},
+        {"question_id": "1", "user_answer": "water"},
+    ]
+    out = list(grade_stream(records, answers=answers, chunk_size=2))
+
+    assert [(r["is_correct"], r["source"]) for r in out] == [(None, "invalid")] * 4 + [(True, "heuristic")]
+
+
+def test_llm_stage_counts_failures_and_keeps_heuristic_verdicts(answers, caplog):
+    def verify(**kwargs):
+        raise RuntimeError("upstream down")
+
+    llm = LLMStage(verify, rate_per_s=1000, workers=2)
+    try:
+        out = list(grade_stream(_log(6), answers=answers, llm=llm, chunk_size=4))
+    finally:
+        llm.close()
+
+    assert llm.failures == 2
+    assert [(r["is_correct"], r["source"]) for r in out if r["question_id"] == 2] == [(False, "heuristic")] * 2
+    assert len([r for r in caplog.records if r.exc_info]) == 1
+
+
+def test_ndjson_and_csv_round_trip():
+    buf = io.StringIO()
+    writer = RecordWriter(buf, "csv", output_fields=())
+    writer.write({"question_id": 1, "user_answer": "water"})
+    buf.seek(0)
+    assert list(read_records(buf, "csv")) == [{"question_id": "1", "user_answer": "water"}]
+
+    buf = io.StringIO()
+    RecordWriter(buf, "ndjson").write({"question_id": 1, "user_answer": "water"})
+    buf.seek(0)
+    assert list(read_records(buf, "ndjson")) == [{"question_id": 1, "user_answer": "water"}]
+
+
+def test_csv_columns_are_fixed_by_the_first_record():
+    buf = io.StringIO()
+    writer = RecordWriter(buf, "csv")
+    writer.write({"question_id": 1, "user_answer": "water", "is_correct": True, "source": "heuristic"})
+    second = {"question_id": 2, "user_answer": "salt", "is_correct": True, "source": "llm"}
+    writer.write({**second, "explanation": "close enough", "note": "only in this record"})
+    buf.seek(0)
+    rows = list(read_records(buf, "csv"))
+    assert list(rows[0]) == ["question_id", "user_answer", "is_correct", "source", "explanation"]
+    assert rows[0]["explanation"] == "" and rows[1]["explanation"] == "close enough"
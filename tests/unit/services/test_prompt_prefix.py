@@ -0,0 +1,113 @@
+# tests/unit/services/test_prompt_prefix.py
+"""Prompt-prefix stability: everything before the last message must not vary per call.
+
+Provider prompt caching only reuses an identical prefix. If a prompt change
+is intended, bump the module's PROMPT_CACHE_KEY and update the digest here.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+import requests
+
+from jeopardy_game.services import llm_verifier
+from jeopardy_game.services.agents import llm_agent
+from jeopardy_game.services.usage import TokenUsage, UsageLedger, usage_ledger
+
+PREFIX_DIGESTS = {
+    llm_verifier.PROMPT_CACHE_KEY: "e908f163d295817b",
+    llm_agent.PROMPT_CACHE_KEY: "8bb11e3454e8d6a6",
+}
+
+
+def _verifier(i: int) -> dict:
+    return llm_verifier.build_verifier_payload(
+        model="m", question=f"clue {i}", correct_answer=f"answer {i}", user_answer=f"guess {i}"
+    )
+
+
+def _agent(i: int) -> dict:
+    return llm_agent.build_agent_payload(
+        model="m", question=f"clue {i}", category=f"CAT {i}", round_name="Jeopardy!", value=f"${i}", temperature=0.2
+    )
+
+
+def _prefix(payload: dict) -> str:
+    stable = {**payload, "input": payload["input"][:-1]}
+    return json.dumps(stable, sort_keys=True, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("build", [_verifier, _agent], ids=["verifier", "agent"])
+def test_variable_content_only_in_last_message(build):
+    a, b = build(1), build(2)
+    assert _prefix(a) == _prefix(b)
+    for value in ("clue 1", "answer 1", "guess 1", "CAT 1"):
+        assert value not in _prefix(a)
+    assert "clue 1" in a["input"][-1]["content"]
+
+
+@pytest.mark.parametrize("build", [_verifier, _agent], ids=["verifier", "agent"])
+def test_prefix_matches_its_cache_key(build):
+    payload = build(1)
+    digest = hashlib.sha256(_prefix(payload).encode()).hexdigest()[:16]
+    assert PREFIX_DIGESTS[payload["prompt_cache_key"]] == digest, (
+        "Prompt prefix changed: bump PROMPT_CACHE_KEY and update PREFIX_DIGESTS"
+    )
+
+
+def test_usage_parsing_and_cost():
+    usage = TokenUsage.from_response(
+        {"usage": {"input_tokens": 1200, "input_tokens_details": {"cached_tokens": 1024}, "output_tokens": 20}}
+    )
+    assert usage == TokenUsage(input_tokens=1200, cached_input_tokens=1024, output_tokens=20)
+    assert TokenUsage.from_response({}) is None
+
+    ledger = UsageLedger({"gpt-4o-mini": (0.15, 0.075, 0.60)})
+    ledger.record(model="gpt-4o-mini-2024-07-18", usage=usage, route="verify")
+    (row,) = ledger.snapshot()["by_route_model"]
+    assert row["cache_hit_ratio"] == round(1024 / 1200, 4)
+    assert row["cost_usd"] == round((176 * 0.15 + 1024 * 0.075 + 20 * 0.60) / 1e6, 6)
+
+
+def test_llm_usage_is_attributed_to_the_route(client, monkeypatch):
+    class FakeResponse:
+        status_code = 200
+        content = json.dumps(
+            {
+                "output": [
+                    {
+                        "type": "message",
+                        "content": [{"type": "output_text", "text": '{"is_correct": true, "explanation": "ok"}'}],
+                    }
+                ],
+                "usage": {"input_tokens": 300, "input_tokens_details": {"cached_tokens": 256}, "output_tokens": 12},
+            }
+        ).encode()
+
+        def raise_for_status(self) -> None:
+            pass
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setattr(requests.Session, "post", lambda self, *a, **kw: FakeResponse())
+    usage_ledger.reset()
+
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Galileo"})
+    assert resp.json()["is_correct"] is True
+
+    rows = client.get("/metrics/llm-usage").json()["by_route_model"]
+    assert rows == [
+        {
+            "route": "verify",
+            "model": "gpt-4o-mini",
+            "requests": 1,
+            "input_tokens": 300,
+            "cached_input_tokens": 256,
+            "output_tokens": 12,
+            "cache_hit_ratio": round(256 / 300, 4),
+            "cost_usd": round((44 * 0.15 + 256 * 0.075 + 12 * 0.60) / 1e6, 6),
+        }
+    ]
+    usage_ledger.reset()
@@ -0,0 +1,145 @@
+# tests/unit/services/test_verification_pipeline.py
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jeopardy_game.models.question import QuestionRecord
+from jeopardy_game.services.verification_pipeline import (
+    Stage,
+    StageAbstained,
+    StageVerdict,
+    VerificationPipeline,
+    exact_stage,
+    heuristic_stage,
+)
+
+QUESTION = QuestionRecord(
+    id=1,
+    category="HISTORY",
+    value=200,
+    question="'This astronomer proposed a heliocentric model'",
+    answer="Copernicus",
+    round="Jeopardy!",
+)
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def _stage(name, run, *, timeout_s=1.0, min_confidence=0.5, inline=False, speculative=False) -> Stage:
+    return Stage(name, run, timeout_s, min_confidence, inline=inline, speculative=speculative)
+
+
+def _pipeline(executor, *stages, deadline_s=5.0) -> VerificationPipeline:
+    return VerificationPipeline(stages, deadline_s=deadline_s, executor=executor)
+
+
+def test_cheapest_confident_stage_wins(executor):
+    def llm(question, answer, cancel):
+        raise AssertionError("LLM must not run once a cheaper stage decided")
+
+    pipeline = _pipeline(
+        executor,
+        _stage("exact", exact_stage, min_confidence=1.0, inline=True),
+        _stage("heuristic", heuristic_stage, min_confidence=0.9, inline=True),
+        _stage("llm", llm),
+    )
+    outcome = pipeline.verify(question=QUESTION, user_answer="Nicolaus Copernicus")
+    assert (outcome.out.is_correct, outcome.tier, outcome.path) == (True, "heuristic", "heuristic")
+    assert list(outcome.stage_ms) == ["exact", "heuristic"]
+
+
+def test_slow_stage_times_out_and_falls_back_to_heuristic(executor):
+    release = threading.Event()
+
+    def slow_llm(question, answer, cancel):
+        release.wait(5)
+        return StageVerdict(True, 0.95, "too late")
+
+    pipeline = _pipeline(
+        executor,
+        _stage("heuristic", heuristic_stage, min_confidence=0.9, inline=True),
+        _stage("llm", slow_llm, timeout_s=0.05),
+    )
+    try:
+        outcome = pipeline.verify(question=QUESTION, user_answer="Kepler")
+    finally:
+        release.set()
+    assert (outcome.out.is_correct, outcome.tier, outcome.path) == (False, "heuristic", "heuristic:llm_timeout")
+    assert outcome.stage_ms["llm"] >= 50
+
+
+def test_timed_out_stage_is_cancelled_before_it_starts():
+    release = threading.Event()
+    ran = []
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(release.wait, 5)  # occupy the only worker so the LLM call stays queued
+        pipeline = _pipeline(
+            pool,
+            _stage("heuristic", heuristic_stage, min_confidence=0.9, inline=True),
+            _stage("llm", lambda *_: ran.append("llm"), timeout_s=0.05),
+        )
+        outcome = pipeline.verify(question=QUESTION, user_answer="Kepler")
+        release.set()
+    assert outcome.path == "heuristic:llm_timeout"
+    assert ran == []
+
+
+def test_global_deadline_caps_later_stages(executor):
+    def slow(question, answer, cancel):
+        time.sleep(0.05)
+        raise StageAbstained("no_idea")
+
+    pipeline = _pipeline(
+        executor,
+        _stage("slow", slow, inline=True),
+        _stage("never", lambda *_: StageVerdict(True, 1.0, "unreachable")),
+        deadline_s=0.01,
+    )
+    outcome = pipeline.verify(question=QUESTION, user_answer="Kepler")
+    assert (outcome.out.is_correct, outcome.tier, outcome.path) == (False, "none", "none:deadline")
+    assert "never" not in outcome.stage_ms
+
+
+def test_speculative_stage_is_cancelled_when_cheaper_stage_decides(executor):
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def llm(question, answer, cancel):
+        started.set()
+        cancel.wait(5)
+        if cancel.is_set():
+            cancelled.set()
+        raise StageAbstained("cancelled")
+
+    def exact_after_llm_started(question, answer, cancel):
+        assert started.wait(5)  # the LLM call is already in flight
+        return exact_stage(question, answer, cancel)
+
+    pipeline = _pipeline(
+        executor,
+        _stage("exact", exact_after_llm_started, min_confidence=1.0, inline=True),
+        _stage("llm", llm, speculative=True),
+    )
+    outcome = pipeline.verify(question=QUESTION, user_answer="Copernicus")
+    assert outcome.tier == "exact"
+    assert cancelled.wait(5)
+
+
+def test_verify_endpoint_reports_tier_and_server_timing(client, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    resp = client.post("/verify-answer/", json={"question_id": 1, "user_answer": "Kepler"})
+    assert resp.status_code == 200
+    assert resp.headers["x-verify-tier"] == "heuristic"
+    timing = resp.headers["server-timing"]
+    assert timing.startswith("verify-exact;dur=")
+    assert "verify-heuristic;dur=" in timing and "verify-llm;dur=" in timing
+    assert 'desc="heuristic:llm_unconfigured"' in timing